@@ -1,3 +1,9 @@
 """Import top-level API"""
 from spyrograph.hypotrochoid import *
 from spyrograph.epitrochoid import *
+from spyrograph.core._batch import ShapeBatch
+from spyrograph.core._cache import (
+    enable_path_cache, disable_path_cache, clear_path_cache, path_cache_info
+)
+from spyrograph.core._plot import plot_many, animate_many
+from spyrograph.core._archive import load
@@ -0,0 +1,201 @@
+"""Compact .npz archives of shapes and ShapeBatches. An archive stores the
+input parameters, thetas and optionally the calculated paths alongside the
+module:qualname of the class that loads them. Paths aren't read until they're
+first used, uncompressed members are then memory-mapped straight out of the
+zip file so only the rows that are used get read from disk and compressed
+members are decompressed whole. The archive is only open while a member is
+read so opening a large archive is instant and doesn't hold the file open
+"""
+
+from typing import Dict, Iterator, List, Tuple, Union
+import collections.abc
+import importlib
+import struct
+import zipfile
+
+import numpy as np
+
+_CLASS_KEY = "class"
+
+# Top level package that archived classes have to be imported from
+_PACKAGE = "spyrograph"
+
+# Size of the fixed part of a zip local file header
+_LOCAL_HEADER_SIZE = 30
+
+_ARRAY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0
+}
+
+def load(fpath: str, mmap: bool = True) -> Union["_Trochoid", "ShapeBatch"]:
+    """
+    Return the shape or ShapeBatch saved to an archive with save_npz.
+
+    The class of the saved object is resolved from the module and qualified
+    name stored in the archive. Saved paths aren't read until they're first
+    used, uncompressed paths are then memory-mapped so only the parts that
+    are used are read from disk and compressed paths are decompressed whole.
+
+    Parameters
+    ----------
+    fpath : str
+        Path of the .npz archive to load
+    mmap : bool, optional
+        Memory-map uncompressed arrays instead of reading them into memory,
+        default is True
+
+    Returns
+    -------
+    Union[_Trochoid, ShapeBatch]
+        The shape or batch of shapes saved to the archive
+
+    Raises
+    ------
+    ValueError
+        If the archive wasn't saved by save_npz of a shape or ShapeBatch or
+        names a class outside of spyrograph
+
+    Examples
+    --------
+    >>> from spyrograph import Hypotrochoid, load
+    >>> import numpy as np
+    >>> thetas = np.arange(0, 2*np.pi, .01)
+    >>> shapes = Hypotrochoid.create_range(300, 200, range(1, 50000), thetas=thetas)
+    >>> shapes.save_npz("shapes.npz")
+    >>> loaded_shapes = load("shapes.npz")
+    """
+    # pylint: disable=line-too-long,protected-access,import-outside-toplevel,cyclic-import
+    # Both modules import this one so they're imported when an archive is loaded
+    from spyrograph.core._batch import ShapeBatch
+    from spyrograph.core._trochoid import _Trochoid
+
+    members = _ArchiveMembers(fpath, mmap)
+    if _CLASS_KEY not in members:
+        raise ValueError(f"{fpath} is not an archive saved by save_npz, please pass an archive saved from a shape or ShapeBatch.")
+    archive_class = _get_class(str(members[_CLASS_KEY]), (_Trochoid, ShapeBatch))
+    return archive_class._from_archive(members)
+
+def _save_archive(
+        fpath: str, archive_class: type, arrays: Dict[str, "np.ndarray"],
+        compressed: bool = False
+    ) -> None:
+    """Save the arrays with the class that loads them, skipping arrays that
+    are None"""
+    members = {
+        name: np.asarray(array) for name, array in arrays.items()
+        if array is not None
+    }
+    members[_CLASS_KEY] = np.array(_get_class_path(archive_class))
+    if compressed:
+        np.savez_compressed(fpath, **members)
+    else:
+        np.savez(fpath, **members)
+
+def _get_class_path(cls: type) -> str:
+    """Return the module:qualname path of the class"""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+def _get_class(class_path: str, base_classes: Tuple[type, ...]) -> type:
+    """Return the class from its module:qualname path. Only modules inside
+    spyrograph are imported and the class has to subclass one of the base
+    classes so an archive can't run arbitrary code on load"""
+    module_name, _, qualname = class_path.partition(":")
+    if module_name.split(".")[0] != _PACKAGE:
+        raise ValueError((
+            f"The archive's class {class_path!r} is outside of {_PACKAGE}, "
+            "please only load archives saved from a shape or ShapeBatch."
+        ))
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name, None)
+    if not isinstance(obj, type) or not issubclass(obj, base_classes):
+        raise ValueError((
+            f"The archive's class {class_path!r} can't be loaded from an "
+            "archive, please only load archives saved from a shape or ShapeBatch."
+        ))
+    return obj
+
+class _ArchiveMembers(collections.abc.Mapping):
+    def __init__(self, fpath: str, mmap: bool = True) -> None:
+        """Read-only mapping of the arrays in an .npz archive. Arrays are
+        read on first access and cached, memory-mapped from their offset in
+        the zip file when they're stored uncompressed. The archive is opened
+        for each read and closed straight after so no file is left open
+
+        Parameters
+        ----------
+        fpath : str
+            Path of the .npz archive
+        mmap : bool = True
+            Memory-map uncompressed arrays instead of reading them
+        """
+        self.fpath = fpath
+        self.files, offsets = _get_member_index(fpath)
+        self.offsets = offsets if mmap else {}
+        self._arrays = {}
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        """Return the array, memory-mapped when possible"""
+        if name not in self._arrays:
+            if name not in self.files:
+                raise KeyError(name)
+            array = None
+            if name in self.offsets:
+                array = _memmap_member(self.fpath, self.offsets[name])
+            if array is None:
+                with np.load(self.fpath) as npz:
+                    array = npz[name]
+            self._arrays[name] = array
+        return self._arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the archive has the array without reading it"""
+        return name in self.files
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the arrays"""
+        return iter(self.files)
+
+    def __len__(self) -> int:
+        """Return the number of arrays"""
+        return len(self.files)
+
+def _get_member_index(fpath: str) -> Tuple[List[str], Dict[str, int]]:
+    """Return the name of every .npy member and the offset of every
+    uncompressed one from the start of the zip file, read from each member's
+    local header since its extra field can differ from the one in the
+    central directory"""
+    files = []
+    offsets = {}
+    with zipfile.ZipFile(fpath) as archive, open(fpath, "rb") as archive_file:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            files.append(info.filename[:-4])
+            if info.compress_type != zipfile.ZIP_STORED:
+                continue
+            archive_file.seek(info.header_offset)
+            local_header = archive_file.read(_LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+            offsets[info.filename[:-4]] = (
+                info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+            )
+    return files, offsets
+
+def _memmap_member(fpath: str, offset: int) -> Union["np.memmap", None]:
+    """Return a read-only memory map of the .npy member starting at the
+    offset or None when the array can't be memory-mapped"""
+    with open(fpath, "rb") as archive_file:
+        archive_file.seek(offset)
+        version = np.lib.format.read_magic(archive_file)
+        if version not in _ARRAY_HEADER_READERS:
+            return None
+        shape, fortran_order, dtype = _ARRAY_HEADER_READERS[version](archive_file)
+        data_offset = archive_file.tell()
+    if dtype.hasobject or len(shape) == 0 or 0 in shape:
+        return None
+    return np.memmap(
+        fpath, dtype=dtype, mode="r", offset=data_offset, shape=shape,
+        order="F" if fortran_order else "C"
+    )
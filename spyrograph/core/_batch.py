@@ -0,0 +1,634 @@
+"""Struct-of-arrays container for a collection of shapes that share the same
+set of thetas i.e. the output of create_range. Every path in the collection
+is calculated at once by broadcasting the parametric equations over 2-D
+(n_shapes, n_thetas) arrays
+"""
+
+from numbers import Number
+from typing import List, Tuple, Union
+import collections.abc
+import concurrent.futures
+import os
+import pathlib
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from spyrograph.core._svg import _write_svg, _get_polyline_chunks
+from spyrograph.core._raster import (
+    _BASE_DPI, _get_frame, _render_coverage, _get_levels, _get_palette, _write_png
+)
+from spyrograph.core._plot import plot_many, animate_many
+from spyrograph.core._archive import _save_archive, _get_class, _get_class_path
+from spyrograph.core._cache import _PATH_CACHE, _get_path_key, _get_thetas_fingerprint
+
+# Sweeps with fewer points than this are calculated serially because starting
+# a process pool and pickling the results back costs more than it saves
+_PARALLEL_MIN_POINTS = 2**21
+
+# Number of blocks submitted per worker so uneven workers stay busy
+_BLOCKS_PER_WORKER = 4
+
+class ShapeBatch(collections.abc.Sequence):
+    """Sequence of shapes of the same class that share one set of thetas,
+    returned by create_range and create_grid. Every path is calculated at
+    once and stored in 2-D (n_shapes, n_thetas) x and y arrays.
+
+    Indexing the batch returns a shape whose path is a view into those
+    arrays, slicing it returns a smaller batch. The batch draws, plots,
+    animates and exports all of its shapes without instantiating them one by
+    one."""
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+            self, shape_class: type, R: List[Number], r: List[Number],
+            d: List[Number], thetas: "np.ndarray",
+            origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0),
+            orientation: Union[Number, List[Number]] = 0,
+            dtype: "np.dtype" = None, workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> None:
+        """Collection of shapes of the same class whose paths are calculated
+        together as 2-D (n_shapes, n_thetas) arrays. Indexing the batch
+        returns a shape whose x and y values are views into those arrays so
+        it behaves like a shape that was instantiated on its own
+
+        Parameters
+        ----------
+        shape_class : type
+            Class of the shapes in the batch i.e. Hypotrochoid
+        R : List[Number]
+            Radius of the fixed circle for each shape
+        r : List[Number]
+            Radius of the rolling circle for each shape
+        d : List[Number]
+            Distance of the trace point from the rolling circle for each shape
+        thetas : np.ndarray
+            Validated array of theta values shared by every shape
+        origin : Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0)
+            Custom origin to center the shapes at, either one origin for every
+            shape or one origin per shape. Default is (0,0)
+        orientation : Union[Number, List[Number]] = 0
+            Angle of rotation, either one angle for every shape or one angle
+            per shape
+        dtype : np.dtype = None
+            Floating point type used to calculate and store the paths i.e.
+            np.float32 to halve memory. Default calculates in float64
+        workers : int = None
+            Number of processes to calculate the paths in, -1 uses every CPU.
+            Default calculates serially
+        executor : concurrent.futures.Executor = None
+            Existing executor to calculate the paths in instead of starting a
+            process pool, it's left running for the caller to shut down
+        """
+        self.shape_class = shape_class
+        self.R = np.asarray(R)
+        self.r = np.asarray(r)
+        self.d = np.asarray(d)
+        self.thetas = thetas
+        self.dtype = dtype
+        n_shapes = len(self.R)
+        self.origin = np.broadcast_to(np.asarray(origin), (n_shapes, 2))
+        self.orientation = np.broadcast_to(np.asarray(orientation), (n_shapes,))
+
+        self._validate_inputs()
+        self._archive = None
+        self._calculate_paths(workers, executor)
+        self._shapes = [None]*n_shapes
+        self._df = None
+
+    def _validate_inputs(self) -> None:
+        """Validate input parameters"""
+        if (self.R <= 0).any() or (self.r <= 0).any() or (self.d <= 0).any():
+            raise ValueError((
+                "Negative and/or zero input parameters were passed. "
+                "Please only pass positive values"
+            ))
+
+    def _calculate_paths(
+            self, workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> None:
+        """Calculate every parametrized path in a single broadcast pass or in
+        blocks of shapes spread over a pool of workers. The untransformed
+        paths are kept so shapes indexed from the batch can reuse them in
+        transforms. When the path cache is enabled cached paths are reused and
+        only the missing paths are calculated and added to the cache"""
+        _validate_workers(workers)
+        path_dtype = np.float64 if self.dtype is None else self.dtype
+        if _PATH_CACHE.enabled:
+            self._base_x, self._base_y = self._get_cached_base_paths(
+                path_dtype, workers, executor
+            )
+        else:
+            self._base_x, self._base_y = self._calculate_base_paths(
+                slice(None), path_dtype, workers, executor
+            )
+        x, y = self._base_x, self._base_y
+        if self.orientation.any():
+            cos_angle = np.cos(self.orientation).astype(path_dtype)[:, np.newaxis]
+            sin_angle = np.sin(self.orientation).astype(path_dtype)[:, np.newaxis]
+            x, y = cos_angle*x - sin_angle*y, sin_angle*x + cos_angle*y
+        if self.origin.any():
+            x = x + self.origin[:, 0:1].astype(path_dtype)
+            y = y + self.origin[:, 1:2].astype(path_dtype)
+        self.x = x
+        self.y = y
+
+    def _calculate_base_paths(
+            self, rows: Union["np.ndarray", slice], path_dtype: "np.dtype",
+            workers: int = None, executor: "concurrent.futures.Executor" = None
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the untransformed paths of the shapes in the given rows,
+        calculated in a single broadcast pass or in parallel when workers or
+        an executor are passed and there are enough points"""
+        R, r, d = self.R[rows], self.r[rows], self.d[rows]
+        n_points = len(R)*len(self.thetas)
+        parallel = workers not in (None, 1) or executor is not None
+        if parallel and len(R) > 1 and n_points >= _PARALLEL_MIN_POINTS:
+            return self._calculate_base_paths_parallel(
+                R, r, d, path_dtype, workers, executor
+            )
+        return _calculate_base_paths(self.shape_class, R, r, d, self.thetas, path_dtype)
+
+    def _calculate_base_paths_parallel(
+            self, R: "np.ndarray", r: "np.ndarray", d: "np.ndarray",
+            path_dtype: "np.dtype", workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the untransformed paths calculated in contiguous blocks of
+        shapes by the executor. Workers only receive the block's parameters
+        and send back arrays which are copied into preallocated arrays in the
+        original order"""
+        # pylint: disable=too-many-arguments,invalid-name,too-many-locals
+        n_workers = _get_n_workers(workers)
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as pool:
+                return self._calculate_base_paths_parallel(R, r, d, path_dtype, workers, pool)
+        n_blocks = min(len(R), n_workers*_BLOCKS_PER_WORKER)
+        blocks = np.array_split(np.arange(len(R)), n_blocks)
+        futures = [
+            executor.submit(
+                _calculate_base_paths, self.shape_class, R[block], r[block],
+                d[block], self.thetas, path_dtype
+            )
+            for block in blocks
+        ]
+        base_x = np.empty((len(R), len(self.thetas)), dtype=path_dtype)
+        base_y = np.empty((len(R), len(self.thetas)), dtype=path_dtype)
+        for block, future in zip(blocks, futures):
+            base_x[block], base_y[block] = future.result()
+        return base_x, base_y
+
+    def _get_cached_base_paths(
+            self, path_dtype: "np.dtype", workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the untransformed paths of every shape, copying the cached
+        paths into the batch's arrays and only calculating the paths that
+        missed. The cache stores read-only copies of the calculated paths so
+        the batch's own arrays stay writable"""
+        thetas_fingerprint = _get_thetas_fingerprint(self.thetas)
+        keys = [
+            _get_path_key(self.shape_class, R, r, d, thetas_fingerprint, path_dtype)
+            for R, r, d in zip(self.R.tolist(), self.r.tolist(), self.d.tolist())
+        ]
+        paths = [_PATH_CACHE.get(key) for key in keys]
+        missing = [index for index, path in enumerate(paths) if path is None]
+        if len(missing) == len(self):
+            base_x, base_y = self._calculate_base_paths(
+                slice(None), path_dtype, workers, executor
+            )
+        else:
+            base_x = np.empty((len(self), len(self.thetas)), dtype=path_dtype)
+            base_y = np.empty((len(self), len(self.thetas)), dtype=path_dtype)
+            for index, path in enumerate(paths):
+                if path is not None:
+                    base_x[index], base_y[index] = path
+            if missing:
+                base_x[missing], base_y[missing] = self._calculate_base_paths(
+                    np.array(missing), path_dtype, workers, executor
+                )
+        for index in missing:
+            _PATH_CACHE.put(keys[index], (base_x[index], base_y[index]))
+        return base_x, base_y
+
+    def bounds(self, full_curve: bool = False) -> Tuple[Number, Number, Number, Number]:
+        """Return the bounding box of every shape in the batch combined as
+        (min_x, max_x, min_y, max_y). With full_curve the bounds are the
+        conservative analytic bounds of each full curve, calculated for the
+        whole batch at once from the input parameters"""
+        # pylint: disable=protected-access
+        if not full_curve:
+            return self.x.min(), self.x.max(), self.y.min(), self.y.max()
+        radius = np.abs(self.shape_class._circle_offset(self)) + self.d
+        return (
+            float((self.origin[:, 0] - radius).min()),
+            float((self.origin[:, 0] + radius).max()),
+            float((self.origin[:, 1] - radius).min()),
+            float((self.origin[:, 1] + radius).max())
+        )
+
+    def to_arrays(self) -> dict:
+        """Return the long-format columns shape_id, R, r, d, x, y and theta
+        with one row per point of every shape. Each column is allocated once
+        at its final size, x and y are flattened views of the batch's paths
+        when they're contiguous"""
+        n_shapes, n_thetas = len(self), len(self.thetas)
+        shape_ids = np.repeat(np.arange(n_shapes, dtype=np.int32), n_thetas)
+        return {
+            "shape_id": shape_ids,
+            "R": self.R[shape_ids],
+            "r": self.r[shape_ids],
+            "d": self.d[shape_ids],
+            "x": self.x.ravel(),
+            "y": self.y.ravel(),
+            "theta": np.tile(self.thetas, n_shapes)
+        }
+
+    @property
+    def df(self) -> "pd.DataFrame":
+        """Return a long-format pandas DataFrame with columns shape_id, R, r,
+        d, x, y and theta for every point of every shape in the batch. The
+        shape_id column is categorical and the DataFrame is created on first
+        access and cached for subsequent accesses"""
+        # pylint: disable=line-too-long
+        if pd is None:
+            raise ImportError("pandas is required but is not installed on your machine, please install and try again")
+        if self._df is None:
+            columns = self.to_arrays()
+            columns["shape_id"] = pd.Categorical.from_codes(
+                columns["shape_id"], categories=range(len(self))
+            )
+            self._df = pd.DataFrame(columns, copy=False)
+        return self._df
+
+    def to_arrow(self) -> "pa.Table":
+        """Return the long-format columns of to_arrays as a pyarrow Table with
+        shape_id dictionary encoded"""
+        # pylint: disable=line-too-long
+        if pa is None:
+            raise ImportError("pyarrow is required but is not installed on your machine, please install and try again")
+        columns = self.to_arrays()
+        columns["shape_id"] = pa.DictionaryArray.from_arrays(
+            columns["shape_id"], pa.array(np.arange(len(self), dtype=np.int32))
+        )
+        return pa.table(columns)
+
+    def to_parquet(self, fpath: str, **kwargs) -> None:
+        """Write the long-format table of every shape in the batch to a
+        Parquet file, keyword arguments are passed to
+        pyarrow.parquet.write_table"""
+        # pylint: disable=line-too-long
+        if pq is None:
+            raise ImportError("pyarrow is required but is not installed on your machine, please install and try again")
+        pq.write_table(self.to_arrow(), fpath, **kwargs)
+
+    def save_npz(
+            self, fpath: str, include_path: bool = True, compressed: bool = False
+        ) -> None:
+        """Save the batch's parameters, thetas and optionally its calculated
+        paths to an .npz archive that spyrograph.load opens. Uncompressed
+        paths are memory-mapped on load so only the shapes that are used are
+        read from disk, compressed archives are smaller but a path array is
+        read whole the first time it's accessed"""
+        # pylint: disable=duplicate-code
+        dtype = "" if self.dtype is None else np.dtype(self.dtype).str
+        _save_archive(fpath, self.__class__, {
+            "shape_class": _get_class_path(self.shape_class),
+            "R": self.R,
+            "r": self.r,
+            "d": self.d,
+            "thetas": self.thetas,
+            "origin": self.origin,
+            "orientation": self.orientation,
+            "dtype": dtype,
+            "x": self.x if include_path else None,
+            "y": self.y if include_path else None
+        }, compressed=compressed)
+
+    @classmethod
+    def _from_archive(cls, members: "collections.abc.Mapping") -> "ShapeBatch":
+        """Return a batch from the arrays of an archive saved by save_npz. The
+        saved paths aren't read until x or y is first accessed and are then
+        viewed instead of calculated again"""
+        # pylint: disable=protected-access,import-outside-toplevel,cyclic-import,attribute-defined-outside-init
+        # _trochoid imports this module so it's imported when a batch is loaded
+        from spyrograph.core._trochoid import _Trochoid
+
+        batch = cls.__new__(cls)
+        batch.shape_class = _get_class(str(members["shape_class"]), (_Trochoid,))
+        batch.R = members["R"]
+        batch.r = members["r"]
+        batch.d = members["d"]
+        batch.thetas = members["thetas"]
+        dtype = str(members["dtype"])
+        batch.dtype = np.dtype(dtype) if dtype else None
+        batch.origin = members["origin"]
+        batch.orientation = members["orientation"]
+        batch._shapes = [None]*len(batch)
+        batch._df = None
+        batch._archive = members if "x" in members else None
+        if batch._archive is None:
+            batch._calculate_paths()
+        else:
+            batch._base_x = None
+            batch._base_y = None
+        return batch
+
+    def plot(
+            self, ax: "matplotlib.axes._axes.Axes" = None, show: bool = False,
+            **kwargs
+        ) -> Tuple["matplotlib.figure.Figure", "matplotlib.axes._axes.Axes"]:
+        """Plot every shape in the batch as one LineCollection and return the
+        Figure and Axes, see plot_many"""
+        return plot_many(self, ax=ax, show=show, **kwargs)
+
+    def plot_animation(
+            self, ax: "matplotlib.axes._axes.Axes" = None, frame_pause: Number = 0.1,
+            repeat: bool = False, show: bool = False, **kwargs
+        ) -> "matplotlib.animation.FuncAnimation":
+        """Return a blitted matplotlib animation drawing one shape of the
+        batch per frame, see animate_many"""
+        # pylint: disable=too-many-arguments
+        return animate_many(
+            self, ax=ax, frame_pause=frame_pause, repeat=repeat, show=show,
+            **kwargs
+        )
+
+    def save_svg(
+            self, fpath: str, precision: int = 2, simplify: Number = None,
+            color: str = "black", width: Number = 1, screen_color: str = None,
+            padding: Number = 100
+        ) -> None:
+        """Save every shape in the batch as one path each of a single SVG
+        file, streamed to the file in chunks as relative path commands between
+        points rounded to precision decimals. With simplify each path is
+        simplified with that tolerance before it's written, see
+        _Trochoid.save_svg"""
+        # pylint: disable=too-many-arguments
+        if simplify is None:
+            polylines = (
+                _get_polyline_chunks(self.x[index], self.y[index])
+                for index in range(len(self))
+            )
+        else:
+            polylines = (
+                _get_polyline_chunks(shape.x, shape.y)
+                for shape in (self[index].simplify(simplify) for index in range(len(self)))
+            )
+        _write_svg(
+            fpath, polylines, self.bounds(), precision=precision, color=color,
+            width=width, background=screen_color, padding=padding
+        )
+
+    def save_gif(
+            self, fpath: str, frame_pause: Number = 0.1, repeat: bool = False,
+            reverse: bool = False, boomerang: bool = False,
+            screen_size: Tuple[Number, Number] = None, screen_color: str = "white",
+            color: str = "black", width: Number = 1, padding: Number = 100,
+            dpi: Number = 72, workers: int = None
+        ) -> None:
+        """
+        Save the animation of the shapes drawn one after the other as an
+        animated GIF without a turtle screen or display.
+
+        Frames are rasterized headlessly in parallel threads and encoded with
+        one palette shared by every frame. The GIF encoder only stores the
+        region of each frame that changed from the previous one.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path where the GIF file will be saved.
+        frame_pause : Number, optional
+            Time in seconds each shape is shown for, default is 0.1.
+        repeat : bool, optional
+            If True, the GIF loops forever otherwise it plays once, default is
+            False.
+        reverse : bool, optional
+            If True, run the animation from the end to the beginning, default
+            is False.
+        boomerang : bool, optional
+            If True, repeat the animation at the end in reverse, default is
+            False.
+        screen_size : Tuple[Number, Number], optional
+            Width and height of the frames centered on (0, 0), default fits
+            every shape with extra padding.
+        screen_color : str, optional
+            The background color, default is "white".
+        color : str, optional
+            The color of the shapes, default is "black".
+        width : Number, optional
+            The width of the shape lines, default is 1.
+        padding : Number, optional
+            The padding around the shapes, default is 100.
+        dpi : Number, optional
+            Resolution of the frames where one unit of the shapes is one pixel
+            at the default of 72.
+        workers : int, optional
+            Number of threads rendering frames, default uses every CPU.
+
+        Raises
+        ------
+        ImportError
+            If PIL is not installed on the user's machine.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> import numpy as np
+        >>> shapes = Hypotrochoid.create_range(
+        ...     R=300, r=np.arange(100, 200), d=100, theta_start=0,
+        ...     theta_stop="closed", theta_step=.01
+        ... )
+        >>> shapes.save_gif("sweep.gif", frame_pause=.05, repeat=True, boomerang=True)
+        """
+        # pylint: disable=too-many-arguments,line-too-long,too-many-locals
+        if Image is None:
+            raise ImportError((
+                "PIL is required but is not installed on your machine, "
+                "please install and try again"
+            ))
+        levels, order = self._render_frames(
+            screen_size, width, padding, dpi, reverse, boomerang, workers
+        )
+        palette = _get_palette(color, screen_color).ravel().tolist()
+        frames = []
+        for frame_levels in levels:
+            frame = Image.fromarray(frame_levels)
+            frame.putpalette(palette)
+            frames.append(frame)
+        frames = [frames[index] for index in order]
+        options = {"loop": 0} if repeat else {}
+        frames[0].save(
+            fpath, format="GIF", save_all=True, append_images=frames[1:],
+            duration=int(round(1000*frame_pause)), disposal=1, optimize=False,
+            **options
+        )
+
+    def save_frames(
+            self, dirpath: str, prefix: str = "frame", reverse: bool = False,
+            boomerang: bool = False, screen_size: Tuple[Number, Number] = None,
+            screen_color: str = "white", color: str = "black", width: Number = 1,
+            padding: Number = 100, dpi: Number = 72, workers: int = None
+        ) -> List[pathlib.Path]:
+        """Save the animation of the shapes drawn one after the other as a
+        numbered sequence of PNG files in the directory without a turtle
+        screen, display or PIL. Frames are rasterized in parallel threads and
+        frames repeated by boomerang are only rendered once, see save_gif for
+        the parameters. Return the paths of the saved frames in order"""
+        # pylint: disable=too-many-arguments,too-many-locals
+        levels, order = self._render_frames(
+            screen_size, width, padding, dpi, reverse, boomerang, workers
+        )
+        palette = _get_palette(color, screen_color)
+        dirpath = pathlib.Path(dirpath)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        n_digits = len(str(len(order) - 1))
+        fpaths = []
+        for frame, index in enumerate(order):
+            fpath = dirpath / f"{prefix}{frame:0{n_digits}d}.png"
+            _write_png(fpath, palette[levels[index]], dpi)
+            fpaths.append(fpath)
+        return fpaths
+
+    def _render_frames(
+            self, screen_size: Tuple[Number, Number], width: Number,
+            padding: Number, dpi: Number, reverse: bool, boomerang: bool,
+            workers: int = None
+        ) -> Tuple[List["np.ndarray"], List[int]]:
+        """Return the palette levels of every shape's frame rendered in a
+        thread pool, NumPy releases the GIL for the heavy lifting so threads
+        render concurrently without copying paths to other processes, and the
+        order the frames are shown in"""
+        # pylint: disable=too-many-arguments
+        if len(self) == 0:
+            raise ValueError("There are no shapes in the batch to animate.")
+        order = list(range(len(self)))
+        if reverse:
+            order = order[::-1]
+        if boomerang:
+            order = order + order[::-1]
+        scale = dpi/_BASE_DPI
+        size, center = _get_frame(self.bounds(), screen_size, padding, scale)
+
+        def render(index: int) -> "np.ndarray":
+            """Return the palette levels of one shape's frame"""
+            polyline = _get_polyline_chunks(self.x[index], self.y[index])
+            return _get_levels(_render_coverage([polyline], size, center, scale, width))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            levels = list(executor.map(render, range(len(self))))
+        return levels, order
+
+    def _create_shape(self, index: int) -> "_Trochoid":
+        """Return a shape whose path is a view into the batch's arrays"""
+        # pylint: disable=protected-access,line-too-long
+        return self.shape_class._from_path(
+            R=self.R[index].item(),
+            r=self.r[index].item(),
+            d=self.d[index].item(),
+            thetas=self.thetas,
+            origin=tuple(self.origin[index].tolist()),
+            orientation=self.orientation[index].item(),
+            x=self.x[index],
+            y=self.y[index],
+            dtype=self.dtype,
+            base_path=None if self._base_x is None else (self._base_x[index], self._base_y[index])
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["_Trochoid", "ShapeBatch"]:
+        """Return the shape at the given index or a new batch for a slice"""
+        # pylint: disable=protected-access,attribute-defined-outside-init
+        if isinstance(index, slice):
+            batch = self.__class__.__new__(self.__class__)
+            batch.shape_class = self.shape_class
+            batch.R = self.R[index]
+            batch.r = self.r[index]
+            batch.d = self.d[index]
+            batch.thetas = self.thetas
+            batch.dtype = self.dtype
+            batch.origin = self.origin[index]
+            batch.orientation = self.orientation[index]
+            batch.x = self.x[index]
+            batch.y = self.y[index]
+            batch._archive = None
+            batch._base_x = None if self._base_x is None else self._base_x[index]
+            batch._base_y = None if self._base_y is None else self._base_y[index]
+            batch._shapes = self._shapes[index]
+            batch._df = None
+            return batch
+        index = range(len(self))[index]
+        if self._shapes[index] is None:
+            self._shapes[index] = self._create_shape(index)
+        return self._shapes[index]
+
+    def __getattr__(self, name: str):
+        """Read the paths from the batch's archive on first access of x or y
+        when the batch was loaded from an archive with saved paths"""
+        # pylint: disable=attribute-defined-outside-init
+        if name in ("x", "y") and self.__dict__.get("_archive") is not None:
+            self.x = self._archive["x"]
+            self.y = self._archive["y"]
+            self._archive = None
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of shapes in the batch"""
+        return len(self.R)
+
+    def __repr__(self) -> str:
+        """Return formatted string with useful information about the current object"""
+        # pylint: disable=line-too-long
+        return f"{self.__class__.__name__}({self.shape_class.__name__}, n_shapes={len(self)}, n_thetas={len(self.thetas)})"
+
+def _validate_workers(workers: int) -> None:
+    """Validate the number of workers is None, -1 or a positive integer"""
+    valid_count = isinstance(workers, (int, np.integer)) and not isinstance(workers, bool)
+    if workers is not None and not (valid_count and (workers == -1 or workers >= 1)):
+        raise ValueError((
+            f"Invalid number of workers {workers!r} was passed in as argument. "
+            "Please pass None to calculate serially, -1 to use every CPU or a "
+            "positive integer."
+        ))
+
+def _get_n_workers(workers: int) -> int:
+    """Return the number of workers to split the paths between, every CPU
+    when workers is None or -1"""
+    if workers in (None, -1):
+        return os.cpu_count() or 1
+    return workers
+
+def _calculate_base_paths(
+        shape_class: type, R: "np.ndarray", r: "np.ndarray", d: "np.ndarray",
+        thetas: "np.ndarray", path_dtype: "np.dtype"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the untransformed (n_shapes, n_thetas) paths of the given
+    parameters, defined at module level so process pool workers can run it"""
+    # pylint: disable=protected-access,too-many-arguments,invalid-name
+    base_x, base_y = shape_class._calculate_xy(
+        R[:, np.newaxis].astype(path_dtype),
+        r[:, np.newaxis].astype(path_dtype),
+        d[:, np.newaxis].astype(path_dtype),
+        thetas[np.newaxis, :]
+    )
+    return base_x.astype(path_dtype, copy=False), base_y.astype(path_dtype, copy=False)
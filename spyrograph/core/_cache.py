@@ -0,0 +1,151 @@
+"""Opt-in in-process LRU cache of calculated untransformed paths that is
+shared across shape constructors, create_range and transforms. Paths are
+keyed by the shape's class, its input parameters and a fingerprint of its
+thetas and are stored as read-only arrays owned by the cache so shapes
+sharing a cached path can't corrupt each other. The cache is bounded by the
+total number of bytes of the stored paths
+"""
+
+from numbers import Number
+from typing import Hashable, Tuple
+import collections
+import hashlib
+
+import numpy as np
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "max_bytes", "currsize", "nbytes"]
+)
+
+# Default largest total size of the cached paths
+_DEFAULT_MAX_BYTES = 256*2**20
+
+class _PathCache:
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        """Least recently used cache of untransformed (x, y) paths
+
+        Parameters
+        ----------
+        max_bytes : int = 256 MiB
+            Largest total size of the stored paths before the least recently
+            used paths are evicted
+        """
+        self.enabled = False
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._paths = collections.OrderedDict()
+
+    def get(self, key: Hashable) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the cached path for the given key or None on a miss"""
+        path = self._paths.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._paths.move_to_end(key)
+        return path
+
+    def put(
+            self, key: Hashable, path: Tuple["np.ndarray", "np.ndarray"],
+            copy: bool = True
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Store the path as read-only arrays, evict the least recently used
+        paths beyond max_bytes and return the stored path. The arrays are
+        copied so the caller's arrays stay writable unless copy is False,
+        which is only safe for freshly calculated arrays nothing else holds.
+        Paths larger than max_bytes are returned without being stored"""
+        if copy:
+            path = tuple(np.array(arr) for arr in path)
+        path_bytes = sum(arr.nbytes for arr in path)
+        if path_bytes > self.max_bytes:
+            return path
+        for arr in path:
+            arr.flags.writeable = False
+        if key in self._paths:
+            self.nbytes -= sum(arr.nbytes for arr in self._paths[key])
+        self._paths[key] = path
+        self._paths.move_to_end(key)
+        self.nbytes += path_bytes
+        self.evict()
+        return path
+
+    def evict(self) -> None:
+        """Evict the least recently used paths until the stored paths fit in
+        max_bytes"""
+        while self.nbytes > self.max_bytes:
+            _, path = self._paths.popitem(last=False)
+            self.nbytes -= sum(arr.nbytes for arr in path)
+
+    def clear(self) -> None:
+        """Remove every cached path and reset the statistics"""
+        self._paths.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics"""
+        return CacheInfo(
+            self.hits, self.misses, self.max_bytes, len(self._paths), self.nbytes
+        )
+
+_PATH_CACHE = _PathCache()
+
+def enable_path_cache(max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+    """
+    Enable caching of calculated paths so shapes with the same class, input
+    parameters and thetas reuse one read-only path instead of evaluating the
+    parametric equations again.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Largest total size in bytes of the cached paths before the least
+        recently used paths are evicted, default is 256 MiB.
+
+    Examples
+    --------
+    >>> import spyrograph
+    >>> import numpy as np
+    >>> spyrograph.enable_path_cache(max_bytes=2**30)
+    >>> thetas = np.arange(0, 10, .1)
+    >>> shapes = spyrograph.Hypotrochoid.create_range(R=300, r=[100, 200], d=50, thetas=thetas)
+    >>> shape = spyrograph.Hypotrochoid(R=300, r=100, d=50, thetas=thetas)
+    >>> spyrograph.path_cache_info()
+    CacheInfo(hits=1, misses=2, max_bytes=1073741824, currsize=2, nbytes=3200)
+    """
+    if max_bytes <= 0:
+        raise ValueError("max_bytes must be a positive integer.")
+    _PATH_CACHE.enabled = True
+    _PATH_CACHE.max_bytes = max_bytes
+    _PATH_CACHE.evict()
+
+def disable_path_cache() -> None:
+    """Disable caching of calculated paths and clear the cache"""
+    _PATH_CACHE.enabled = False
+    _PATH_CACHE.clear()
+
+def clear_path_cache() -> None:
+    """Remove every cached path and reset the hit and miss statistics"""
+    _PATH_CACHE.clear()
+
+def path_cache_info() -> CacheInfo:
+    """Return a CacheInfo namedtuple with the hits, misses, max_bytes,
+    number of cached paths and their total size in bytes"""
+    return _PATH_CACHE.info()
+
+def _get_thetas_fingerprint(thetas: "np.ndarray") -> Tuple:
+    """Return a hashable fingerprint of a theta grid"""
+    thetas = np.ascontiguousarray(thetas)
+    digest = hashlib.blake2b(thetas.tobytes(), digest_size=16).hexdigest()
+    return (thetas.dtype.str, thetas.shape, digest)
+
+def _get_path_key(
+        shape_class: type, R: Number, r: Number, d: Number,
+        thetas_fingerprint: Tuple, dtype: "np.dtype"
+    ) -> Tuple:
+    """Return the cache key of an untransformed path"""
+    # pylint: disable=too-many-arguments
+    return (shape_class, R, r, d, thetas_fingerprint, np.dtype(dtype).str)
@@ -0,0 +1,203 @@
+"""Bulk drawing backend that pushes precomputed coordinates straight to the
+Tk canvas underneath a turtle screen. A whole chunk of a path becomes one
+canvas line item instead of one turtle.goto per point, styled like the
+turtle's own lines and registered with the turtle so its clear() removes them
+"""
+
+from numbers import Number
+from typing import Callable, Dict, Iterable, List, Tuple
+import math
+import time
+import tkinter
+
+import numpy as np
+
+def _to_canvas_coords(
+        screen: "turtle.TurtleScreen", x: "np.ndarray", y: "np.ndarray"
+    ) -> "np.ndarray":
+    """Return a flat x0, y0, x1, y1, ... array of canvas coordinates the same
+    way turtle maps world coordinates onto its canvas"""
+    coords = np.empty(2*len(x), dtype=np.float64)
+    coords[0::2] = np.asarray(x, dtype=np.float64)*screen.xscale
+    coords[1::2] = -np.asarray(y, dtype=np.float64)*screen.yscale
+    return coords
+
+def _create_line(
+        pen: "turtle.RawTurtle", coords: List[Number]
+    ) -> int:
+    """Create one canvas line through the flat canvas coordinates styled with
+    the pen's color and width and return its item id. The id is added to the
+    pen's items so the pen's clear() deletes it like its own lines"""
+    # pylint: disable=protected-access
+    item = pen.screen.cv.create_line(
+        *coords, fill=pen._pencolor, width=pen._pensize,
+        capstyle=tkinter.ROUND
+    )
+    pen.items.append(item)
+    return item
+
+def _draw_lines(
+        pen: "turtle.RawTurtle",
+        chunks: Iterable[Tuple["np.ndarray", "np.ndarray"]]
+    ) -> List[int]:
+    """Draw one continuous polyline given as consecutive (x, y) chunks with
+    one canvas line per chunk, each starting from the previous chunk's last
+    point, then move the pen to the end of the path without drawing. Return
+    the ids of the created canvas items"""
+    items = []
+    previous = None
+    last = None
+    for x, y in chunks:
+        if len(x) == 0:
+            continue
+        coords = _to_canvas_coords(pen.screen, x, y)
+        if previous is not None:
+            coords = np.concatenate((previous, coords))
+        previous = coords[-2:]
+        last = (float(x[-1]), float(y[-1]))
+        if len(coords) >= 4:
+            items.append(_create_line(pen, coords.tolist()))
+    if last is not None:
+        pen.up()
+        pen.goto(*last)
+    return items
+
+def _record_frame(pen: "turtle.RawTurtle") -> List[Tuple["np.ndarray", Dict[str, str]]]:
+    """Return the flattened canvas coordinates and style of every visible
+    line the pen has drawn so the frame can be replayed without tracing"""
+    canvas = pen.screen.cv
+    frame = []
+    for item in pen.items:
+        if canvas.type(item) != "line" or canvas.itemcget(item, "fill") == "":
+            continue
+        coords = canvas.coords(item)
+        if len(coords) < 4:
+            continue
+        options = {
+            option: canvas.itemcget(item, option)
+            for option in ("fill", "width", "capstyle")
+        }
+        frame.append((np.asarray(coords, dtype=np.float64), options))
+    return frame
+
+def _replay_frame(
+        pen: "turtle.RawTurtle", frame: List[Tuple["np.ndarray", Dict[str, str]]]
+    ) -> None:
+    """Recreate the recorded lines of a frame as the pen's canvas items"""
+    canvas = pen.screen.cv
+    for coords, options in frame:
+        pen.items.append(canvas.create_line(*coords.tolist(), **options))
+
+class _RollingCircleOverlay:
+    # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    def __init__(
+            self, pen: "turtle.RawTurtle", radius: Number, dot_size: Number = 10
+        ) -> None:
+        """Persistent canvas items for the rolling circle, its center, the
+        trace point and the arm connecting them. They're created once in the
+        pen's color and only have their coordinates moved every frame
+
+        Parameters
+        ----------
+        pen : turtle.RawTurtle
+            Turtle whose screen, color and items the overlay uses
+        radius : Number
+            Radius of the rolling circle in world coordinates
+        dot_size : Number = 10
+            Diameter of the center and trace point dots in pixels
+        """
+        # pylint: disable=protected-access
+        self.screen = pen.screen
+        self.canvas = pen.screen.cv
+        self.radius = radius
+        self.dot_size = dot_size
+        color = pen._pencolor
+        self.circle = self.canvas.create_oval(0, 0, 0, 0, outline=color, width=1)
+        self.arm = self.canvas.create_line(0, 0, 0, 0, fill=color, width=1)
+        self.center_dot = self.canvas.create_oval(0, 0, 0, 0, fill="blue", outline="blue")
+        self.trace_dot = self.canvas.create_oval(0, 0, 0, 0, fill="red", outline="red")
+        pen.items.extend([self.circle, self.arm, self.center_dot, self.trace_dot])
+
+    def move(
+            self, center_x: Number, center_y: Number, x: Number, y: Number
+        ) -> None:
+        """Move every overlay item to the rolling circle's center and the
+        trace point given in world coordinates"""
+        xscale, yscale = self.screen.xscale, self.screen.yscale
+        center_x, center_y = center_x*xscale, -center_y*yscale
+        x, y = x*xscale, -y*yscale
+        radius_x, radius_y = self.radius*xscale, self.radius*yscale
+        half_dot = self.dot_size/2
+        self.canvas.coords(
+            self.circle, center_x - radius_x, center_y - radius_y,
+            center_x + radius_x, center_y + radius_y
+        )
+        self.canvas.coords(self.arm, center_x, center_y, x, y)
+        self.canvas.coords(
+            self.center_dot, center_x - half_dot, center_y - half_dot,
+            center_x + half_dot, center_y + half_dot
+        )
+        self.canvas.coords(
+            self.trace_dot, x - half_dot, y - half_dot, x + half_dot, y + half_dot
+        )
+
+def _get_points_per_frame(n_points: int, fps: Number, duration: Number = None) -> int:
+    """Return the number of points drawn per frame so the path finishes in
+    duration seconds at fps frames per second, one point per frame without a
+    duration"""
+    if fps <= 0 or (duration is not None and duration < 0):
+        raise ValueError("fps must be positive and duration must not be negative.")
+    if duration is None:
+        return 1
+    n_frames = max(1, math.ceil(duration*fps))
+    return max(1, math.ceil(n_points/n_frames))
+
+def _get_frame_target(
+        n_points: int, points_per_frame: int, frame: int, elapsed: Number,
+        fps: Number
+    ) -> int:
+    """Return the number of points that should be drawn by the end of the
+    frame. Frames that run late draw every point they're behind on so the
+    path still finishes on schedule"""
+    on_schedule = points_per_frame*(frame + 1)
+    catch_up = points_per_frame*math.ceil(elapsed*fps)
+    return min(n_points, max(on_schedule, catch_up))
+
+def _run_frames(
+        screen: "turtle.TurtleScreen", draw_until: Callable[[int], None],
+        n_points: int, points_per_frame: int, fps: Number
+    ) -> None:
+    """Draw the points in frames scheduled with the screen's timer, calling
+    draw_until with the number of points to draw by the end of every frame.
+    Instead of sleeping, the Tk event loop keeps running until the last frame
+    so the window stays responsive"""
+    canvas = screen.getcanvas()
+    done = tkinter.BooleanVar(master=canvas, value=False)
+    interval = 1/fps
+    start = time.perf_counter()
+
+    def step(frame: int) -> None:
+        """Draw one frame and schedule the next relative to the start so
+        delays don't accumulate"""
+        target = _get_frame_target(
+            n_points, points_per_frame, frame, time.perf_counter() - start, fps
+        )
+        draw_until(target)
+        screen.update()
+        if target >= n_points:
+            done.set(True)
+            return
+        delay = start + (frame + 1)*interval - time.perf_counter()
+        screen.ontimer(lambda: step(frame + 1), max(0, int(1000*delay)))
+
+    screen.ontimer(lambda: step(0), 0)
+    canvas.wait_variable(done)
+
+def _pause(screen: "turtle.TurtleScreen", seconds: Number) -> None:
+    """Wait the given seconds while the Tk event loop keeps running"""
+    if seconds <= 0:
+        return
+    canvas = screen.getcanvas()
+    done = tkinter.BooleanVar(master=canvas, value=False)
+    screen.ontimer(lambda: done.set(True), int(1000*seconds))
+    canvas.wait_variable(done)
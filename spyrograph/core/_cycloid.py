@@ -3,23 +3,28 @@ shape's methods i.e. tracing, calculating, etc.
 """
 
 from numbers import Number
-from typing import List, Tuple, Union
+from typing import Iterator, List, Tuple, Union
 import turtle
 
-from spyrograph.core._trochoid import _Trochoid
+from spyrograph.core._trochoid import _Trochoid, _GRID_BLOCK_POINTS
 from spyrograph.core._misc import (
     _get_products_of_inputs, _validate_only_one_iterable, _draw_animation,
-    _get_animate_screen_size
+    _get_animate_screen_size, _validate_theta, _get_period, _get_grid_period
 )
+from spyrograph.core._batch import ShapeBatch
 class _Cycloid(_Trochoid):
     # pylint: disable=too-few-public-methods
     def __init__(
             self, R: Number, r: Number, thetas: List[Number] = None,
-            theta_start: Number = None, theta_stop: Number = None,
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
             theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0),
-            orientation: Number = 0, noise: Number = None
+            orientation: Number = 0, noise: Number = None, lazy: bool = False,
+            theta_tolerance: Number = None, dtype: "np.dtype" = None
         ) -> None:
-        super().__init__(R, r, r, thetas, theta_start, theta_stop, theta_step, origin, orientation, noise)
+        super().__init__(
+            R, r, r, thetas, theta_start, theta_stop, theta_step, origin,
+            orientation, noise, lazy, theta_tolerance, dtype
+        )
         # pylint: disable=pointless-string-statement
         """Instantiate a cycloid curve from given input parameters. A
         hypocycloid is a curve drawn by tracing a point from a circle as it
@@ -41,11 +46,12 @@ class _Cycloid(_Trochoid):
             Starting theta value for creating a list of thetas (similar syntax
             to built-in range or np.arange). This argument cannot be set at the
             same time as thetas argument
-        theta_stop : Number = None
+        theta_stop : Union[Number, str] = None
             Stop theta value for creating a list of thetas, stop value is not
             included in the final array (similar syntax to built-in range or
-            np.arange). This argument cannot be set at the same time as thetas
-            argument
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of the shape. This argument cannot be set at the same time
+            as thetas argument
         theta_step : Number = None
             Incremental step value for stepping from start to stop
             (similar syntax to built-in range or np.arange). This argument
@@ -54,6 +60,17 @@ class _Cycloid(_Trochoid):
             Custom origin to center the shapes at. Default is (0,0)
         orientation : Number = 0
             Angle of rotation for the shape
+        lazy : bool = False
+            Defer calculating the path until x, y, coords, the bounds or the
+            DataFrame are first accessed, then cache the results
+        theta_tolerance : Number = None
+            Adaptively sample theta between theta_start and theta_stop so the
+            distance between the path and the straight line drawn between
+            consecutive points is at most theta_tolerance. This argument
+            cannot be set at the same time as thetas or noise arguments
+        dtype : np.dtype = None
+            Floating point type used to calculate and store thetas, x, y and
+            noise i.e. np.float32 to halve memory. Default calculates in float64
         """
 
     @classmethod
@@ -68,12 +85,19 @@ class _Cycloid(_Trochoid):
             color: str = "black", width: Number = 1,
             frame_pause: Number = 0.1, screen: "turtle.Screen" = None,
             screen_coords = (0, 0), padding: Number = 100, repeat: bool = False,
-            reverse: bool = False, boomerang: bool = False
+            reverse: bool = False, boomerang: bool = False, workers: int = None,
+            executor: "concurrent.futures.Executor" = None, fps: Number = None,
+            duration: Number = None
         ) -> List["_Trochoid"]:
         """
         Animate a sequence of _Trochoid shapes with varying input parameters,
         drawn one after the other.
 
+        The animation is traced on a turtle screen. To save it to an animated
+        GIF or PNG frames without a screen, create the shapes with create_range
+        and call save_gif or save_frames on the returned ShapeBatch instead
+        i.e. create_range(...).save_gif("animation.gif").
+
         Parameters
         ----------
         R : Union[Number, List[Number]]
@@ -88,11 +112,12 @@ class _Cycloid(_Trochoid):
             Starting theta value for creating a list of thetas (similar syntax
             to built-in range or np.arange). This argument cannot be set at the
             same time as thetas argument.
-        theta_stop : Number, optional
+        theta_stop : Union[Number, str], optional
             Stop theta value for creating a list of thetas, stop value is not
             included in the final array (similar syntax to built-in range or
-            np.arange). This argument cannot be set at the same time as thetas
-            argument.
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of every shape. This argument cannot be set at the same
+            time as thetas argument.
         theta_step : Number, optional
             Incremental step value for stepping from start to stop
             (similar syntax to built-in range or np.arange). This argument
@@ -123,6 +148,14 @@ class _Cycloid(_Trochoid):
             is False
         boomerang : bool, optional, default False
             If True, repeat the animation at the end in reverse, default is False
+        workers : int, optional
+            Number of processes to calculate the shapes in, see create_range.
+        executor : concurrent.futures.Executor, optional
+            Existing executor to calculate the shapes in, see create_range.
+        fps : Number, optional
+            Frames per second to trace each shape in, see trace.
+        duration : Number, optional
+            Time in seconds each shape takes to trace, see trace.
 
         Returns
         -------
@@ -135,11 +168,14 @@ class _Cycloid(_Trochoid):
         >>> import numpy as np
         >>> thetas = np.linspace(0, 2 * np.pi, num=1000)
         >>> shapes = Hypotrochoid.animate(R=10, r=[4, 5, 6], d=8, thetas=thetas)
+        >>> sweep = Hypotrochoid.create_range(R=10, r=[4, 5, 6], d=8, thetas=thetas)
+        >>> sweep.save_gif("animation.gif")
         """
         # pylint: disable=duplicate-code
         shapes_arr = cls.create_range(
             R, r, thetas, theta_start,
-            theta_stop, theta_step, origin
+            theta_stop, theta_step, origin,
+            workers=workers, executor=executor
         )
         screen_size = _get_animate_screen_size(shapes_arr, padding)
         _draw_animation(
@@ -147,7 +183,7 @@ class _Cycloid(_Trochoid):
             screen_color=screen_color, exit_on_click=exit_on_click, color=color,
             width=width, frame_pause=frame_pause, screen=screen,
             screen_coords=screen_coords, padding=padding, repeat=repeat,
-            reverse=reverse, boomerang=boomerang
+            reverse=reverse, boomerang=boomerang, fps=fps, duration=duration
         )
 
     @classmethod
@@ -156,10 +192,12 @@ class _Cycloid(_Trochoid):
             cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
             thetas: List[Number] = None, theta_start: Number = None,
             theta_stop: Number = None, theta_step: Number = None,
-            origin: Tuple[Number, Number] = (0, 0)
-        ) -> List["_Trochoid"]:
-        """Return a list of instantiated shapes where one of the input parameters
-        is a list of increments i.e. R, r and the rest are fixed
+            origin: Tuple[Number, Number] = (0, 0), dtype: "np.dtype" = None,
+            workers: int = None, executor: "concurrent.futures.Executor" = None
+        ) -> ShapeBatch:
+        """Return a batch of instantiated shapes where one of the input parameters
+        is a list of increments i.e. R, r and the rest are fixed. Every path is
+        calculated at once as a 2-D (n_shapes, n_thetas) array
 
         Parameters
         ----------
@@ -175,29 +213,132 @@ class _Cycloid(_Trochoid):
             Starting theta value for creating a list of thetas (similar syntax
             to built-in range or np.arange). This argument cannot be set at the
             same time as thetas argument
-        theta_stop : Number = None
+        theta_stop : Union[Number, str] = None
             Stop theta value for creating a list of thetas, stop value is not
             included in the final array (similar syntax to built-in range or
-            np.arange). This argument cannot be set at the same time as thetas
-            argument
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of the shape. This argument cannot be set at the same time
+            as thetas argument
         theta_step : Number = None
             Incremental step value for stepping from start to stop
             (similar syntax to built-in range or np.arange). This argument
             cannot be set at the same time as thetas argument
         origin : Tuple[Number, Number] = (0, 0)
             Custom origin to center the shapes at. Default is (0,0)
+        dtype : np.dtype = None
+            Floating point type used to calculate and store the paths i.e.
+            np.float32 to halve memory. Default calculates in float64
+        workers : int = None
+            Number of processes to spread the calculation over in blocks of
+            shapes, -1 uses every CPU. Sweeps too small to benefit are
+            calculated serially. Default calculates serially
+        executor : concurrent.futures.Executor = None
+            Existing executor to spread the calculation over instead of
+            starting a new process pool, it's left running for the caller to
+            shut down
+
+        Returns
+        -------
+        shapes : ShapeBatch
+            A sequence of instantiated shapes with varying input parameters
         """
         # pylint: disable=line-too-long,redefined-argument-from-local,invalid-name,no-member,fixme
         _validate_only_one_iterable(R, r)
         input_params = _get_products_of_inputs(R, r)
 
-        shapes = []
-        for R, r in input_params:
-            shapes.append(cls(
-                R, r, thetas, theta_start, theta_stop, theta_step, origin
-            ))
+        R, r = zip(*input_params)
+        period = _get_period(R, r) if isinstance(theta_stop, str) else None
+        thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step, period, dtype)
+        shapes = ShapeBatch(
+            cls, R, r, r, thetas, origin, dtype=dtype,
+            workers=workers, executor=executor
+        )
         return shapes
 
+    @classmethod
+    # pylint: disable=arguments-differ
+    def create_grid(
+            cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
+            thetas: List[Number] = None, theta_start: Number = None,
+            theta_stop: Union[Number, str] = None, theta_step: Number = None,
+            origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0),
+            orientation: Union[Number, List[Number]] = 0, dtype: "np.dtype" = None,
+            workers: int = None, executor: "concurrent.futures.Executor" = None
+        ) -> ShapeBatch:
+        """Return a batch of instantiated shapes for every combination of R, r,
+        origin and orientation, any of which can be a list of values. Shapes
+        are ordered like nested loops over the inputs with the last input
+        varying fastest
+
+        Parameters
+        ----------
+        R : Union[Number, List[Number]]
+            Radius of the fixed circle
+        r : Union[Number, List[Number]]
+            Radius of the rolling circle
+        thetas, theta_start, theta_stop, theta_step
+            See create_range
+        origin : Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0)
+            Custom origin or list of origins to center the shapes at. Default
+            is (0,0)
+        orientation : Union[Number, List[Number]] = 0
+            Angle or list of angles of rotation
+        dtype, workers, executor
+            See create_range
+
+        Returns
+        -------
+        shapes : ShapeBatch
+            A sequence of instantiated shapes, one per combination of inputs
+        """
+        # pylint: disable=too-many-arguments,invalid-name,duplicate-code
+        period = _get_grid_period(R, r) if isinstance(theta_stop, str) else None
+        thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step, period, dtype)
+        return next(cls._iter_grid_batches(
+            R, r, None, thetas, origin, orientation, dtype,
+            workers=workers, executor=executor
+        ))
+
+    @classmethod
+    # pylint: disable=arguments-differ
+    def iter_grid(
+            cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
+            thetas: List[Number] = None, theta_start: Number = None,
+            theta_stop: Union[Number, str] = None, theta_step: Number = None,
+            origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0),
+            orientation: Union[Number, List[Number]] = 0, dtype: "np.dtype" = None,
+            block_size: int = None, workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> Iterator[ShapeBatch]:
+        """Yield the shapes of create_grid in consecutive batches of at most
+        block_size shapes so arbitrarily large grids are calculated in bounded
+        memory
+
+        Parameters
+        ----------
+        R, r, thetas, theta_start, theta_stop, theta_step, origin, orientation, dtype
+            See create_grid
+        block_size : int = None
+            Largest number of shapes per yielded batch. Default fits roughly
+            four million points in each batch
+        workers, executor
+            See create_range
+
+        Yields
+        ------
+        shapes : ShapeBatch
+            The next block of shapes in create_grid's order
+        """
+        # pylint: disable=too-many-arguments,invalid-name,line-too-long,duplicate-code
+        period = _get_grid_period(R, r) if isinstance(theta_stop, str) else None
+        thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step, period, dtype)
+        if block_size is None:
+            block_size = max(1, _GRID_BLOCK_POINTS//len(thetas))
+        yield from cls._iter_grid_batches(
+            R, r, None, thetas, origin, orientation, dtype,
+            block_size, workers, executor
+        )
+
     @classmethod
     def n_cusps(
             cls, R: Number, n: int, thetas: List[Number] = None,
@@ -2,31 +2,57 @@
 
 import itertools
 import collections
-from typing import Tuple, List, Union
+import fractions
+import math
+from typing import Callable, Iterator, Tuple, List, Union
 from numbers import Number
 import turtle
 import time
 
 import numpy as np
 
+from spyrograph.core._batch import ShapeBatch
+from spyrograph.core._canvas import _pause, _record_frame, _replay_frame
+
 try:
     from PIL import ImageGrab
 except ImportError:
     ImageGrab = None
 
-def _apply_rotation(x: "np.array", y: "np.array", angle: Number):
-    """Return rotated parametrized values"""
+# Smallest tolerance for adaptive thetas as a multiple of the rounding error
+# of the path's largest coordinate, chord errors below it are float noise
+_ADAPTIVE_EPS_FACTOR = 16
+
+# Largest number of points adaptive thetas are refined to
+_ADAPTIVE_MAX_POINTS = 2**22
+
+def _get_affine_matrix(
+        origin: Tuple[Number, Number] = (0, 0), angle: Number = 0
+    ) -> np.ndarray:
+    """Return 3x3 homogeneous affine matrix that rotates by angle and then
+    translates to origin"""
     cos_angle, sin_angle = np.cos(angle), np.sin(angle)
-    rotation_matrix = np.array([[cos_angle, -sin_angle], [sin_angle, cos_angle]])
-    rotated_coords = np.dot(rotation_matrix, np.array([x, y]))
-    return rotated_coords[0], rotated_coords[1]
+    return np.array([
+        [cos_angle, -sin_angle, origin[0]],
+        [sin_angle, cos_angle, origin[1]],
+        [0, 0, 1]
+    ])
+
+def _apply_affine(x: "np.array", y: "np.array", matrix: np.ndarray):
+    """Return parametrized values transformed by a 3x3 homogeneous affine
+    matrix in a single vectorized step in the same dtype as the inputs"""
+    matrix = matrix.astype(np.result_type(x, y, np.float32), copy=False)
+    transformed_x = matrix[0, 0]*x + matrix[0, 1]*y + matrix[0, 2]
+    transformed_y = matrix[1, 0]*x + matrix[1, 1]*y + matrix[1, 2]
+    return transformed_x, transformed_y
 
 def _validate_theta(
-        thetas: List[Number], theta_start: Number, theta_stop: Number,
-        theta_step: Number
+        thetas: List[Number], theta_start: Number, theta_stop: Union[Number, str],
+        theta_step: Number, period: Number = None, dtype: "np.dtype" = None
     ) -> np.ndarray:
     """Return a numpy array of theta values after validating & standartising
-        the input list of theta values"""
+        the input list of theta values. When theta_stop is "closed" the thetas
+        span exactly one period from theta_start"""
     theta_values = (theta_start, theta_stop, theta_step)
     multiple_thetas = thetas is not None and any(theta_values)
     if multiple_thetas:
@@ -37,18 +63,143 @@ def _validate_theta(
     if thetas is None:
         if theta_step is None:
             theta_step = .1
-        thetas = np.arange(theta_start, theta_stop, theta_step)
-    thetas = np.array(thetas)
+        if isinstance(theta_stop, str):
+            thetas = _get_closed_thetas(theta_start, theta_stop, theta_step, period)
+        else:
+            thetas = np.arange(theta_start, theta_stop, theta_step)
+    thetas = np.array(thetas, dtype=dtype)
     if len(thetas) == 0:
         raise ValueError("An empty list of thetas was passed in as argument.")
     return thetas
 
+def _get_closed_thetas(
+        theta_start: Number, theta_stop: str, theta_step: Number, period: Number
+    ) -> np.ndarray:
+    """Return evenly spaced thetas covering exactly one period, including the
+    closing theta, with a step no larger than theta_step"""
+    if theta_stop != "closed":
+        raise ValueError((
+            f"Unrecognized theta_stop {theta_stop!r} was passed in as argument. "
+            "Please pass a number or \"closed\"."
+        ))
+    if theta_start is None:
+        theta_start = 0
+    n_steps = math.ceil(period/theta_step)
+    return np.linspace(theta_start, theta_start + period, n_steps + 1)
+
+def _get_period(
+        R: Union[Number, List[Number]], r: Union[Number, List[Number]],
+        max_denominator: int = 10000
+    ) -> float:
+    """Return the smallest theta period after which every trochoid with the
+    given fixed and rolling circle radii returns to its starting point. The
+    rolling term of the parametric equations has frequency (R -/+ r)/r so the
+    curve closes after as many revolutions as the denominator of R/r"""
+    revolutions = 1
+    for fixed_radius, rolling_radius in zip(_set_int_to_list(R), _set_int_to_list(r)):
+        ratio = fractions.Fraction(fixed_radius/rolling_radius)
+        closest_ratio = ratio.limit_denominator(max_denominator)
+        if not math.isclose(closest_ratio, ratio, rel_tol=1e-9):
+            raise ValueError((
+                "The ratio of R to r is not rational within the maximum "
+                f"denominator of {max_denominator} so the shape does not close."
+            ))
+        denominator = closest_ratio.denominator
+        revolutions = revolutions*denominator//math.gcd(revolutions, denominator)
+    return 2*math.pi*revolutions
+
+def _get_adaptive_thetas(
+        thetas: np.ndarray, calculate_xy: Callable, tolerance: Number,
+        max_iterations: int = 32, max_points: int = _ADAPTIVE_MAX_POINTS
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Return thetas refined by repeatedly splitting every segment whose
+    midpoint deviates from the chord between its endpoints by more than the
+    tolerance, along with the x- and y-values calculated at those thetas.
+    Only segments created by the previous split are checked again.
+
+    The tolerance is clamped to the rounding error of the path's floating
+    point type, halves whose error didn't shrink below their parent's are
+    left alone since they're at the limit of float resolution and the total
+    number of points is capped at max_points, splitting the worst segments
+    first when the cap is reached"""
+    # pylint: disable=too-many-locals,no-member
+    if tolerance <= 0:
+        raise ValueError("theta_tolerance must be a positive number.")
+    x, y = calculate_xy(thetas)
+    magnitude = max(np.abs(x).max(initial=0), np.abs(y).max(initial=0))
+    resolution = _ADAPTIVE_EPS_FACTOR*np.finfo(np.result_type(x, y)).eps*magnitude
+    tolerance = max(tolerance, resolution)
+    unchecked = np.arange(len(thetas) - 1)
+    parent_error = np.full(len(unchecked), np.inf)
+    for _ in range(max_iterations):
+        budget = max_points - len(thetas)
+        if budget <= 0 or len(unchecked) == 0:
+            break
+        mid_thetas = (thetas[unchecked] + thetas[unchecked + 1])/2
+        mid_x, mid_y = calculate_xy(mid_thetas)
+        chord_error = np.hypot(
+            mid_x - (x[unchecked] + x[unchecked + 1])/2,
+            mid_y - (y[unchecked] + y[unchecked + 1])/2
+        )
+        split = (chord_error > tolerance) & (chord_error < parent_error)
+        if not split.any():
+            break
+        if split.sum() > budget:
+            worst = np.argsort(np.where(split, chord_error, -np.inf))[-budget:]
+            split = np.zeros_like(split)
+            split[worst] = True
+        split_segments = unchecked[split]
+        thetas = np.insert(thetas, split_segments + 1, mid_thetas[split])
+        x = np.insert(x, split_segments + 1, mid_x[split])
+        y = np.insert(y, split_segments + 1, mid_y[split])
+        first_halves = split_segments + np.arange(len(split_segments))
+        unchecked = np.stack((first_halves, first_halves + 1), axis=1).ravel()
+        parent_error = np.repeat(chord_error[split], 2)
+    return thetas, (x, y)
+
 def _get_products_of_inputs(*args) -> Tuple[Number]:
     """Return a list of tuples that contains all of the input arguments"""
     list_of_lists = [_set_int_to_list(el) for el in args]
     product = list(itertools.product(*list_of_lists))
     return product
 
+def _iter_grid_params(
+        params: List[Union[Number, List[Number]]],
+        origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]],
+        orientation: Union[Number, List[Number]], block_size: int = None
+    ) -> Iterator[Tuple[np.ndarray, ...]]:
+    """Yield consecutive blocks of at most block_size rows of the Cartesian
+    product of every input parameter, origin and orientation as one array per
+    input, every row in one block when there's no block_size. Rows are
+    generated from their flat index so only one block is held in memory at a
+    time"""
+    axes = [np.atleast_1d(np.asarray(param)) for param in params]
+    axes.append(np.asarray(origin).reshape(-1, 2))
+    axes.append(np.atleast_1d(np.asarray(orientation)))
+    grid_shape = tuple(len(axis) for axis in axes)
+    n_rows = int(np.prod(grid_shape))
+    if n_rows == 0:
+        raise ValueError("Every grid input must have at least one value.")
+    if block_size is None:
+        block_size = n_rows
+    for start in range(0, n_rows, block_size):
+        indices = np.unravel_index(
+            np.arange(start, min(start + block_size, n_rows)), grid_shape
+        )
+        yield tuple(axis[index] for axis, index in zip(axes, indices))
+
+def _get_grid_period(
+        R: Union[Number, List[Number]], r: Union[Number, List[Number]]
+    ) -> float:
+    """Return the smallest theta period after which every combination of the
+    given fixed and rolling circle radii returns to its starting point. Only
+    unique ratios of R to r are checked"""
+    ratios = np.unique(np.divide.outer(
+        np.atleast_1d(np.asarray(R, dtype=float)),
+        np.atleast_1d(np.asarray(r, dtype=float))
+    ))
+    return _get_period(ratios.tolist(), [1]*len(ratios))
+
 def _validate_only_one_iterable(*args) -> None:
     """Validation check that only one argument passed to create_range is an iterable"""
     inputs = collections.Counter([isinstance(el, collections.abc.Iterable) for el in args])
@@ -87,11 +238,14 @@ def _save_trace(screen: "turtle.Turtle", fpath: str):
     image.save(fpath)
 
 def _get_animate_screen_size(shapes_arr, padding) -> Tuple[Number, Number]:
-    """Return screen size calculated from the largest x and y values"""
-    min_x = min(shapes_arr, key=lambda x: x.min_x).min_x
-    max_x = max(shapes_arr, key=lambda x: x.max_x).max_x
-    min_y = min(shapes_arr, key=lambda x: x.min_y).min_y
-    max_y = max(shapes_arr, key=lambda x: x.max_y).max_y
+    """Return screen size calculated from the analytic bounds of the shapes so
+    none of the shapes' paths need to be calculated"""
+    if isinstance(shapes_arr, ShapeBatch):
+        min_x, max_x, min_y, max_y = shapes_arr.bounds(full_curve=True)
+    else:
+        shape_bounds = np.array([shape.bounds(full_curve=True) for shape in shapes_arr])
+        min_x, min_y = shape_bounds[:, [0, 2]].min(axis=0)
+        max_x, max_y = shape_bounds[:, [1, 3]].max(axis=0)
     screen_size = (
         max_x - min_x + padding,
         max_y - min_y + padding
@@ -102,50 +256,78 @@ def _trace_loop(
         shapes_arr, screen: "turtle.Screen", turtles: "namedtuple",
         screen_size: Tuple[Number, Number], screen_color: str, color: str,
         width: Number, screen_coords: Tuple[Number, Number], padding: Number,
-        frame_pause: Number
+        frame_pause: Number, fps: Number = None, duration: Number = None,
+        frames: List = None
     ) -> Tuple["turtle.Screen", "namedtuple"]:
-    """Returns a turtle screen and namedtuple containing turtles..."""
+    """Returns a turtle screen and namedtuple containing turtles after tracing
+    every shape. When frames is a list each shape's drawn lines are recorded
+    into it for replaying"""
     for shape in shapes_arr:
-        if screen is not None:
-            turtles.shape_turtle.clear()
         screen, turtles = shape.trace(
             screen = screen, screen_size = screen_size,
             screen_color = screen_color,
             color = color, width=width, screen_coords=screen_coords,
-            padding=padding
+            padding=padding, fps=fps, duration=duration, turtles=turtles
         )
-        time.sleep(frame_pause)
+        if frames is not None:
+            frames.append(_record_frame(turtles.shape_turtle))
+        _pause(screen, frame_pause)
     if screen is not None:
         turtles.shape_turtle.clear()
     return screen, turtles
 
+def _replay_loop(
+        frames: List, screen: "turtle.Screen", turtles: "namedtuple",
+        frame_pause: Number
+    ) -> None:
+    """Redraw recorded frames one after the other without tracing"""
+    for frame in frames:
+        turtles.shape_turtle.clear()
+        _replay_frame(turtles.shape_turtle, frame)
+        screen.update()
+        _pause(screen, frame_pause)
+    turtles.shape_turtle.clear()
+
 def _draw_animation(
         shapes_arr, screen_size: Tuple[Number, Number] = (1000, 1000),
         screen_color: str = "white", exit_on_click: bool = False,
         color: str = "black", width: Number = 1,
         frame_pause: Number = 0.1, screen: "turtle.Screen" = None,
         screen_coords = (0, 0), padding: Number = 100, repeat: bool = False,
-        reverse: bool = False, boomerang: bool = False
+        reverse: bool = False, boomerang: bool = False, fps: Number = None,
+        duration: Number = None
     ) -> None:
-    """Draw the animation from a given set of shapes"""
+    """Draw the animation from a given set of shapes. The first pass traces
+    every shape and records its lines, later repeat and boomerang passes
+    replay the recorded frames instead of tracing again unless the shapes
+    are traced progressively with fps or duration"""
+    # pylint: disable=too-many-locals
     if reverse:
         shapes_arr = shapes_arr[::-1]
-    if boomerang:
-        reverse_arr = shapes_arr[::-1]
+    progressive = fps is not None or duration is not None
     turtles = None
+    frames = None
     while True:
-        screen, turtles = _trace_loop(
-            shapes_arr=shapes_arr, screen=screen, turtles=turtles,
-            screen_size=screen_size, screen_color=screen_color, color=color, width=width,
-            screen_coords=screen_coords, padding=padding, frame_pause=frame_pause
-        )
-        if boomerang:
+        if frames is None or progressive:
+            frames = None if progressive else []
             screen, turtles = _trace_loop(
-                shapes_arr=reverse_arr, screen=screen, turtles=turtles,
-                screen_size=screen_size, screen_color=screen_color, color=color,
-                width=width, screen_coords=screen_coords, padding=padding,
-                frame_pause=frame_pause
+                shapes_arr=shapes_arr, screen=screen, turtles=turtles,
+                screen_size=screen_size, screen_color=screen_color, color=color, width=width,
+                screen_coords=screen_coords, padding=padding, frame_pause=frame_pause,
+                fps=fps, duration=duration, frames=frames
             )
+        else:
+            _replay_loop(frames, screen, turtles, frame_pause)
+        if boomerang:
+            if progressive:
+                screen, turtles = _trace_loop(
+                    shapes_arr=shapes_arr[::-1], screen=screen, turtles=turtles,
+                    screen_size=screen_size, screen_color=screen_color, color=color,
+                    width=width, screen_coords=screen_coords, padding=padding,
+                    frame_pause=frame_pause, fps=fps, duration=duration
+                )
+            else:
+                _replay_loop(frames[::-1], screen, turtles, frame_pause)
         if not repeat:
             break
     if exit_on_click:
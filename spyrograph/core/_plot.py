@@ -0,0 +1,164 @@
+"""Batched matplotlib rendering of many shapes. Every shape is drawn as one
+segment of a single LineCollection so overlaying thousands of shapes is one
+artist and one draw call, and animations blit a single line whose data is
+swapped between frames instead of redrawing the figure
+"""
+
+from numbers import Number
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.animation import FuncAnimation
+except ImportError:
+    plt = None
+
+def plot_many(
+        shapes: Union["ShapeBatch", Sequence["_Trochoid"]],
+        ax: "matplotlib.axes._axes.Axes" = None, show: bool = False, **kwargs
+    ) -> Tuple["matplotlib.figure.Figure", "matplotlib.axes._axes.Axes"]:
+    """
+    Plot every shape as one LineCollection and return the Figure and Axes.
+
+    Parameters
+    ----------
+    shapes : Union[ShapeBatch, Sequence[_Trochoid]]
+        Shapes to overlay i.e. the output of create_range
+    ax : matplotlib.axes._axes.Axes, optional
+        Axes to draw on, default creates a new figure
+    show : bool, optional
+        Show the figure after drawing, default is False
+    **kwargs
+        Keyword arguments passed to matplotlib.collections.LineCollection i.e.
+        colors, linewidths or alpha
+
+    Returns
+    -------
+    fig : matplotlib.figure.Figure
+        The Figure object associated with the plot.
+    ax : matplotlib.axes._axes.Axes
+        The Axes object associated with the plot.
+
+    Raises
+    ------
+    ImportError
+        If matplotlib is not installed on the user's machine.
+
+    Examples
+    --------
+    >>> from spyrograph import Hypotrochoid, plot_many
+    >>> import numpy as np
+    >>> thetas = np.arange(0, 2*np.pi, .01)
+    >>> shapes = Hypotrochoid.create_range(300, 200, range(1, 5000), thetas=thetas)
+    >>> fig, ax = plot_many(shapes, linewidths=.1)
+    """
+    # pylint: disable=line-too-long
+    if plt is None:
+        raise ImportError("matplotlib is required but is not installed on your machine, please install and try again")
+    if ax is None:
+        _, ax = plt.subplots()
+    collection = LineCollection(_get_segments(shapes), **kwargs)
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    if show:
+        plt.show()
+    return ax.figure, ax
+
+def animate_many(
+        shapes: Union["ShapeBatch", Sequence["_Trochoid"]],
+        ax: "matplotlib.axes._axes.Axes" = None, frame_pause: Number = 0.1,
+        repeat: bool = False, show: bool = False, **kwargs
+    ) -> "matplotlib.animation.FuncAnimation":
+    """
+    Animate the shapes one per frame with blitting and return the animation.
+
+    The axes limits are fixed to the combined bounds of every shape up front
+    so each frame only replaces the data of one line and redraws that line.
+    Keep a reference to the returned animation for as long as it should run.
+
+    Parameters
+    ----------
+    shapes : Union[ShapeBatch, Sequence[_Trochoid]]
+        Shapes to animate in order i.e. the output of create_range
+    ax : matplotlib.axes._axes.Axes, optional
+        Axes to draw on, default creates a new figure
+    frame_pause : Number, optional
+        Time in seconds between frames, default is 0.1
+    repeat : bool, optional
+        Restart the animation after the last shape, default is False
+    show : bool, optional
+        Show the figure after creating the animation, default is False
+    **kwargs
+        Keyword arguments passed to matplotlib.axes.Axes.plot
+
+    Returns
+    -------
+    matplotlib.animation.FuncAnimation
+        The animation drawing one shape per frame.
+
+    Raises
+    ------
+    ImportError
+        If matplotlib is not installed on the user's machine.
+    """
+    # pylint: disable=line-too-long,too-many-arguments
+    if plt is None:
+        raise ImportError("matplotlib is required but is not installed on your machine, please install and try again")
+    if ax is None:
+        _, ax = plt.subplots()
+    paths = _get_paths(shapes)
+    min_x, max_x, min_y, max_y = _get_bounds(paths)
+    ax.set_xlim(min_x, max_x)
+    ax.set_ylim(min_y, max_y)
+    line, = ax.plot([], [], animated=True, **kwargs)
+
+    def init() -> List["matplotlib.lines.Line2D"]:
+        """Clear the line before the first frame"""
+        line.set_data([], [])
+        return [line]
+
+    def update(frame: int) -> List["matplotlib.lines.Line2D"]:
+        """Swap in the path of the frame's shape"""
+        line.set_data(*paths[frame])
+        return [line]
+
+    animation = FuncAnimation(
+        ax.figure, update, frames=len(paths), init_func=init,
+        interval=1000*frame_pause, repeat=repeat, blit=True
+    )
+    if show:
+        plt.show()
+    return animation
+
+def _get_paths(
+        shapes: Union["ShapeBatch", Sequence["_Trochoid"]]
+    ) -> List[Tuple["np.ndarray", "np.ndarray"]]:
+    """Return the (x, y) path of every shape, taking rows of a batch's 2-D
+    arrays directly instead of creating a shape per row"""
+    batch_x = getattr(shapes, "x", None)
+    if isinstance(batch_x, np.ndarray) and batch_x.ndim == 2:
+        return list(zip(shapes.x, shapes.y))
+    return [(shape.x, shape.y) for shape in shapes]
+
+def _get_segments(
+        shapes: Union["ShapeBatch", Sequence["_Trochoid"]]
+    ) -> Union["np.ndarray", List["np.ndarray"]]:
+    """Return the (n_points, 2) path of every shape for a LineCollection. A
+    batch's 2-D x and y arrays are stacked into one (n_shapes, n_points, 2)
+    array at once instead of shape by shape"""
+    batch_x = getattr(shapes, "x", None)
+    if isinstance(batch_x, np.ndarray) and batch_x.ndim == 2:
+        return np.stack((shapes.x, shapes.y), axis=-1)
+    return [np.column_stack(path) for path in _get_paths(shapes)]
+
+def _get_bounds(
+        paths: Sequence[Tuple["np.ndarray", "np.ndarray"]]
+    ) -> Tuple[Number, Number, Number, Number]:
+    """Return (min_x, max_x, min_y, max_y) of every path combined"""
+    return (
+        min(x.min() for x, _ in paths), max(x.max() for x, _ in paths),
+        min(y.min() for _, y in paths), max(y.max() for _, y in paths)
+    )
@@ -0,0 +1,268 @@
+"""Headless NumPy rasterizer for rendering calculated paths straight to PNG
+files without a turtle screen, a display or PIL. Polylines are densified into
+samples on a supersampled grid, thickened into strokes by dilating with a
+disk and averaged back down to antialiased coverage that's composited onto
+the background color
+"""
+
+from numbers import Number
+from typing import Iterable, Tuple, Union
+import struct
+import zlib
+
+import numpy as np
+
+try:
+    import matplotlib.colors as mcolors
+except ImportError:
+    mcolors = None
+
+# Number of subpixels along each side of a pixel used for antialiasing
+_SUPERSAMPLE = 4
+
+# Largest distance in subpixels between consecutive densified samples
+_SAMPLE_SPACING = .5
+
+# Turtle draws one unit of the shape as one pixel, dpi scales relative to it
+_BASE_DPI = 72
+
+_COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "cyan": (0, 255, 255),
+    "magenta": (255, 0, 255),
+    "orange": (255, 165, 0),
+    "purple": (160, 32, 240),
+    "pink": (255, 192, 203),
+    "brown": (165, 42, 42),
+    "grey": (190, 190, 190),
+    "gray": (190, 190, 190)
+}
+
+def _get_rgb(color: Union[str, Tuple[Number, Number, Number]]) -> Tuple[int, int, int]:
+    """Return an (r, g, b) tuple of 0-255 integers from a color name, hex
+    string or (r, g, b) tuple of either 0-1 floats or 0-255 integers. A
+    tuple is read as 0-1 floats when any channel is a float and no channel is
+    above 1 i.e. (0, .5, 1)"""
+    if not isinstance(color, str):
+        rgb = tuple(color)[:3]
+        has_float = any(isinstance(channel, (float, np.floating)) for channel in rgb)
+        if has_float and max(rgb) <= 1:
+            rgb = tuple(round(255*channel) for channel in rgb)
+        return tuple(int(channel) for channel in rgb)
+    name = color.strip().lower()
+    if name in _COLORS:
+        return _COLORS[name]
+    if name.startswith("#") and len(name) in (4, 7):
+        digits = name[1:] if len(name) == 7 else "".join(2*char for char in name[1:])
+        return tuple(int(digits[i:i+2], 16) for i in range(0, 6, 2))
+    if mcolors is not None and mcolors.is_color_like(color):
+        return tuple(round(255*channel) for channel in mcolors.to_rgb(color))
+    raise ValueError((
+        f"Unrecognized color {color!r} was passed in as argument. Please pass a "
+        "basic color name, a hex string or an (r, g, b) tuple."
+    ))
+
+class _Canvas:
+    def __init__(
+            self, size: Tuple[int, int], center: Tuple[Number, Number],
+            scale: Number
+        ) -> None:
+        """Supersampled boolean canvas that polylines are marked onto in
+        shape coordinates
+
+        Parameters
+        ----------
+        size : Tuple[int, int]
+            Width and height of the output image in pixels
+        center : Tuple[Number, Number]
+            Shape coordinates drawn at the center of the image
+        scale : Number
+            Number of pixels per unit of the shape's coordinates
+        """
+        self.width, self.height = (int(np.ceil(length)) for length in size)
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError("The image size must be positive.")
+        self.center = center
+        self.scale = scale
+        self.mask = np.zeros(
+            (self.height*_SUPERSAMPLE, self.width*_SUPERSAMPLE), dtype=bool
+        )
+
+    def draw_polyline(self, chunks: Iterable[Tuple["np.ndarray", "np.ndarray"]]) -> None:
+        """Mark densified samples of one continuous polyline given as
+        consecutive (x, y) chunks so the whole path is never held at once"""
+        previous = None
+        for x, y in chunks:
+            sub_x, sub_y = self._to_subpixels(x, y)
+            if previous is not None:
+                sub_x = np.concatenate(([previous[0]], sub_x))
+                sub_y = np.concatenate(([previous[1]], sub_y))
+            if len(sub_x) == 0:
+                continue
+            previous = (sub_x[-1], sub_y[-1])
+            self._mark(*_densify(sub_x, sub_y))
+
+    def get_coverage(self, width: Number) -> "np.ndarray":
+        """Return the (height, width) antialiased coverage of every marked
+        polyline stroked with the given line width in pixels"""
+        # pylint: disable=too-many-function-args
+        radius = max(width*_SUPERSAMPLE/2, _SUPERSAMPLE/2)
+        stroke = _dilate(self.mask, radius)
+        # Summing strided slices is much faster than a strided reduction
+        subpixels = stroke.view(np.uint8).reshape(
+            self.height, _SUPERSAMPLE, self.width, _SUPERSAMPLE
+        )
+        rows = sum(subpixels[:, i] for i in range(_SUPERSAMPLE))
+        counts = sum(rows[..., i] for i in range(_SUPERSAMPLE))
+        return counts.astype(np.float32)/_SUPERSAMPLE**2
+
+    def _to_subpixels(self, x: "np.ndarray", y: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return shape coordinates as subpixel coordinates with y pointing
+        down the image"""
+        factor = self.scale*_SUPERSAMPLE
+        sub_x = (np.asarray(x, dtype=np.float64) - self.center[0])*factor + self.mask.shape[1]/2
+        sub_y = self.mask.shape[0]/2 - (np.asarray(y, dtype=np.float64) - self.center[1])*factor
+        return sub_x, sub_y
+
+    def _mark(self, sub_x: "np.ndarray", sub_y: "np.ndarray") -> None:
+        """Mark the subpixels containing the given samples"""
+        columns = np.floor(sub_x).astype(np.intp)
+        rows = np.floor(sub_y).astype(np.intp)
+        inside = (
+            (columns >= 0) & (columns < self.mask.shape[1])
+            & (rows >= 0) & (rows < self.mask.shape[0])
+        )
+        self.mask[rows[inside], columns[inside]] = True
+
+def _densify(sub_x: "np.ndarray", sub_y: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return samples along every segment of the polyline spaced at most
+    _SAMPLE_SPACING subpixels apart, calculated for every segment at once"""
+    if len(sub_x) < 2:
+        return sub_x, sub_y
+    delta_x = np.diff(sub_x)
+    delta_y = np.diff(sub_y)
+    n_samples = np.maximum(
+        np.ceil(np.hypot(delta_x, delta_y)/_SAMPLE_SPACING), 1
+    ).astype(np.intp)
+    segments = np.repeat(np.arange(len(delta_x)), n_samples)
+    starts = np.cumsum(n_samples) - n_samples
+    fractions = (np.arange(len(segments)) - starts[segments])/n_samples[segments]
+    dense_x = np.append(sub_x[segments] + fractions*delta_x[segments], sub_x[-1])
+    dense_y = np.append(sub_y[segments] + fractions*delta_y[segments], sub_y[-1])
+    return dense_x, dense_y
+
+def _dilate(mask: "np.ndarray", radius: Number) -> "np.ndarray":
+    """Return the mask dilated by a disk of the given radius. Every row of the
+    disk is a horizontal run whose marked subpixels are counted from row-wise
+    cumulative sums and OR-ed in at its two vertical offsets. The sums wrap
+    around in uint16 which is safe because runs are shorter than 2**16 so a
+    run only counts zero when it's empty"""
+    reach = int(np.floor(radius))
+    if reach == 0:
+        return mask
+    height, width = mask.shape
+    cumulative = np.zeros((height, width + 2*reach + 1), dtype=np.uint16)
+    np.cumsum(mask, axis=1, dtype=np.uint16, out=cumulative[:, reach + 1:width + reach + 1])
+    cumulative[:, width + reach + 1:] = cumulative[:, width + reach:width + reach + 1]
+    stroke = np.zeros_like(mask)
+    for offset in range(reach + 1):
+        half_run = int(np.floor(np.sqrt(radius**2 - offset**2)))
+        run = (
+            cumulative[:, reach + half_run + 1:reach + half_run + 1 + width]
+            != cumulative[:, reach - half_run:reach - half_run + width]
+        )
+        stroke[offset:] |= run[:height - offset]
+        if offset > 0:
+            stroke[:-offset] |= run[offset:]
+    return stroke
+
+def _get_frame(
+        bounds: Tuple[Number, Number, Number, Number],
+        screen_size: Tuple[Number, Number], padding: Number, scale: Number
+    ) -> Tuple[Tuple[Number, Number], Tuple[Number, Number]]:
+    """Return the image size in pixels and the shape coordinates at its
+    center. Like the turtle screen, a given screen_size is centered on (0, 0)
+    otherwise the image fits the bounds with extra padding"""
+    if screen_size is not None:
+        return (screen_size[0]*scale, screen_size[1]*scale), (0, 0)
+    min_x, max_x, min_y, max_y = bounds
+    size = ((max_x - min_x + padding)*scale, (max_y - min_y + padding)*scale)
+    return size, ((min_x + max_x)/2, (min_y + max_y)/2)
+
+def _render(
+        polylines: Iterable[Iterable[Tuple["np.ndarray", "np.ndarray"]]],
+        size: Tuple[Number, Number], center: Tuple[Number, Number],
+        scale: Number, color: Union[str, Tuple], background: Union[str, Tuple],
+        width: Number
+    ) -> "np.ndarray":
+    """Return a (height, width, 3) uint8 image of every polyline, each given
+    as consecutive (x, y) chunks, stroked in the color onto the background"""
+    # pylint: disable=too-many-arguments
+    coverage = _render_coverage(polylines, size, center, scale, width)
+    return _composite(coverage, _get_rgb(color), _get_rgb(background))
+
+def _render_coverage(
+        polylines: Iterable[Iterable[Tuple["np.ndarray", "np.ndarray"]]],
+        size: Tuple[Number, Number], center: Tuple[Number, Number],
+        scale: Number, width: Number
+    ) -> "np.ndarray":
+    """Return the (height, width) antialiased coverage of every polyline,
+    each given as consecutive (x, y) chunks, stroked with the line width"""
+    canvas = _Canvas(size, center, scale)
+    for chunks in polylines:
+        canvas.draw_polyline(chunks)
+    return canvas.get_coverage(width*scale)
+
+def _get_levels(coverage: "np.ndarray") -> "np.ndarray":
+    """Return coverage quantized to 256 uint8 levels i.e. indices into the
+    palette returned by _get_palette"""
+    return np.round(coverage*255).astype(np.uint8)
+
+def _get_palette(
+        color: Union[str, Tuple], background: Union[str, Tuple]
+    ) -> "np.ndarray":
+    """Return the (256, 3) uint8 palette of every blend of the color onto the
+    background so every frame of an animation shares one palette"""
+    levels = np.linspace(0, 1, 256, dtype=np.float32)
+    return _composite(levels, _get_rgb(color), _get_rgb(background))
+
+def _composite(
+        coverage: "np.ndarray", color: Tuple[int, int, int],
+        background: Tuple[int, int, int]
+    ) -> "np.ndarray":
+    """Return a (height, width, 3) uint8 image of the color blended onto the
+    background by coverage"""
+    color = np.asarray(color, dtype=np.float32)
+    background = np.asarray(background, dtype=np.float32)
+    image = background + coverage[..., np.newaxis]*(color - background)
+    return np.round(image).astype(np.uint8)
+
+def _write_png(fpath: str, image: "np.ndarray", dpi: Number = None) -> None:
+    """Write a (height, width, 3) uint8 image as an 8-bit RGB PNG"""
+    height, width = image.shape[:2]
+    rows = np.empty((height, 1 + 3*width), dtype=np.uint8)
+    rows[:, 0] = 0
+    rows[:, 1:] = image.reshape(height, 3*width)
+    with open(fpath, "wb") as png_file:
+        png_file.write(b"\x89PNG\r\n\x1a\n")
+        _write_png_chunk(png_file, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        if dpi is not None:
+            pixels_per_meter = int(round(dpi/.0254))
+            _write_png_chunk(
+                png_file, b"pHYs",
+                struct.pack(">IIB", pixels_per_meter, pixels_per_meter, 1)
+            )
+        _write_png_chunk(png_file, b"IDAT", zlib.compress(rows.tobytes(), 6))
+        _write_png_chunk(png_file, b"IEND", b"")
+
+def _write_png_chunk(png_file, chunk_type: bytes, data: bytes) -> None:
+    """Write a length-prefixed PNG chunk with its CRC"""
+    png_file.write(struct.pack(">I", len(data)))
+    png_file.write(chunk_type)
+    png_file.write(data)
+    png_file.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xffffffff))
@@ -0,0 +1,148 @@
+"""Polyline simplification helpers for reducing the number of vertices in a
+calculated path. Both algorithms return the indices of the vertices to keep
+so the caller can take the matching subset of thetas, noise, etc.
+"""
+
+from numbers import Number
+from typing import Tuple, Union
+
+import numpy as np
+
+# Segments with at least this many interior vertices are measured on their
+# own as views of the path, shorter ones are batched together
+_RDP_BATCH_MAX_LENGTH = 2**8
+
+def _simplify_path(
+        x: np.ndarray, y: np.ndarray, tolerance: Number, method: str = "rdp"
+    ) -> np.ndarray:
+    """Return sorted indices of the vertices kept by the given simplification
+    method"""
+    if tolerance < 0:
+        raise ValueError("Simplification tolerance must not be negative.")
+    if method == "rdp":
+        return _simplify_rdp(x, y, tolerance)
+    if method == "visvalingam":
+        return _simplify_visvalingam(x, y, tolerance)
+    raise ValueError((
+        f"Unrecognized simplification method {method!r} was passed in as argument. "
+        "Please pass \"rdp\" or \"visvalingam\"."
+    ))
+
+def _simplify_rdp(x: np.ndarray, y: np.ndarray, tolerance: Number) -> np.ndarray:
+    """Return indices kept by the Ramer-Douglas-Peucker algorithm. Rather than
+    recursing into one segment at a time, every pending segment at the same
+    recursion depth is processed in one pass. Short segments are batched
+    together so the squared distances of all of their vertices to their
+    chords are calculated at once and the furthest vertex of each is found
+    with a segmented reduction, long segments are measured on views of the
+    path without gathering their vertices"""
+    # pylint: disable=invalid-name,too-many-locals
+    n_points = len(x)
+    if n_points < 3:
+        return np.arange(n_points)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = np.zeros(n_points, dtype=bool)
+    keep[0] = keep[-1] = True
+    starts = np.array([0])
+    stops = np.array([n_points - 1])
+    while len(starts):
+        furthest = np.empty(len(starts), dtype=np.intp)
+        furthest_distances = np.empty(len(starts))
+        long_segments = stops - starts - 1 >= _RDP_BATCH_MAX_LENGTH
+        for segment in np.flatnonzero(long_segments):
+            start, stop = starts[segment], stops[segment]
+            squared_distances = _get_squared_distances(
+                x[start+1:stop], y[start+1:stop], x[start], y[start],
+                x[stop], y[stop]
+            )
+            furthest[segment] = start + 1 + np.argmax(squared_distances)
+            furthest_distances[segment] = squared_distances[furthest[segment] - start - 1]
+        short_segments = ~long_segments
+        if short_segments.any():
+            furthest[short_segments], furthest_distances[short_segments] = _get_furthest_batched(
+                x, y, starts[short_segments], stops[short_segments]
+            )
+        split = furthest_distances > tolerance**2
+        splits = furthest[split]
+        keep[splits] = True
+        starts = np.concatenate((starts[split], splits))
+        stops = np.concatenate((splits, stops[split]))
+        pending = stops - starts >= 2
+        order = np.argsort(starts[pending])
+        starts, stops = starts[pending][order], stops[pending][order]
+    return np.flatnonzero(keep)
+
+def _get_furthest_batched(
+        x: np.ndarray, y: np.ndarray, starts: np.ndarray, stops: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the index of the first vertex furthest from its chord in every
+    segment between starts and stops along with its squared distance. The
+    interior vertices of every segment are concatenated and measured at once"""
+    lengths = stops - starts - 1
+    offsets = np.cumsum(lengths) - lengths
+    indices = np.arange(offsets[-1] + lengths[-1]) + np.repeat(starts + 1 - offsets, lengths)
+    squared_distances = _get_squared_distances(
+        x[indices], y[indices],
+        np.repeat(x[starts], lengths), np.repeat(y[starts], lengths),
+        np.repeat(x[stops], lengths), np.repeat(y[stops], lengths)
+    )
+    furthest_distances = np.maximum.reduceat(squared_distances, offsets)
+    furthest_positions = np.flatnonzero(
+        squared_distances == np.repeat(furthest_distances, lengths)
+    )
+    first_positions = furthest_positions[np.searchsorted(furthest_positions, offsets)]
+    return indices[first_positions], furthest_distances
+
+def _simplify_visvalingam(x: np.ndarray, y: np.ndarray, tolerance: Number) -> np.ndarray:
+    """Return indices kept by the Visvalingam-Whyatt algorithm where tolerance
+    is the smallest effective triangle area to keep. Rather than removing one
+    vertex at a time, each pass removes every other vertex from each run of
+    neighbouring vertices below the tolerance so no two neighbours are
+    removed in the same pass and the number of passes grows logarithmically"""
+    keep = np.arange(len(x))
+    while len(keep) > 2:
+        kept_x = x[keep]
+        kept_y = y[keep]
+        areas = .5*np.abs(
+            (kept_x[:-2] - kept_x[2:])*(kept_y[1:-1] - kept_y[:-2])
+            - (kept_x[:-2] - kept_x[1:-1])*(kept_y[2:] - kept_y[:-2])
+        )
+        below_tolerance = areas < tolerance
+        if not below_tolerance.any():
+            break
+        run_starts = below_tolerance & ~np.concatenate(([False], below_tolerance[:-1]))
+        positions = np.arange(len(areas))
+        run_start_positions = np.maximum.accumulate(np.where(run_starts, positions, 0))
+        remove = below_tolerance & ((positions - run_start_positions) % 2 == 0)
+        keep = np.delete(keep, np.flatnonzero(remove) + 1)
+    return keep
+
+def _get_squared_distances(
+        x: np.ndarray, y: np.ndarray, start_x: Union[Number, np.ndarray],
+        start_y: Union[Number, np.ndarray], stop_x: Union[Number, np.ndarray],
+        stop_y: Union[Number, np.ndarray]
+    ) -> np.ndarray:
+    """Return the squared distance from every point to the line segment
+    between start and stop, given per point or once for every point.
+    Segments of zero length measure the distance to start"""
+    # pylint: disable=too-many-arguments
+    segment_x = stop_x - start_x
+    segment_y = stop_y - start_y
+    length_squared = np.asarray(segment_x**2 + segment_y**2, dtype=np.float64)
+    inverse_length_squared = np.divide(
+        1, length_squared, out=np.zeros_like(length_squared),
+        where=length_squared != 0
+    )
+    x = x - start_x
+    y = y - start_y
+    projection = x*segment_x
+    projection += y*segment_y
+    projection *= inverse_length_squared
+    np.clip(projection, 0, 1, out=projection)
+    x -= projection*segment_x
+    y -= projection*segment_y
+    x *= x
+    y *= y
+    x += y
+    return x
@@ -0,0 +1,88 @@
+"""Streaming SVG writer for calculated paths. Coordinates are quantized to
+integers at the requested decimal precision and written as relative path
+commands chunk by chunk, with a transform scaling the integers back down, so
+neither the path data nor the document is ever built as one string
+"""
+
+from numbers import Number
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+def _write_svg(
+        fpath: str, polylines: Iterable[Iterable[Tuple["np.ndarray", "np.ndarray"]]],
+        bounds: Tuple[Number, Number, Number, Number], precision: int = 2,
+        color: str = "black", width: Number = 1, background: str = None,
+        padding: Number = 100
+    ) -> None:
+    """Write every polyline, each given as consecutive (x, y) chunks, as a
+    path of an SVG document fitting the bounds with extra padding"""
+    # pylint: disable=too-many-arguments,too-many-locals
+    if not isinstance(precision, (int, np.integer)) or precision < 0:
+        raise ValueError("precision must be a non-negative integer number of decimals.")
+    min_x, max_x, min_y, max_y = bounds
+    view_x = min_x - padding/2
+    view_y = -max_y - padding/2
+    view_width = max_x - min_x + padding
+    view_height = max_y - min_y + padding
+    factor = 10**-precision
+    with open(fpath, "w", encoding="utf-8") as svg_file:
+        svg_file.write((
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{view_x:g} {view_y:g} {view_width:g} {view_height:g}" '
+            f'width="{view_width:g}" height="{view_height:g}">\n'
+        ))
+        if background is not None:
+            svg_file.write((
+                f'<rect x="{view_x:g}" y="{view_y:g}" width="{view_width:g}" '
+                f'height="{view_height:g}" fill="{background}"/>\n'
+            ))
+        svg_file.write((
+            f'<g transform="scale({factor:g} {-factor:g})" fill="none" '
+            f'stroke="{color}" stroke-width="{width/factor:g}" '
+            'stroke-linecap="round" stroke-linejoin="round">\n'
+        ))
+        for chunks in polylines:
+            svg_file.write('<path d="')
+            for path_data in _iter_path_data(chunks, precision):
+                svg_file.write(path_data)
+            svg_file.write('"/>\n')
+        svg_file.write("</g>\n</svg>\n")
+
+def _iter_path_data(
+        chunks: Iterable[Tuple["np.ndarray", "np.ndarray"]], precision: int
+    ) -> Iterator[str]:
+    """Yield the path data of one continuous polyline chunk by chunk as an
+    absolute move to its first point followed by relative lines between the
+    quantized points. Points are quantized before differencing so rounding
+    never accumulates along the path and repeated points are skipped"""
+    multiplier = 10**precision
+    previous = None
+    command = "l"
+    for x, y in chunks:
+        points = np.empty((len(x), 2), dtype=np.int64)
+        points[:, 0] = np.round(np.asarray(x, dtype=np.float64)*multiplier)
+        points[:, 1] = np.round(np.asarray(y, dtype=np.float64)*multiplier)
+        if len(points) == 0:
+            continue
+        if previous is None:
+            yield f"M{points[0, 0]} {points[0, 1]}"
+            previous = points[0]
+        deltas = np.diff(points, axis=0, prepend=previous[np.newaxis])
+        deltas = deltas[(deltas != 0).any(axis=1)]
+        previous = points[-1]
+        if len(deltas):
+            yield command + _format_integers(deltas.ravel())
+            command = " "
+
+def _format_integers(values: "np.ndarray") -> str:
+    """Return space separated integers, dropping the separator before
+    negative numbers since the minus sign already separates them"""
+    return " ".join(map(str, values.tolist())).replace(" -", "-")
+
+def _get_polyline_chunks(
+        x: "np.ndarray", y: "np.ndarray", chunk_size: int = 65536
+    ) -> Iterator[Tuple["np.ndarray", "np.ndarray"]]:
+    """Yield consecutive (x, y) views of an already calculated path"""
+    for start in range(0, len(x), chunk_size):
+        yield x[start:start + chunk_size], y[start:start + chunk_size]
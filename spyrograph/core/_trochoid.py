@@ -2,21 +2,34 @@
 shape's methods i.e. tracing, calculating, etc. The child classes define
 the parametric equations
 """
+# pylint: disable=too-many-lines
 
 import math
 import turtle
-from typing import Tuple, List, Union
+from typing import Iterator, Tuple, List, Union
 from numbers import Number
 import time
 from abc import ABC, abstractmethod
 import collections
+import copy
 
 import numpy as np
 
 from spyrograph.core._misc import (
     _get_products_of_inputs, _validate_only_one_iterable, _draw_animation,
-    _validate_theta, _save_trace, _get_animate_screen_size, _apply_rotation
+    _validate_theta, _save_trace, _get_animate_screen_size, _apply_affine,
+    _get_affine_matrix, _get_period, _get_adaptive_thetas, _get_grid_period,
+    _iter_grid_params
 )
+from spyrograph.core._batch import ShapeBatch
+from spyrograph.core._simplify import _simplify_path
+from spyrograph.core._raster import _BASE_DPI, _get_frame, _render, _write_png
+from spyrograph.core._svg import _write_svg
+from spyrograph.core._canvas import (
+    _draw_lines, _RollingCircleOverlay, _get_points_per_frame, _run_frames
+)
+from spyrograph.core._archive import _save_archive
+from spyrograph.core._cache import _PATH_CACHE, _get_path_key, _get_thetas_fingerprint
 
 try:
     import matplotlib.pyplot as plt
@@ -28,13 +41,30 @@ try:
 except ImportError:
     pd = None
 
+_PATH_ATTRIBUTES = ("x", "y", "coords", "min_x", "max_x", "min_y", "max_y")
+
+_TraceTurtles = collections.namedtuple(
+    "TraceTurtles",
+    [
+        "shape_turtle",
+        "pre_draw_turtle",
+        "rolling_circle_turtle",
+        "fixed_circle_turtle"
+    ]
+)
+
+# Default number of points calculated per batch yielded by iter_grid
+_GRID_BLOCK_POINTS = 2**22
+
 class _Trochoid(ABC):
-    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
     def __init__(
             self, R: Number, r: Number, d: Number, thetas: List[Number] = None,
-            theta_start: Number = None, theta_stop: Number = None,
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
             theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0),
-            orientation: Number = 0, noise: List["np.array"] = None
+            orientation: Number = 0, noise: List["np.array"] = None,
+            lazy: bool = False, theta_tolerance: Number = None,
+            dtype: "np.dtype" = None
         ) -> None:
         """Model of a trochoid curve from given input parameters. A trochoid is
         a curve drawn by tracing a point from a circle as it rolls around the
@@ -56,11 +86,12 @@ class _Trochoid(ABC):
             Starting theta value for creating a list of thetas (similar syntax
             to built-in range or np.arange). This argument cannot be set at the
             same time as thetas argument
-        theta_stop : Number = None
+        theta_stop : Union[Number, str] = None
             Stop theta value for creating a list of thetas, stop value is not
             included in the final array (similar syntax to built-in range or
-            np.arange). This argument cannot be set at the same time as thetas
-            argument
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of the shape. This argument cannot be set at the same time
+            as thetas argument
         theta_step : Number = None
             Incremental step value for stepping from start to stop
             (similar syntax to built-in range or np.arange). This argument
@@ -69,17 +100,62 @@ class _Trochoid(ABC):
             Custom origin to center the shapes at. Default is (0,0)
         orientation : Number = 0
             Angle of rotation for the shape
+        lazy : bool = False
+            Defer calculating the path until x, y, coords, the bounds or the
+            DataFrame are first accessed, then cache the results
+        theta_tolerance : Number = None
+            Adaptively sample theta between theta_start and theta_stop so the
+            distance between the path and the straight line drawn between
+            consecutive points is at most theta_tolerance. Thetas are refined
+            where the curvature is high and left coarse elsewhere, theta_step
+            is used as the largest step. This argument cannot be set at the
+            same time as thetas or noise arguments
+        dtype : np.dtype = None
+            Floating point type used to calculate and store thetas, x, y and
+            noise i.e. np.float32 which halves memory and bandwidth. float32
+            carries about 7 significant digits so expect errors around
+            1e-7*R*max(1, abs(theta)), well below a pixel for screen sized
+            shapes. Default keeps thetas as passed and calculates in float64
         """
         self.R = R
         self.r = r
         self.d = d
-        self.thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step)
+        self.dtype = dtype
+        self._validate_inputs()
+        if theta_tolerance is not None:
+            theta_step = self._get_adaptive_theta_step(thetas, theta_step, noise)
+        period = self.period() if isinstance(theta_stop, str) else None
+        self.thetas = _validate_theta(
+            thetas, theta_start, theta_stop, theta_step, period, dtype
+        )
         self.origin = origin
         self.orientation = orientation
         self.noise = noise
-
-        self._validate_inputs()
-        self._calculate_path()
+        self.lazy = lazy
+        self._df = None
+        self._base_path = None
+        self._archive = None
+        self._affine = _get_affine_matrix(origin, orientation)
+        if theta_tolerance is not None:
+            self._refine_thetas(theta_tolerance)
+
+        if not self.lazy:
+            self._calculate_path()
+
+    def __getattr__(self, name: str):
+        """Calculate the path on first access of one of the path attributes
+        when the shape was instantiated lazily. Shapes viewing a ShapeBatch
+        or an archive only build their coords array on first access"""
+        # pylint: disable=attribute-defined-outside-init
+        if name == "coords" and "x" in self.__dict__:
+            self.coords = np.column_stack((self.x, self.y, self.thetas))
+            return self.coords
+        if name in _PATH_ATTRIBUTES:
+            self._calculate_path()
+            return getattr(self, name)
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
 
     def translate(self, x: Number = 0, y: Number = 0) -> "_Trochoid":
         """
@@ -102,26 +178,11 @@ class _Trochoid(ABC):
         >>> shape = Trochoid(R=5, r=2, d=3, thetas=thetas)
         >>> transformed_shape = shape.transform(x=10, y=5)
         """
-        # pylint: disable=no-value-for-parameter
-        try:
-            translated_shape = self.__class__(
-                R=self.R,
-                r=self.r,
-                d=self.d,
-                thetas=self.thetas,
-                origin=(self.origin[0]+x, self.origin[1]+y),
-                orientation=self.orientation,
-                noise=self.noise
-            )
-        except TypeError:
-            translated_shape = self.__class__(
-                R=self.R,
-                r=self.r,
-                thetas=self.thetas,
-                origin=(self.origin[0]+x, self.origin[1]+y),
-                orientation=self.orientation,
-                noise=self.noise
-            )
+        translation_matrix = _get_affine_matrix(origin=(x, y))
+        translated_shape = self._transform(
+            translation_matrix,
+            origin=(self.origin[0]+x, self.origin[1]+y)
+        )
         return translated_shape
 
     def scale(self, factor: Number) -> Union["_Trochoid", "_Cycloid"]:
@@ -129,7 +190,9 @@ class _Trochoid(ABC):
 
         This method creates a new shape by scaling the input parameters R, r,
         and d (when applicable) by the given factor. The new shape is an
-        instance of the same class as the original shape.
+        instance of the same class as the original shape and reuses this
+        shape's calculated path, scaled about the origin, instead of
+        evaluating the parametric equations again.
 
         Parameters
         ----------
@@ -152,27 +215,22 @@ class _Trochoid(ABC):
         >>> scaled_hypotrochoid.d
         6
         """
-        # pylint: disable=no-value-for-parameter
-        try:
-            scaled_shape = self.__class__(
-                R=self.R*factor,
-                r=self.r*factor,
-                d=self.d*factor,
-                thetas=self.thetas,
-                origin=self.origin,
-                orientation=self.orientation,
-                noise=[self.noise[0]*factor, self.noise[1]*factor]
-            )
-        except TypeError:
-            scaled_shape = self.__class__(
-                R=self.R*factor,
-                r=self.r*factor,
-                thetas=self.thetas,
-                origin=self.origin,
-                orientation=self.orientation,
-                noise=[self.noise[0]*factor, self.noise[1]*factor]
-
-            )
+        noise = None
+        if self.noise is not None:
+            noise = [self.noise[0]*factor, self.noise[1]*factor]
+        # The untransformed path scales with R, r and d so scaling it keeps
+        # the affine matrix mapping the scaled parameters' path to the shape
+        base_path = None
+        if self._base_path is not None:
+            base_path = (self._base_path[0]*factor, self._base_path[1]*factor)
+        scaled_shape = self._transform(
+            np.identity(3),
+            R=self.R*factor,
+            r=self.r*factor,
+            d=self.d*factor,
+            noise=noise,
+            _base_path=base_path
+        )
         return scaled_shape
 
     def rotate(self, angle: float, degrees: bool = False):
@@ -180,7 +238,8 @@ class _Trochoid(ABC):
         Rotate the shape by the given angle (in radians).
 
         This method creates a new instance of the shape with the updated orientation attribute,
-        keeping the original shape unchanged.
+        keeping the original shape unchanged. The rotation is applied to this
+        shape's calculated path instead of evaluating the parametric equations again.
 
         Parameters
         ----------
@@ -201,56 +260,78 @@ class _Trochoid(ABC):
         >>> shape = Hypotrochoid(R=233, r=200, d=233, thetas=np.arange(0, 100*np.pi, .5))
         >>> rotated_shape = shape.rotate(np.pi / 4)  # Rotate the shape by 45 degrees
         """
-        # pylint: disable=no-value-for-parameter
         if degrees:
             angle = np.deg2rad(angle)
-        try:
-            rotated_shape = self.__class__(
-                R=self.R,
-                r=self.r,
-                d=self.d,
-                thetas=self.thetas,
-                origin=self.origin,
-                orientation=self.orientation + angle,
-                noise=self.noise
-            )
-        except TypeError:
-            rotated_shape = self.__class__(
-                R=self.R,
-                r=self.r,
-                thetas=self.thetas,
-                origin=self.origin,
-                orientation=self.orientation + angle,
-                noise=self.noise
-            )
+        rotation_matrix = self._about_origin(_get_affine_matrix(angle=angle))
+        rotated_shape = self._transform(
+            rotation_matrix,
+            orientation=self.orientation + angle
+        )
         return rotated_shape
 
     def add_noise(self, x_scale: Number = 0, y_scale: Number = 0) -> Union["_Trochoid", "_Cycloid"]:
-        x_noise = np.random.normal(0, x_scale, size=len(self.x))
-        y_noise = np.random.normal(0, y_scale, size=len(self.y))
+        x_noise = np.random.normal(0, x_scale, size=len(self.thetas)).astype(self._get_path_dtype())
+        y_noise = np.random.normal(0, y_scale, size=len(self.thetas)).astype(self._get_path_dtype())
         noise = [x_noise, y_noise]
-        try:
-            noisy_shape = self.__class__(
-                R=self.R,
-                r=self.r,
-                d=self.d,
-                thetas=self.thetas,
-                origin=self.origin,
-                orientation=self.orientation,
-                noise=noise
-            )
-        except TypeError:
-            noisy_shape = self.__class__(
-                R=self.R,
-                r=self.r,
-                thetas=self.thetas,
-                origin=self.origin,
-                orientation=self.orientation,
-                noise=noise
-            )
+        noisy_shape = self._transform(np.identity(3), noise=noise)
         return noisy_shape
 
-    def plot(self, **kwargs) -> Tuple["matplotlib.matplotlib.Figure", "matplotlib.axes._axes.Axes"]:
+    def simplify(self, tolerance: Number, method: str = "rdp") -> Union["_Trochoid", "_Cycloid"]:
+        """
+        Return a new shape with a reduced set of vertices that stays within the
+        given tolerance of the original path.
+
+        The returned shape keeps a subset of this shape's thetas and reuses
+        this shape's calculated path. The fraction of vertices that were
+        removed is stored on the returned shape as reduction_ratio.
+
+        Parameters
+        ----------
+        tolerance : Number
+            For "rdp" the largest distance allowed between a removed vertex
+            and the simplified path. For "visvalingam" the smallest triangle
+            area formed with a vertex's neighbours for that vertex to be kept.
+        method : str, optional
+            Either "rdp" (Ramer-Douglas-Peucker) or "visvalingam"
+            (Visvalingam-Whyatt), by default "rdp".
+
+        Returns
+        -------
+        Union["_Trochoid", "_Cycloid"]
+            A new shape instance with the reduced set of vertices.
+
+        Raises
+        ------
+        ValueError
+            If the tolerance is negative or the method is not recognized.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> import numpy as np
+        >>> shape = Hypotrochoid(R=300, r=200, d=200, thetas=np.arange(0, 4*np.pi, .001))
+        >>> simplified_shape = shape.simplify(.5)
+        >>> simplified_shape.reduction_ratio
+        0.9...
+        """
+        # pylint: disable=attribute-defined-outside-init
+        indices = _simplify_path(self.x, self.y, tolerance, method)
+        attributes = {"thetas": self.thetas[indices], "_base_path": None}
+        if self.noise is not None:
+            attributes["noise"] = [self.noise[0][indices], self.noise[1][indices]]
+        if self._base_path is not None:
+            attributes["_base_path"] = (
+                self._base_path[0][indices],
+                self._base_path[1][indices]
+            )
+        simplified_shape = self._transform(np.identity(3), **attributes)
+        simplified_shape.reduction_ratio = 1 - len(indices)/len(self.thetas)
+        return simplified_shape
+
+    def plot(
+            self, ax: "matplotlib.axes._axes.Axes" = None, show: bool = True,
+            **kwargs
+        ) -> Tuple["matplotlib.matplotlib.Figure", "matplotlib.axes._axes.Axes"]:
         """
         Plot the shape and return the associated matplotlib Figure and Axes objects.
 
@@ -261,6 +342,10 @@ class _Trochoid(ABC):
 
         Parameters
         ----------
+        ax : matplotlib.axes._axes.Axes, optional
+            Axes to draw on, default creates a new figure
+        show : bool, optional
+            Show the figure after drawing, default is True
         **kwargs
             Keyword arguments passed to the matplotlib.pyplot.plot function. For a
             full list of available options, refer to:
@@ -288,19 +373,27 @@ class _Trochoid(ABC):
         # pylint: disable=line-too-long
         if plt is None:
             raise ImportError("matplotlib is required but is not installed on your machine, please install and try again")
-        fig, ax = plt.subplots()
+        if ax is None:
+            _, ax = plt.subplots()
         ax.plot(self.x, self.y, **kwargs)
-        plt.show()
-        return fig, ax
+        if show:
+            plt.show()
+        return ax.figure, ax
 
     def save_png(
             self, fpath: str, screen_size: Tuple[Number, Number] = None,
             screen_color: str = "white", color: str = "black", width: Number = 1,
-            screen: "turtle.Screen" = None, screen_coords = (0, 0), padding = 100
+            screen: "turtle.Screen" = None, screen_coords = (0, 0), padding = 100,
+            headless: bool = False, dpi: Number = 72
         ) -> None:
         """
         Save the shape as a PNG file.
 
+        By default the shape is traced on a turtle screen which is then
+        screenshot. With headless the path is rasterized straight to the PNG
+        file with NumPy instead, which needs no display, Tk or PIL and is much
+        faster for large paths.
+
         Parameters
         ----------
         fpath : str
@@ -319,18 +412,152 @@ class _Trochoid(ABC):
             The x and y coordinates of the top-left corner of the turtle screen. Default is (0, 0).
         padding : int, optional
             The padding around the shape in the final PNG image. Default is 100.
+        headless : bool, optional
+            Rasterize the path without a turtle screen, screen and
+            screen_coords are ignored. Default is False.
+        dpi : Number, optional
+            Resolution of a headless image, one unit of the shape is one pixel
+            at the default of 72 like the turtle screen. Default is 72.
 
         Examples
         --------
         >>> shape = Trochoid(R=250, r=179, d=233, thetas=np.arange(0, 60, .01))
         >>> shape.save_png("spirograph.png", width=2)
+        >>> shape.save_png("spirograph_print.png", width=2, headless=True, dpi=300)
         """
+        if headless:
+            scale = dpi/_BASE_DPI
+            size, center = _get_frame(self.bounds(), screen_size, padding, scale)
+            image = _render(
+                [((x, y) for x, y, _ in self.iter_chunks())], size, center, scale,
+                color, screen_color, width
+            )
+            _write_png(fpath, image, dpi)
+            return
         screen, _ = self.trace(
             screen_size=screen_size, screen_color=screen_color, color=color,
             width=width, screen=screen, screen_coords=screen_coords, padding=padding
         )
         _save_trace(screen, fpath)
 
+    def save_svg(
+            self, fpath: str, precision: int = 2, simplify: Number = None,
+            color: str = "black", width: Number = 1, screen_color: str = None,
+            padding: Number = 100
+        ) -> None:
+        """
+        Save the shape as an SVG file.
+
+        The path is streamed to the file in chunks as relative path commands
+        between points rounded to a fixed number of decimals so large paths
+        produce small files without ever building the document in memory.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path where the SVG file will be saved.
+        precision : int, optional
+            Number of decimals the coordinates are rounded to. Default is 2.
+        simplify : Number, optional
+            Tolerance to simplify the path with before writing it, see
+            simplify. Default writes every point.
+        color : str, optional
+            The color of the shape. Default is "black".
+        width : Number, optional
+            The width of the shape lines. Default is 1.
+        screen_color : str, optional
+            The background color, default is transparent.
+        padding : Number, optional
+            The padding around the shape. Default is 100.
+
+        Examples
+        --------
+        >>> shape = Hypotrochoid(R=250, r=179, d=233, thetas=np.arange(0, 60, .01))
+        >>> shape.save_svg("spirograph.svg", precision=1, simplify=.05)
+        """
+        # pylint: disable=too-many-arguments
+        shape = self if simplify is None else self.simplify(simplify)
+        _write_svg(
+            fpath, [((x, y) for x, y, _ in shape.iter_chunks())], self.bounds(),
+            precision=precision, color=color, width=width,
+            background=screen_color, padding=padding
+        )
+
+    def save_npz(
+            self, fpath: str, include_path: bool = True, compressed: bool = False
+        ) -> None:
+        """
+        Save the shape to a compact .npz archive that spyrograph.load opens.
+
+        The archive stores the input parameters, origin, orientation, thetas
+        and any noise. The calculated path is stored as well unless
+        include_path is False or the shape is lazy and hasn't calculated it,
+        in which case it's calculated again on load.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path where the archive will be saved, numpy appends .npz
+            if it's missing.
+        include_path : bool, optional
+            Store the calculated x- and y-values, default is True.
+        compressed : bool, optional
+            Compress the archive, uncompressed archives are memory-mapped on
+            load. Default is False.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid, load
+        >>> shape = Hypotrochoid(R=250, r=179, d=233, thetas=np.arange(0, 60, .01))
+        >>> shape.save_npz("spirograph.npz")
+        >>> loaded_shape = load("spirograph.npz")
+        """
+        has_noise = self.noise is not None and (np.any(self.noise[0]) or np.any(self.noise[1]))
+        has_path = include_path and self._has_path()
+        dtype = "" if self.dtype is None else np.dtype(self.dtype).str
+        _save_archive(fpath, self.__class__, {
+            "R": self.R,
+            "r": self.r,
+            "d": self.d,
+            "thetas": self.thetas,
+            "origin": self.origin,
+            "orientation": self.orientation,
+            "affine": self._affine,
+            "lazy": self.lazy,
+            "dtype": dtype,
+            "noise": np.stack(self.noise) if has_noise else None,
+            "x": self.x if has_path else None,
+            "y": self.y if has_path else None
+        }, compressed=compressed)
+
+    @classmethod
+    def _from_archive(cls, members: "collections.abc.Mapping") -> "_Trochoid":
+        """Return a shape from the arrays of an archive saved by save_npz. A
+        saved path isn't read until it's first accessed and is then viewed
+        instead of calculated again"""
+        # pylint: disable=protected-access
+        shape = cls.__new__(cls)
+        shape.R = members["R"].item()
+        shape.r = members["r"].item()
+        shape.d = members["d"].item()
+        dtype = str(members["dtype"])
+        shape.dtype = np.dtype(dtype) if dtype else None
+        shape.thetas = members["thetas"]
+        shape.origin = tuple(members["origin"].tolist())
+        shape.orientation = members["orientation"].item()
+        shape.noise = None
+        if "noise" in members:
+            shape.noise = [members["noise"][0], members["noise"][1]]
+        shape.lazy = bool(members["lazy"])
+        shape._df = None
+        shape._base_path = None
+        shape._archive = members if "x" in members else None
+        shape._affine = np.array(members["affine"])
+        if shape._archive is None and not shape.lazy:
+            shape._calculate_path()
+        shape._set_derived_attributes()
+        return shape
+
     def trace(
             self, screen_size: Tuple[Number, Number] = None,
             screen_color: str = "white", exit_on_click: bool = False,
@@ -338,7 +565,9 @@ class _Trochoid(ABC):
             show_circles: bool = False, frame_pause: Number = 0,
             screen: "turtle.Screen" = None, circle_color: str = "black",
             show_full_path: bool = False, full_path_color: str = "grey",
-            repeat: bool = False, screen_coords = (0, 0), padding: Number = 100
+            repeat: bool = False, screen_coords = (0, 0), padding: Number = 100,
+            fps: Number = None, duration: Number = None,
+            turtles: "collections.namedtuple" = None
         ) -> "turtle.Screen":
         """
         Trace the shape using the turtle graphics library and return the turtle.Screen object.
@@ -365,6 +594,8 @@ class _Trochoid(ABC):
             If True, show the inner and outer circles that compose the trace, default is False.
         frame_pause : Number, optional
             The time in seconds to pause each individual frame, default is 0.
+            Without a pause or circles the path is drawn straight onto the
+            canvas in large chunks instead of point by point.
         screen : turtle.Screen, optional
             An existing turtle screen, default is None.
         circle_color : str, optional
@@ -380,6 +611,17 @@ class _Trochoid(ABC):
             Location of the screen coordinates
         padding : Number
             Padding on the outside of the image
+        fps : Number, optional
+            Frames per second to draw the path in. Frames are scheduled with
+            the screen's timer so the window stays responsive and frame_pause
+            is ignored. Default is 60 when duration is set.
+        duration : Number, optional
+            Time in seconds the path takes to draw, the number of points drawn
+            per frame is chosen to finish on time. Without a duration one
+            point is drawn per frame.
+        turtles : collections.namedtuple, optional
+            Turtles returned by a previous trace on the same screen to clear
+            and draw with instead of creating new turtles, default is None.
 
         Returns
         -------
@@ -393,10 +635,12 @@ class _Trochoid(ABC):
         >>> shape = Hypotrochoid(R=300, r=200, d=200, thetas=np.arange(0, 2*np.pi, .01))
         >>> screen = shape.trace(show_circles=True, exit_on_click=True)
         """
-        # pylint: disable=no-member,too-many-locals
+        # pylint: disable=no-member,too-many-locals,too-many-branches
         screen = self._init_screen(screen, screen_size, screen_color, screen_coords, padding)
         turtle.tracer(False)
-        turtles = self._init_turtles(color, circle_color, full_path_color, hide_turtle, width)
+        turtles = self._init_turtles(
+            color, circle_color, full_path_color, hide_turtle, width, turtles
+        )
 
         if show_full_path:
             self._show_full_path(pre_draw_turtle=turtles.pre_draw_turtle)
@@ -408,24 +652,43 @@ class _Trochoid(ABC):
                 radius=self.R
             )
 
+        overlay = None
+        if show_circles:
+            overlay = _RollingCircleOverlay(
+                turtles.rolling_circle_turtle,
+                self.r*np.hypot(self._affine[0, 0], self._affine[1, 0])
+            )
+
         while True:
+            if fps is not None or duration is not None:
+                self._trace_frames(turtles, overlay, 60 if fps is None else fps, duration)
+                if not repeat:
+                    break
+                continue
+            if frame_pause == 0 and not show_circles:
+                _draw_lines(
+                    turtles.shape_turtle,
+                    ((x, y) for x, y, _ in self.iter_chunks())
+                )
+                turtle.update()
+                if not repeat:
+                    break
+                continue
             first = True
             turtles.shape_turtle.up()
-            for x, y, theta in self.coords:
-                turtles.shape_turtle.goto(x, y)
+            for x_chunk, y_chunk, theta_chunk in self.iter_chunks():
                 if show_circles:
-                    self._trace_rolling_circle(
-                        turtles,
-                        x,
-                        y,
-                        theta
-                    )
-                if first:
-                    first = False
-                    turtles.shape_turtle.down()
-                if frame_pause > 0:
-                    turtle.update()
-                time.sleep(frame_pause)
+                    center_x, center_y = self._get_rolling_circle_centers(theta_chunk)
+                for index, (x, y) in enumerate(zip(x_chunk.tolist(), y_chunk.tolist())):
+                    turtles.shape_turtle.goto(x, y)
+                    if show_circles:
+                        overlay.move(center_x[index], center_y[index], x, y)
+                    if first:
+                        first = False
+                        turtles.shape_turtle.down()
+                    if frame_pause > 0:
+                        turtle.update()
+                    time.sleep(frame_pause)
             turtle.update()
             if not repeat:
                 break
@@ -434,6 +697,57 @@ class _Trochoid(ABC):
             turtle.exitonclick()
         return screen, turtles
 
+    def bounds(self, full_curve: bool = False) -> Tuple[Number, Number, Number, Number]:
+        """
+        Return the bounding box of the shape as (min_x, max_x, min_y, max_y).
+
+        By default the bounds are tight around the sampled thetas. If the
+        path hasn't been calculated yet i.e. a lazy shape, the bounds are
+        found by streaming the path in chunks without storing it. With
+        full_curve the bounds are calculated analytically from the input
+        parameters without calculating any of the path: the trace point is
+        never further than abs(R -/+ r) + d from the center of the fixed
+        circle, so the bounds are conservative for the full curve regardless
+        of thetas and orientation.
+
+        Parameters
+        ----------
+        full_curve : bool, optional
+            Return conservative analytic bounds of the full curve instead of
+            tight bounds of the sampled path, default is False.
+
+        Returns
+        -------
+        Tuple[Number, Number, Number, Number]
+            The minimum x, maximum x, minimum y and maximum y.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> shape = Hypotrochoid(R=300, r=200, d=100, theta_stop="closed", lazy=True)
+        >>> shape.bounds(full_curve=True)
+        (-200.0, 200.0, -200.0, 200.0)
+        """
+        if full_curve:
+            center_x, center_y = self._affine[0, 2], self._affine[1, 2]
+            factor = np.hypot(self._affine[0, 0], self._affine[1, 0])
+            radius = factor*(abs(self._circle_offset()) + self.d)
+            if self.noise is not None:
+                radius += max(np.abs(self.noise[0]).max(), np.abs(self.noise[1]).max())
+            return (
+                float(center_x - radius), float(center_x + radius),
+                float(center_y - radius), float(center_y + radius)
+            )
+        if self._has_path():
+            return self.min_x, self.max_x, self.min_y, self.max_y
+        chunk_bounds = np.array([
+            (x.min(), x.max(), y.min(), y.max()) for x, y, _ in self.iter_chunks()
+        ])
+        return (
+            chunk_bounds[:, 0].min(), chunk_bounds[:, 1].max(),
+            chunk_bounds[:, 2].min(), chunk_bounds[:, 3].max()
+        )
+
     def is_closed(self, tolerance: Number = 5) -> bool:
         """
         Return True if the shape is closed (i.e. if it returns to its starting
@@ -454,6 +768,110 @@ class _Trochoid(ABC):
         distance = np.linalg.norm(start_point - end_point)
         return distance < tolerance
 
+    def period(self, max_denominator: int = 10000) -> float:
+        """
+        Return the exact theta period after which the shape returns to its
+        starting point, derived from the rational ratio of R and r.
+
+        Parameters
+        ----------
+        max_denominator : int, optional
+            Largest denominator considered when approximating R/r as a
+            fraction, by default 10000.
+
+        Returns
+        -------
+        float
+            The smallest multiple of 2pi after which the path repeats.
+
+        Raises
+        ------
+        ValueError
+            If R/r is not rational within the given maximum denominator i.e.
+            the shape never closes.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> shape = Hypotrochoid(R=312, r=150, d=75, theta_stop="closed")
+        >>> shape.period() / np.pi
+        50.0
+        """
+        return _get_period(self.R, self.r, max_denominator)
+
+    @property
+    def closure_theta(self) -> float:
+        """Return the theta value at which the shape first returns to the
+        starting point of its thetas"""
+        return self.thetas[0] + self.period()
+
+    def iter_chunks(
+            self, chunk_size: int = 65536
+        ) -> Iterator[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+        """
+        Yield the path as fixed-size blocks of x, y and theta arrays.
+
+        Each block is calculated from its slice of thetas with the shape's
+        orientation, origin and noise applied, so a lazy shape can be
+        consumed without ever holding its full path in memory. Shapes whose
+        path has already been calculated yield slices of it instead.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of points in each block, the final block may be smaller.
+            Default is 65536.
+
+        Yields
+        ------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Blocks of x-values, y-values and thetas.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> import numpy as np
+        >>> shape = Hypotrochoid(R=300, r=200, d=200, thetas=np.arange(0, 1000, .0001), lazy=True)
+        >>> max_x = max(x.max() for x, y, thetas in shape.iter_chunks())
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        path_is_calculated = self._has_path()
+        for start in range(0, len(self.thetas), chunk_size):
+            stop = start + chunk_size
+            thetas = self.thetas[start:stop]
+            if path_is_calculated:
+                yield self.x[start:stop], self.y[start:stop], thetas
+                continue
+            if self._base_path is None:
+                base_x, base_y = self._calculate_base_path(thetas)
+            else:
+                base_x = self._base_path[0][start:stop]
+                base_y = self._base_path[1][start:stop]
+            x, y = _apply_affine(base_x, base_y, self._affine)
+            if self.noise is not None:
+                x = x + np.asarray(self.noise[0][start:stop], dtype=x.dtype)
+                y = y + np.asarray(self.noise[1][start:stop], dtype=y.dtype)
+            yield x, y, thetas
+
+    def iter_points(self, chunk_size: int = 65536) -> Iterator[Tuple[float, float, float]]:
+        """
+        Yield the path one (x, y, theta) point at a time, calculated in blocks
+        of chunk_size points so memory stays bounded however long the path is.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of points calculated at a time, default is 65536.
+
+        Yields
+        ------
+        Tuple[float, float, float]
+            The x-value, y-value and theta of each point.
+        """
+        for x, y, thetas in self.iter_chunks(chunk_size):
+            yield from zip(x.tolist(), y.tolist(), thetas.tolist())
+
     @classmethod
     def animate(
             cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
@@ -465,12 +883,19 @@ class _Trochoid(ABC):
             color: str = "black", width: Number = 1,
             frame_pause: Number = 0.1, screen: "turtle.Screen" = None, screen_coords = (0, 0),
             padding: Number = 100, repeat: bool = False, reverse: bool = False,
-            boomerang: bool = False
-        ) -> List["_Trochoid"]:
+            boomerang: bool = False, workers: int = None,
+            executor: "concurrent.futures.Executor" = None, fps: Number = None,
+            duration: Number = None
+        ) -> ShapeBatch:
         """
         Animate a sequence of _Trochoid shapes with varying input parameters,
         drawn one after the other.
 
+        The animation is traced on a turtle screen. To save it to an animated
+        GIF or PNG frames without a screen, create the shapes with create_range
+        and call save_gif or save_frames on the returned ShapeBatch instead
+        i.e. create_range(...).save_gif("animation.gif").
+
         Parameters
         ----------
         R : Union[Number, List[Number]]
@@ -487,11 +912,12 @@ class _Trochoid(ABC):
             Starting theta value for creating a list of thetas (similar syntax
             to built-in range or np.arange). This argument cannot be set at the
             same time as thetas argument.
-        theta_stop : Number, optional
+        theta_stop : Union[Number, str], optional
             Stop theta value for creating a list of thetas, stop value is not
             included in the final array (similar syntax to built-in range or
-            np.arange). This argument cannot be set at the same time as thetas
-            argument.
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of every shape. This argument cannot be set at the same
+            time as thetas argument.
         theta_step : Number, optional
             Incremental step value for stepping from start to stop
             (similar syntax to built-in range or np.arange). This argument
@@ -524,11 +950,19 @@ class _Trochoid(ABC):
             is False
         boomerang : bool, optional, default False
             If True, repeat the animation at the end in reverse, default is False
+        workers : int, optional
+            Number of processes to calculate the shapes in, see create_range.
+        executor : concurrent.futures.Executor, optional
+            Existing executor to calculate the shapes in, see create_range.
+        fps : Number, optional
+            Frames per second to trace each shape in, see trace.
+        duration : Number, optional
+            Time in seconds each shape takes to trace, see trace.
 
         Returns
         -------
-        shapes : List[_Trochoid]
-            A list of instantiated _Trochoid shapes with varying input parameters.
+        shapes : ShapeBatch
+            A sequence of instantiated _Trochoid shapes with varying input parameters.
 
         Examples
         --------
@@ -536,11 +970,14 @@ class _Trochoid(ABC):
         >>> import numpy as np
         >>> thetas = np.linspace(0, 2 * np.pi, num=1000)
         >>> shapes = Hypotrochoid.animate(R=10, r=[4, 5, 6], d=8, thetas=thetas)
+        >>> sweep = Hypotrochoid.create_range(R=10, r=[4, 5, 6], d=8, thetas=thetas)
+        >>> sweep.save_gif("animation.gif")
         """
         # pylint: disable=too-many-locals
         shapes_arr = cls.create_range(
             R, r, d, thetas, theta_start,
-            theta_stop, theta_step, origin
+            theta_stop, theta_step, origin,
+            workers=workers, executor=executor
         )
         screen_size = _get_animate_screen_size(shapes_arr, padding)
         _draw_animation(
@@ -548,7 +985,7 @@ class _Trochoid(ABC):
             screen_color=screen_color, exit_on_click=exit_on_click, color=color,
             width=width, frame_pause=frame_pause, screen=screen,
             screen_coords=screen_coords, padding=padding, repeat=repeat,
-            reverse=reverse, boomerang=boomerang
+            reverse=reverse, boomerang=boomerang, fps=fps, duration=duration
         )
         return shapes_arr
 
@@ -560,7 +997,8 @@ class _Trochoid(ABC):
 
         This property creates a pandas DataFrame with columns for the x and y
         coordinates, as well as the
-        angular positions (theta) of the parametrized shape.
+        angular positions (theta) of the parametrized shape. The DataFrame is
+        created on first access and cached for subsequent accesses.
 
         Raises
         ------
@@ -591,24 +1029,35 @@ class _Trochoid(ABC):
         #pylint: disable=line-too-long
         if pd is None:
             raise ImportError("pandas is required but is not installed on your machine, please install and try again")
-        df = pd.DataFrame({
-            "x": self.x,
-            "y": self.y,
-            "theta": self.thetas
-        })
-        return df
+        if self._df is None:
+            if self._has_path():
+                x, y = self.x, self.y
+            else:
+                x, y = self._collect_chunks()
+            self._df = pd.DataFrame({
+                "x": x,
+                "y": y,
+                "theta": self.thetas
+            })
+        return self._df
 
     @classmethod
     def create_range(
             cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
             d: Union[Number, List[Number]], thetas: List[Number] = None,
             theta_start: Number = None, theta_stop: Number = None,
-            theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0)
-        ) -> List["_Trochoid"]:
+            theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0),
+            dtype: "np.dtype" = None, workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> ShapeBatch:
         """
-        Return a list of instantiated shapes where one of the input parameters
+        Return a batch of instantiated shapes where one of the input parameters
         (R, r, or d) is a list of increments, and the rest are fixed.
 
+        Every shape's path is calculated at once as a 2-D (n_shapes, n_thetas)
+        array and indexing or iterating the returned ShapeBatch yields shapes
+        whose x and y values are views into that array.
+
         Parameters
         ----------
         R : Union[Number, List[Number]]
@@ -625,22 +1074,34 @@ class _Trochoid(ABC):
             Starting theta value for creating a list of thetas (similar syntax
             to built-in range or np.arange). This argument cannot be set at the
             same time as thetas argument.
-        theta_stop : Number, optional
+        theta_stop : Union[Number, str], optional
             Stop theta value for creating a list of thetas, stop value is not
             included in the final array (similar syntax to built-in range or
-            np.arange). This argument cannot be set at the same time as thetas
-            argument.
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of every shape. This argument cannot be set at the same
+            time as thetas argument.
         theta_step : Number, optional
             Incremental step value for stepping from start to stop
             (similar syntax to built-in range or np.arange). This argument
             cannot be set at the same time as thetas argument.
         origin : Tuple[Number, Number], optional, default (0, 0)
             Custom origin to center the shapes at. Default is (0,0).
+        dtype : np.dtype, optional
+            Floating point type used to calculate and store the paths i.e.
+            np.float32 to halve memory, default calculates in float64.
+        workers : int, optional
+            Number of processes to spread the calculation over in blocks of
+            shapes, -1 uses every CPU. Sweeps too small to benefit are
+            calculated serially, default calculates serially.
+        executor : concurrent.futures.Executor, optional
+            Existing executor i.e. a ProcessPoolExecutor to spread the
+            calculation over instead of starting a new process pool. It's
+            left running for the caller to shut down.
 
         Returns
         -------
-        shapes : List[_Trochoid]
-            A list of instantiated _Trochoid shapes with varying input parameters.
+        shapes : ShapeBatch
+            A sequence of instantiated _Trochoid shapes with varying input parameters.
 
         Raises
         ------
@@ -661,33 +1122,375 @@ class _Trochoid(ABC):
         _validate_only_one_iterable(R, r, d)
         input_params = _get_products_of_inputs(R, r, d)
 
-        shapes = []
-        for R, r, d in input_params:
-            shapes.append(cls(
-                R, r, d, thetas, theta_start, theta_stop, theta_step, origin
-            ))
+        R, r, d = zip(*input_params)
+        period = _get_period(R, r) if isinstance(theta_stop, str) else None
+        thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step, period, dtype)
+        shapes = ShapeBatch(
+            cls, R, r, d, thetas, origin, dtype=dtype,
+            workers=workers, executor=executor
+        )
         return shapes
 
+    @classmethod
+    def create_grid(
+            cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
+            d: Union[Number, List[Number]], thetas: List[Number] = None,
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
+            theta_step: Number = None,
+            origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0),
+            orientation: Union[Number, List[Number]] = 0, dtype: "np.dtype" = None,
+            workers: int = None, executor: "concurrent.futures.Executor" = None
+        ) -> ShapeBatch:
+        """
+        Return a batch of instantiated shapes for every combination of the
+        input parameters, origins and orientations, any of which can be a list
+        of values.
+
+        Unlike create_range, more than one input can vary. Shapes are ordered
+        like nested loops over R, r, d, origin and orientation with the last
+        input varying fastest. See iter_grid to stream grids too large to hold
+        in memory at once.
+
+        Parameters
+        ----------
+        R : Union[Number, List[Number]]
+            Radius of the fixed circle.
+        r : Union[Number, List[Number]]
+            Radius of the rolling circle.
+        d : Union[Number, List[Number]]
+            Distance of the trace point from the rolling circle.
+        thetas : List[Number], optional
+            Input list of values for theta for inputting into parametric
+            equations. This argument cannot be set at the same time as
+            theta_start, theta_stop, theta_step.
+        theta_start : Number, optional
+            Starting theta value for creating a list of thetas (similar syntax
+            to built-in range or np.arange). This argument cannot be set at the
+            same time as thetas argument.
+        theta_stop : Union[Number, str], optional
+            Stop theta value for creating a list of thetas, stop value is not
+            included in the final array (similar syntax to built-in range or
+            np.arange). Pass "closed" to create thetas spanning exactly one
+            period of every shape in the grid. This argument cannot be set at
+            the same time as thetas argument.
+        theta_step : Number, optional
+            Incremental step value for stepping from start to stop
+            (similar syntax to built-in range or np.arange). This argument
+            cannot be set at the same time as thetas argument.
+        origin : Union[Tuple[Number, Number], List[Tuple[Number, Number]]], optional
+            Custom origin or list of origins to center the shapes at. Default
+            is (0,0).
+        orientation : Union[Number, List[Number]], optional
+            Angle or list of angles of rotation, default is 0.
+        dtype : np.dtype, optional
+            Floating point type used to calculate and store the paths i.e.
+            np.float32 to halve memory, default calculates in float64.
+        workers : int, optional
+            Number of processes to spread the calculation over, see
+            create_range.
+        executor : concurrent.futures.Executor, optional
+            Existing executor to spread the calculation over, see create_range.
+
+        Returns
+        -------
+        shapes : ShapeBatch
+            A sequence of instantiated shapes, one per combination of inputs.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> import numpy as np
+        >>> thetas = np.linspace(0, 2 * np.pi, num=1000)
+        >>> shapes = Hypotrochoid.create_grid(R=[10, 11], r=[4, 5, 6], d=[7, 8], thetas=thetas)
+        >>> len(shapes)
+        12
+        """
+        # pylint: disable=too-many-arguments,invalid-name
+        period = _get_grid_period(R, r) if isinstance(theta_stop, str) else None
+        thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step, period, dtype)
+        return next(cls._iter_grid_batches(
+            R, r, d, thetas, origin, orientation, dtype,
+            workers=workers, executor=executor
+        ))
+
+    @classmethod
+    def iter_grid(
+            cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
+            d: Union[Number, List[Number]], thetas: List[Number] = None,
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
+            theta_step: Number = None,
+            origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]] = (0, 0),
+            orientation: Union[Number, List[Number]] = 0, dtype: "np.dtype" = None,
+            block_size: int = None, workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> Iterator[ShapeBatch]:
+        """
+        Yield the shapes of create_grid in consecutive batches of at most
+        block_size shapes so arbitrarily large grids are calculated in bounded
+        memory.
+
+        Parameters
+        ----------
+        R, r, d, thetas, theta_start, theta_stop, theta_step, origin, orientation, dtype
+            See create_grid.
+        block_size : int, optional
+            Largest number of shapes per yielded batch. Default fits roughly
+            four million points in each batch.
+        workers : int, optional
+            Number of processes to spread each batch's calculation over, see
+            create_range.
+        executor : concurrent.futures.Executor, optional
+            Existing executor to spread each batch's calculation over, see
+            create_range.
+
+        Yields
+        ------
+        shapes : ShapeBatch
+            The next block of shapes in create_grid's order.
+
+        Examples
+        --------
+        >>> from spyrograph import Hypotrochoid
+        >>> import numpy as np
+        >>> thetas = np.linspace(0, 2 * np.pi, num=1000)
+        >>> grid = Hypotrochoid.iter_grid(
+        ...     R=range(10, 20), r=range(1, 10), d=range(1, 10), thetas=thetas,
+        ...     block_size=100
+        ... )
+        >>> for shapes in grid:
+        ...     print(len(shapes))
+        """
+        # pylint: disable=too-many-arguments,invalid-name,line-too-long
+        period = _get_grid_period(R, r) if isinstance(theta_stop, str) else None
+        thetas = _validate_theta(thetas, theta_start, theta_stop, theta_step, period, dtype)
+        if block_size is None:
+            block_size = max(1, _GRID_BLOCK_POINTS//len(thetas))
+        yield from cls._iter_grid_batches(
+            R, r, d, thetas, origin, orientation, dtype,
+            block_size, workers, executor
+        )
+
+    @classmethod
+    def _iter_grid_batches(
+            cls, R: Union[Number, List[Number]], r: Union[Number, List[Number]],
+            d: Union[Number, List[Number], None], thetas: "np.ndarray",
+            origin: Union[Tuple[Number, Number], List[Tuple[Number, Number]]],
+            orientation: Union[Number, List[Number]], dtype: "np.dtype",
+            block_size: int = None, workers: int = None,
+            executor: "concurrent.futures.Executor" = None
+        ) -> Iterator[ShapeBatch]:
+        """Yield batches of the Cartesian product of the inputs at the given
+        validated thetas, the whole grid at once when there's no block_size.
+        When d is None it follows r i.e. for cycloids"""
+        # pylint: disable=too-many-arguments,invalid-name,too-many-locals
+        params = [R, r] if d is None else [R, r, d]
+        for block in _iter_grid_params(params, origin, orientation, block_size):
+            *block_params, block_origin, block_orientation = block
+            block_R, block_r = block_params[:2]
+            block_d = block_r if d is None else block_params[2]
+            yield ShapeBatch(
+                cls, block_R, block_r, block_d, thetas, block_origin,
+                block_orientation, dtype=dtype, workers=workers, executor=executor
+            )
+
     def _calculate_path(self) -> None:
         """Calculate the parametrized path"""
-        self.x = np.array([self._calculate_x(theta) for theta in self.thetas])
-        self.y = np.array([self._calculate_y(theta) for theta in self.thetas])
-        self.x, self.y = _apply_rotation(self.x, self.y, self.orientation)
-        self.x += self.origin[0]
-        self.y += self.origin[1]
+        if self._archive is not None:
+            self._set_archived_path()
+            return
+        if self._base_path is None:
+            self._base_path = self._get_cached_base_path()
+        x, y = _apply_affine(*self._base_path, self._affine)
+        self._set_path(x, y)
+
+    def _has_path(self) -> bool:
+        """Return whether the path is calculated or saved to the shape's
+        archive so it can be viewed instead of calculated"""
+        return "x" in self.__dict__ or self._archive is not None
+
+    def _set_archived_path(self) -> None:
+        """Set the path attributes from the path saved to the shape's archive
+        which already has the noise, orientation and origin applied"""
+        # pylint: disable=attribute-defined-outside-init
+        x = self._archive["x"]
+        y = self._archive["y"]
         if self.noise is None:
             self.noise = [
-                np.zeros(len(self.x)),
-                np.zeros(len(self.y))
+                np.zeros(len(self.thetas), dtype=x.dtype),
+                np.zeros(len(self.thetas), dtype=y.dtype)
             ]
-        # self.noise = _apply_rotation(self.noise[0], self.noise[1], self.orientation)
-        self.x += self.noise[0]
-        self.y += self.noise[1]
-        self.min_x = min(self.x)
-        self.max_x = max(self.x)
-        self.min_y = min(self.y)
-        self.max_y = max(self.y)
-        self.coords = list(zip(self.x + self.noise[0], self.y+self.noise[1], self.thetas))
+        self.x = x
+        self.y = y
+        self.min_x = x.min()
+        self.max_x = x.max()
+        self.min_y = y.min()
+        self.max_y = y.max()
+        self._archive = None
+
+    def _collect_chunks(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return x- and y-values collected from iter_chunks into preallocated
+        arrays without storing them on the shape"""
+        x = np.empty(len(self.thetas), dtype=self._get_path_dtype())
+        y = np.empty(len(self.thetas), dtype=self._get_path_dtype())
+        start = 0
+        for x_chunk, y_chunk, _ in self.iter_chunks():
+            stop = start + len(x_chunk)
+            x[start:stop] = x_chunk
+            y[start:stop] = y_chunk
+            start = stop
+        return x, y
+
+    def _calculate_base_path(self, thetas: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the untransformed parametrized path at the given thetas in
+        the shape's dtype"""
+        x, y = self._calculate_xy(self.R, self.r, self.d, thetas)
+        path_dtype = self._get_path_dtype()
+        return x.astype(path_dtype, copy=False), y.astype(path_dtype, copy=False)
+
+    def _get_cached_base_path(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the untransformed path at the shape's thetas from the path
+        cache when it's enabled, calculating and caching it on a miss"""
+        if not _PATH_CACHE.enabled:
+            return self._calculate_base_path(self.thetas)
+        key = _get_path_key(
+            self.__class__, self.R, self.r, self.d,
+            _get_thetas_fingerprint(self.thetas), self._get_path_dtype()
+        )
+        base_path = _PATH_CACHE.get(key)
+        if base_path is None:
+            base_path = _PATH_CACHE.put(
+                key, self._calculate_base_path(self.thetas), copy=False
+            )
+        return base_path
+
+    def _get_path_dtype(self) -> "np.dtype":
+        """Return the floating point type of the shape's calculated path"""
+        if self.dtype is None:
+            return np.float64
+        return self.dtype
+
+    def _get_adaptive_theta_step(
+            self, thetas: List[Number], theta_step: Number,
+            noise: List["np.array"] = None
+        ) -> Number:
+        """Return the initial coarse theta step for adaptive sampling. By
+        default each step covers at most 1/16th of a revolution of the fastest
+        term in the parametric equations"""
+        if thetas is not None:
+            raise ValueError((
+                "theta_tolerance adaptively samples a range of thetas and "
+                "cannot be set at the same time as thetas - please define "
+                "theta_start and theta_stop instead."
+            ))
+        if noise is not None:
+            raise ValueError((
+                "theta_tolerance chooses the number of thetas so it cannot be "
+                "set at the same time as noise - please add noise to the "
+                "shape afterwards with add_noise instead."
+            ))
+        if theta_step is None:
+            rolling_frequency = abs(self._circle_offset()/self.r)
+            theta_step = 2*math.pi/(16*max(1, rolling_frequency))
+        return theta_step
+
+    def _refine_thetas(self, tolerance: Number) -> None:
+        """Refine the thetas where the path deviates from the chord between
+        consecutive points by more than the tolerance and keep the calculated
+        untransformed path for reuse"""
+        self.thetas, self._base_path = _get_adaptive_thetas(
+            self.thetas,
+            self._calculate_base_path,
+            tolerance
+        )
+
+    def _transform(self, matrix: "np.ndarray", **attributes) -> "_Trochoid":
+        """Return a copy of the shape with the given attributes updated whose
+        path is this shape's untransformed path with the given affine matrix
+        composed onto the shape's own matrix"""
+        # pylint: disable=protected-access
+        shape = copy.copy(self)
+        for attribute in _PATH_ATTRIBUTES:
+            shape.__dict__.pop(attribute, None)
+        shape.__dict__.update(attributes)
+        shape._df = None
+        shape._archive = None
+        shape._affine = matrix @ self._affine
+        shape._validate_inputs()
+        if not shape.lazy:
+            shape._calculate_path()
+        return shape
+
+    def _about_origin(self, matrix: "np.ndarray") -> "np.ndarray":
+        """Return the given affine matrix applied about the shape's origin
+        rather than about (0, 0)"""
+        to_origin = _get_affine_matrix(origin=(-self.origin[0], -self.origin[1]))
+        from_origin = _get_affine_matrix(origin=self.origin)
+        return from_origin @ matrix @ to_origin
+
+    def _set_path(
+            self, x: "np.ndarray", y: "np.ndarray", set_coords: bool = True
+        ) -> None:
+        """Set the path attributes from calculated x- and y-values that
+        already have the shape's orientation and origin applied. coords is a
+        compact (n, 3) array of x, y and theta and x and y are views of its
+        first two columns so the path is only stored once"""
+        # pylint: disable=attribute-defined-outside-init
+        if self.noise is None:
+            self.noise = [
+                np.zeros(len(x), dtype=x.dtype),
+                np.zeros(len(y), dtype=y.dtype)
+            ]
+        else:
+            x = x + np.asarray(self.noise[0], dtype=x.dtype)
+            y = y + np.asarray(self.noise[1], dtype=y.dtype)
+        if set_coords:
+            self.coords = np.empty((len(x), 3), dtype=np.result_type(x, y))
+            self.coords[:, 0] = x
+            self.coords[:, 1] = y
+            self.coords[:, 2] = self.thetas
+            x = self.coords[:, 0]
+            y = self.coords[:, 1]
+        self.x = x
+        self.y = y
+        self.min_x = self.x.min()
+        self.max_x = self.x.max()
+        self.min_y = self.y.min()
+        self.max_y = self.y.max()
+
+    @classmethod
+    def _from_path(
+            cls, R: Number, r: Number, d: Number, thetas: "np.ndarray",
+            origin: Tuple[Number, Number], orientation: Number,
+            x: "np.ndarray", y: "np.ndarray", dtype: "np.dtype" = None,
+            base_path: Tuple["np.ndarray", "np.ndarray"] = None
+        ) -> "_Trochoid":
+        """Return a shape from an already calculated path without evaluating
+        the parametric equations again i.e. a row of a ShapeBatch. base_path
+        is the untransformed path reused by later transforms"""
+        # pylint: disable=too-many-arguments
+        shape = cls.__new__(cls)
+        shape.R = R
+        shape.r = r
+        shape.d = d
+        shape.dtype = dtype
+        shape.thetas = thetas
+        shape.origin = origin
+        shape.orientation = orientation
+        shape.noise = None
+        shape.lazy = False
+        shape._df = None
+        shape._base_path = base_path
+        shape._archive = None
+        shape._affine = _get_affine_matrix(origin, orientation)
+        shape._set_path(x, y, set_coords=False)
+        shape._set_derived_attributes()
+        return shape
+
+    def _set_derived_attributes(self) -> None:
+        """Set attributes calculated from the input parameters. Subclasses
+        with extra attributes override it so shapes built without __init__,
+        i.e. rows of a ShapeBatch or shapes loaded from an archive, have them
+        too"""
 
     def _validate_inputs(self) -> None:
         """Validate input parameters"""
@@ -699,14 +1502,8 @@ class _Trochoid(ABC):
 
     def _show_full_path(self, pre_draw_turtle: "turtle.Turtle") -> turtle.Turtle:
         """Draw the full path prior to tracing"""
-        # pylint: disable=no-member, unused-variable
-        first = True
-        pre_draw_turtle.up()
-        for x, y, theta in self.coords:
-            pre_draw_turtle.goto(x, y)
-            if first:
-                first = False
-                pre_draw_turtle.down()
+        # pylint: disable=no-member
+        _draw_lines(pre_draw_turtle, ((x, y) for x, y, _ in self.iter_chunks()))
         turtle.update()
         return pre_draw_turtle
 
@@ -718,9 +1515,10 @@ class _Trochoid(ABC):
         if screen is None:
             screen = turtle.Screen()
             if screen_size is None:
+                min_x, max_x, min_y, max_y = self.bounds()
                 screen_size = (
-                    self.max_x - self.min_x + padding,
-                    self.max_y - self.min_y + padding
+                    max_x - min_x + padding,
+                    max_y - min_y + padding
                 )
             screen.setup(*screen_size)
             screen.bgcolor(screen_color)
@@ -731,7 +1529,7 @@ class _Trochoid(ABC):
 
     def _init_turtles(
             self, color: str, circle_color: str, full_path_color: str,
-            hide_turtle: bool, width: Number
+            hide_turtle: bool, width: Number, turtles: "collections.namedtuple" = None
         ) -> Tuple["turtle.Turtle", "turtle.Turtle", "turtle.Turtle", "turtle.Turtle"]:
         """
         Initialize four turtle objects with the specified color, width, and visibility.
@@ -741,37 +1539,42 @@ class _Trochoid(ABC):
         - rolling_circle_turtle: a turtle used for drawing a rolling circle.
         - fixed_circle_turtle: a turtle used for drawing a fixed circle.
         - pre_draw_turtle: a turtle used for drawing the full path.
+
+        When turtles from a previous trace are passed in, their drawings are
+        cleared and they're restyled instead of creating new turtles so a
+        screen keeps a fixed set of turtles.
         """
 
-        # Instantiate turtle
-        shape_turtle = turtle.Turtle()
-        rolling_circle_turtle = turtle.Turtle()
-        fixed_circle_turtle = turtle.Turtle()
-        pre_draw_turtle = turtle.Turtle()
+        if turtles is None:
+            # Instantiate turtle
+            turtles = self._create_turtles_namedtuple(
+                turtle.Turtle(),
+                turtle.Turtle(),
+                turtle.Turtle(),
+                turtle.Turtle()
+            )
+        else:
+            for reused_turtle in turtles:
+                reused_turtle.clear()
+                reused_turtle.up()
 
         # Hide circle turtles
         if hide_turtle:
-            shape_turtle.hideturtle()
-        rolling_circle_turtle.hideturtle()
-        fixed_circle_turtle.hideturtle()
-        pre_draw_turtle.hideturtle()
+            turtles.shape_turtle.hideturtle()
+        else:
+            turtles.shape_turtle.showturtle()
+        turtles.rolling_circle_turtle.hideturtle()
+        turtles.fixed_circle_turtle.hideturtle()
+        turtles.pre_draw_turtle.hideturtle()
 
         # Set turtle color
-        shape_turtle.color(color)
-        rolling_circle_turtle.color(circle_color)
-        fixed_circle_turtle.color(circle_color)
-        pre_draw_turtle.color(full_path_color)
+        turtles.shape_turtle.color(color)
+        turtles.rolling_circle_turtle.color(circle_color)
+        turtles.fixed_circle_turtle.color(circle_color)
+        turtles.pre_draw_turtle.color(full_path_color)
 
         # Set turtle width
-        shape_turtle.width(width)
-
-        # Store turtle's in namedtuple
-        turtles = self._create_turtles_namedtuple(
-            shape_turtle,
-            rolling_circle_turtle,
-            fixed_circle_turtle,
-            pre_draw_turtle
-        )
+        turtles.shape_turtle.width(width)
 
         return turtles
 
@@ -781,16 +1584,7 @@ class _Trochoid(ABC):
             fixed_circle_turtle: "turtle.Turtle", pre_draw_turtle: "turtle.Turtle"
         ) -> "collections.namedtuple":
         """Return namedtuple containing turtles"""
-        TraceTurtles = collections.namedtuple(
-            "TraceTurtles",
-            [
-                "shape_turtle",
-                "pre_draw_turtle",
-                "rolling_circle_turtle",
-                "fixed_circle_turtle"
-            ]
-        )
-        turtles = TraceTurtles(
+        turtles = _TraceTurtles(
             shape_turtle,
             pre_draw_turtle,
             rolling_circle_turtle,
@@ -798,31 +1592,44 @@ class _Trochoid(ABC):
         )
         return turtles
 
-    def _trace_rolling_circle(
+    def _trace_frames(
             self, turtles: "collections.namedtuple",
-            x: Number, y: Number, theta: Number
+            overlay: _RollingCircleOverlay, fps: Number, duration: Number = None
         ) -> None:
-        """Trace the inner circle of the animation"""
-        self._rolling_circle_init(turtles.rolling_circle_turtle)
-        self._draw_dot(turtles.rolling_circle_turtle, x, y, "red")
-        rolling_circle_x, rolling_circle_y = self._draw_rolling_circle(
-            turtles.rolling_circle_turtle, theta
-        )
-        self._draw_dot(
-            t=turtles.rolling_circle_turtle,
-            x=rolling_circle_x,
-            y=rolling_circle_y + self.r,
-            color="blue"
+        """Trace the path in frames scheduled at fps, drawing every point of
+        a frame as one canvas line and moving the rolling circle overlay to
+        the frame's last point"""
+        # pylint: disable=protected-access
+        n_points = len(self.thetas)
+        points_per_frame = _get_points_per_frame(n_points, fps, duration)
+        x, y = self.x, self.y
+        if overlay is not None:
+            center_x, center_y = self._get_rolling_circle_centers(self.thetas)
+        drawn = 0
+
+        def draw_until(count: int) -> None:
+            """Draw the points up to count continuing from the last frame"""
+            nonlocal drawn
+            start = max(drawn - 1, 0)
+            _draw_lines(turtles.shape_turtle, [(x[start:count], y[start:count])])
+            if overlay is not None:
+                overlay.move(center_x[count - 1], center_y[count - 1], x[count - 1], y[count - 1])
+            drawn = count
+
+        _run_frames(
+            turtles.shape_turtle.screen, draw_until, n_points, points_per_frame, fps
         )
-        self._connect_focus_to_trace_dots(turtles)
 
-    def _connect_focus_to_trace_dots(self, turtles: "collections.namedtuple") -> None:
-        """Draw line from focus to the trace that's drawing the shape"""
-        turtles.rolling_circle_turtle.down()
-        turtles.rolling_circle_turtle.seth(
-            turtles.rolling_circle_turtle.towards(turtles.shape_turtle)
+    def _get_rolling_circle_centers(
+            self, thetas: "np.ndarray"
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the centers of the rolling circle at every theta with the
+        shape's transforms applied"""
+        offset = self._circle_offset()
+        center_x, center_y = _apply_affine(
+            offset*np.cos(thetas), offset*np.sin(thetas), self._affine
         )
-        turtles.rolling_circle_turtle.fd(self.d)
+        return center_x.tolist(), center_y.tolist()
 
     def _draw_circle(
             self, t: "turtle.Turtle", x: float, y: float, radius: float
@@ -844,32 +1651,6 @@ class _Trochoid(ABC):
         t.down()
         t.circle(radius, steps=200)
 
-    def _draw_rolling_circle(self, t: "turtle.Turtle", theta: Number) -> Tuple[Number, Number]:
-        """Returns x and y coordinates for a rolling circle"""
-        x=self._circle_offset()*math.cos(theta) + self.origin[0]
-        y=self._circle_offset()*math.sin(theta) - self.r + self.origin[1]
-        self._draw_circle(
-            t=t,
-            x=x,
-            y=y,
-            radius=self.r
-        )
-        return x, y
-
-    def _draw_dot(
-            self, t: "turtle.Turtle", x: Number, y: Number, color: str
-        ) -> None:
-        """Draw rolling circle outer trace"""
-        t.up()
-        t.goto(x, y)
-        t.dot(10, color)
-
-    def _rolling_circle_init(self, t: "turtle.Turtle") -> None:
-        """Set iteration's initial conditions for rolling circle"""
-        t.clear()
-        t.seth(0)
-        t.up()
-
     @abstractmethod
     def _circle_offset(self) -> float:
         """Return rolling circle offset from fixed circle"""
@@ -882,6 +1663,15 @@ class _Trochoid(ABC):
     def _calculate_y(self, theta: Number) -> float:
         """Return calculated y-value from parametrized equation"""
 
+    @staticmethod
+    @abstractmethod
+    def _calculate_xy(
+            R: "np.ndarray", r: "np.ndarray", d: "np.ndarray", thetas: "np.ndarray"
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return calculated x- and y-values from parametrized equation for an
+        entire array of thetas. The inputs are broadcast against each other so
+        the scalar _calculate_x and _calculate_y remain the reference path"""
+
     def __repr__(self) -> str:
         """Return formatted string with useful information about the current object"""
         # pylint: disable=line-too-long
@@ -4,6 +4,9 @@ attached to a circle rolling around the exterior of a fixed circle
 
 import math
 from numbers import Number
+from typing import Tuple
+
+import numpy as np
 
 from spyrograph.core._trochoid import _Trochoid
 
@@ -37,3 +40,15 @@ class Epitrochoid(_Trochoid):
         """Return calculated y-value from parametrized equation"""
         # pylint: disable=line-too-long\
         return self._circle_offset()*math.sin(theta) - self.d*math.sin((self._circle_offset()/self.r)*theta)
+
+    @staticmethod
+    def _calculate_xy(
+            R: "np.ndarray", r: "np.ndarray", d: "np.ndarray", thetas: "np.ndarray"
+        ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return calculated x- and y-values from parametrized equation for an
+        entire array of thetas in a single vectorized pass"""
+        circle_offset = R + r
+        rolling_thetas = (circle_offset/r)*thetas
+        x = circle_offset*np.cos(thetas) - d*np.cos(rolling_thetas)
+        y = circle_offset*np.sin(thetas) - d*np.sin(rolling_thetas)
+        return x, y
@@ -2,7 +2,7 @@
 where the fixed circle radius equals that of the rolling circle.
 """
 
-from typing import List
+from typing import List, Tuple, Union
 from numbers import Number
 
 from spyrograph.epitrochoid.epicycloid import Epicycloid
@@ -13,7 +13,14 @@ class Cardioid(Epicycloid):
     """
     def __init__(
             self, R: Number, thetas: List[Number] = None,
-            theta_start: Number = None, theta_stop: Number = None,
-            theta_step: Number = None
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
+            theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0),
+            orientation: Number = 0, noise: List["np.array"] = None,
+            lazy: bool = False, theta_tolerance: Number = None,
+            dtype: "np.dtype" = None
         ) -> None:
-        super().__init__(R, R, thetas, theta_start, theta_stop, theta_step)
+        super().__init__(
+            R, R, thetas, theta_start, theta_stop, theta_step,
+            origin=origin, orientation=orientation, noise=noise, lazy=lazy,
+            theta_tolerance=theta_tolerance, dtype=dtype
+        )
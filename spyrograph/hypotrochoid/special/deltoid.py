@@ -3,7 +3,7 @@ rolling circle has 1/3 the radius of the fixed circle and the distance traced
 from the rolling circle is equal to the radius of the rolling circle"""
 
 from numbers import Number
-from typing import List
+from typing import List, Tuple, Union
 
 from spyrograph.hypotrochoid.hypocycloid import Hypocycloid
 
@@ -13,7 +13,14 @@ class Deltoid(Hypocycloid):
     """
     def __init__(
             self, R: Number, thetas: List[Number] = None,
-            theta_start: Number = None, theta_stop: Number = None,
-            theta_step: Number = None
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
+            theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0),
+            orientation: Number = 0, noise: List["np.array"] = None,
+            lazy: bool = False, theta_tolerance: Number = None,
+            dtype: "np.dtype" = None
         ) -> None:
-        super().__init__(R, R/3, thetas, theta_start, theta_stop, theta_step)
+        super().__init__(
+            R, R/3, thetas, theta_start, theta_stop, theta_step,
+            origin=origin, orientation=orientation, noise=noise, lazy=lazy,
+            theta_tolerance=theta_tolerance, dtype=dtype
+        )
@@ -4,7 +4,7 @@ from the rolling circle is not equal to the radius of the rolling circle"""
 
 import math
 from numbers import Number
-from typing import List
+from typing import List, Tuple, Union
 
 from spyrograph.hypotrochoid.hypotrochoid import Hypotrochoid
 
@@ -14,8 +14,20 @@ class Ellipse(Hypotrochoid):
     """
     def __init__(
             self, R: Number, d: Number, thetas: List[Number] = None,
-            theta_start: Number = None, theta_stop: Number = None,
-            theta_step: Number = None) -> None:
-        super().__init__(R, R/2, d, thetas, theta_start, theta_stop, theta_step)
+            theta_start: Number = None, theta_stop: Union[Number, str] = None,
+            theta_step: Number = None, origin: Tuple[Number, Number] = (0, 0),
+            orientation: Number = 0, noise: List["np.array"] = None,
+            lazy: bool = False, theta_tolerance: Number = None,
+            dtype: "np.dtype" = None
+        ) -> None:
+        super().__init__(
+            R, R/2, d, thetas, theta_start, theta_stop, theta_step,
+            origin=origin, orientation=orientation, noise=noise, lazy=lazy,
+            theta_tolerance=theta_tolerance, dtype=dtype
+        )
 
+        self._set_derived_attributes()
+
+    def _set_derived_attributes(self) -> None:
+        """Set the eccentricity of the ellipse"""
         self.eccentricity = (2*math.sqrt(self.d/self.r))/(1 + (self.d/self.r))
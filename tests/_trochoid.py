@@ -1,10 +1,18 @@
+import concurrent.futures
+import re
+import xml.etree.ElementTree
+
 import pytest
 
 import numpy as np
 import pandas as pd
+import matplotlib.pyplot as plt
 
 from spyrograph.core._trochoid import _Trochoid
 from spyrograph.core._cycloid import _Cycloid
+from spyrograph.core._batch import ShapeBatch
+import spyrograph
+import spyrograph.core._batch
 
 class _TestGeneral:
     # Define this class attr in subclasses
@@ -215,6 +223,40 @@ class _TestGeneral:
         assert len(shapes) == 1
         assert isinstance(shapes[0], self.class_name)
 
+    def test_create_range_batch_matches_individual_shapes(self, thetas):
+        """Test that the batched paths match shapes instantiated one at a time"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas, origin=(10, -20))
+            individual_shapes = [
+                self.class_name(R, 3, thetas, origin=(10, -20)) for R in [5, 6, 7]
+            ]
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas, origin=(10, -20))
+            individual_shapes = [
+                self.class_name(R, 3, 2, thetas, origin=(10, -20)) for R in [5, 6, 7]
+            ]
+        assert isinstance(shapes, ShapeBatch)
+        assert shapes.x.shape == (3, len(thetas))
+        for shape, individual_shape in zip(shapes, individual_shapes):
+            assert isinstance(shape, self.class_name)
+            assert shape.R == individual_shape.R
+            assert shape.origin == individual_shape.origin
+            assert np.allclose(shape.x, individual_shape.x)
+            assert np.allclose(shape.y, individual_shape.y)
+            assert np.allclose(shape.coords, individual_shape.coords)
+            assert shape.min_x == pytest.approx(individual_shape.min_x)
+
+    def test_create_range_batch_slicing(self, thetas):
+        """Test that slicing a batch returns a batch of views in the same order"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas)
+        reversed_shapes = shapes[::-1]
+        assert isinstance(reversed_shapes, ShapeBatch)
+        assert [shape.R for shape in reversed_shapes] == [7, 6, 5]
+        assert np.shares_memory(reversed_shapes[0].x, shapes.x)
+
     def test_create_range_multiple_arguments_exception(self, thetas):
         """Test that passing multiple parameters raises an error"""
         with pytest.raises(ValueError):
@@ -328,8 +370,32 @@ class _TestGeneral:
 
     def test_coords(self, instance) -> None:
         """Test that coordinates attribute matches x, y, and theta values"""
-        assert instance.coords[0] == (instance.x[0], instance.y[0], instance.thetas[0])
-        assert instance.coords[-1] == (instance.x[-1], instance.y[-1], instance.thetas[-1])
+        assert tuple(instance.coords[0]) == (instance.x[0], instance.y[0], instance.thetas[0])
+        assert tuple(instance.coords[-1]) == (instance.x[-1], instance.y[-1], instance.thetas[-1])
+
+    def test_coords_is_compact_array_sharing_path(self, instance) -> None:
+        """Test that coords is an (n, 3) array whose columns are x and y"""
+        noisy_instance = instance.add_noise(x_scale=2, y_scale=2)
+        for shape in [instance, noisy_instance]:
+            assert shape.coords.shape == (len(shape.thetas), 3)
+            assert np.shares_memory(shape.coords, shape.x)
+            assert np.shares_memory(shape.coords, shape.y)
+            assert np.array_equal(shape.coords[:, 2], shape.thetas)
+            for (x, y, theta), expected_x in zip(shape.coords, shape.x):
+                assert x == expected_x
+        assert np.allclose(noisy_instance.x, instance.x + noisy_instance.noise[0])
+
+    def test_vectorized_path_matches_scalar_path(self, instance) -> None:
+        """Test that the vectorized kernel matches the scalar parametric equations"""
+        scalar_x = np.array([instance._calculate_x(theta) for theta in instance.thetas])
+        scalar_y = np.array([instance._calculate_y(theta) for theta in instance.thetas])
+        vector_x, vector_y = instance._calculate_xy(
+            instance.R, instance.r, instance.d, instance.thetas
+        )
+        assert np.allclose(vector_x, scalar_x)
+        assert np.allclose(vector_y, scalar_y)
+        assert np.allclose(instance.x, scalar_x)
+        assert np.allclose(instance.y, scalar_y)
 
     def test_dataframe_property(self, instance) -> None:
         """Test that DataFrame property is working as expected"""
@@ -339,6 +405,81 @@ class _TestGeneral:
         assert all(instance.df["y"].to_numpy() == instance.y)
         assert all(instance.df["theta"].to_numpy() == instance.thetas)
 
+    def test_dataframe_property_is_cached(self, instance) -> None:
+        """Test that the DataFrame is only created once per shape"""
+        assert instance.df is instance.df
+
+    def test_lazy_path_is_deferred_until_access(self, thetas) -> None:
+        """Test that a lazy shape only calculates its path on first access"""
+        if issubclass(self.class_name, _Cycloid):
+            eager_shape = self.class_name(R=300, r=200, thetas=thetas)
+            lazy_shape = self.class_name(R=300, r=200, thetas=thetas, lazy=True)
+        elif issubclass(self.class_name, _Trochoid):
+            eager_shape = self.class_name(R=300, r=200, d=100, thetas=thetas)
+            lazy_shape = self.class_name(R=300, r=200, d=100, thetas=thetas, lazy=True)
+        assert "x" not in vars(lazy_shape)
+        assert isinstance(repr(lazy_shape), str)
+        assert lazy_shape.max_x == eager_shape.max_x
+        assert "x" in vars(lazy_shape)
+        assert np.array_equal(lazy_shape.x, eager_shape.x)
+        assert np.array_equal(lazy_shape.y, eager_shape.y)
+        assert np.array_equal(lazy_shape.coords, eager_shape.coords)
+
+    def test_lazy_is_preserved_by_transforms(self, thetas) -> None:
+        """Test that transforming a lazy shape returns a lazy shape"""
+        if issubclass(self.class_name, _Cycloid):
+            lazy_shape = self.class_name(R=300, r=200, thetas=thetas, lazy=True)
+        elif issubclass(self.class_name, _Trochoid):
+            lazy_shape = self.class_name(R=300, r=200, d=100, thetas=thetas, lazy=True)
+        transformed_shape = lazy_shape.rotate(1).translate(10, 10).scale(2)
+        assert transformed_shape.lazy
+        assert "x" not in vars(transformed_shape)
+        assert "x" not in vars(lazy_shape)
+
+    def test_transforms_match_recalculated_shape(self, thetas) -> None:
+        """Test that chained transforms match a shape calculated from scratch"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=200, thetas=thetas, origin=(10, 20))
+            expected_shape = self.class_name(
+                R=600, r=400, thetas=thetas, origin=(15, 12), orientation=.5
+            )
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=200, d=100, thetas=thetas, origin=(10, 20))
+            expected_shape = self.class_name(
+                R=600, r=400, d=200, thetas=thetas, origin=(15, 12), orientation=.5
+            )
+        transformed_shape = shape.rotate(.5).translate(5, -8).scale(2)
+        assert transformed_shape.R == expected_shape.R
+        assert transformed_shape.origin == expected_shape.origin
+        assert transformed_shape.orientation == expected_shape.orientation
+        assert np.allclose(transformed_shape.x, expected_shape.x)
+        assert np.allclose(transformed_shape.y, expected_shape.y)
+
+    def test_transforms_reuse_untransformed_path(self, instance) -> None:
+        """Test that transformed shapes share the parent's untransformed path"""
+        transformed_shape = instance.rotate(1).translate(10, 10).add_noise(1, 1)
+        assert transformed_shape._base_path is instance._base_path
+        scaled_shape = transformed_shape.scale(3)
+        assert np.array_equal(scaled_shape._base_path[0], 3*instance._base_path[0])
+
+    def test_scale_matches_scaled_parameters(self, thetas) -> None:
+        """Test that lazy and eager scaled shapes match each other and a
+        shape instantiated with the scaled parameters, including its analytic
+        bounds"""
+        kwargs = {"thetas": thetas, "origin": (5, 7), "orientation": .3}
+        if issubclass(self.class_name, _Cycloid):
+            parameters, scaled_parameters = {"R": 300, "r": 200}, {"R": 600, "r": 400}
+        elif issubclass(self.class_name, _Trochoid):
+            parameters = {"R": 300, "r": 200, "d": 100}
+            scaled_parameters = {"R": 600, "r": 400, "d": 200}
+        eager_shape = self.class_name(**parameters, **kwargs).scale(2)
+        lazy_shape = self.class_name(**parameters, lazy=True, **kwargs).scale(2)
+        reference = self.class_name(**scaled_parameters, **kwargs)
+        assert np.allclose(lazy_shape.x, eager_shape.x) and np.allclose(lazy_shape.y, eager_shape.y)
+        for shape in (eager_shape, lazy_shape):
+            assert np.allclose(shape.x, reference.x) and np.allclose(shape.y, reference.y)
+            assert np.allclose(shape.bounds(full_curve=True), reference.bounds(full_curve=True))
+
     def test_rotate_orientation(self, instance) -> None:
         rotated_shape = instance.rotate(.1)
         assert instance.orientation == 0
@@ -384,3 +525,660 @@ class _TestGeneral:
             )
         assert not open_shape.is_closed()
         assert closed_shape.is_closed()
+
+    def test_period(self) -> None:
+        """Test that the period is derived from the rational ratio of R and r"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=312, r=150, thetas=[0])
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=312, r=150, d=75, thetas=[0])
+        assert shape.period() == pytest.approx(50*np.pi)
+        assert shape.closure_theta == pytest.approx(50*np.pi)
+
+    def test_theta_stop_closed(self) -> None:
+        """Test that a closed theta range spans exactly one period"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=312, r=150, theta_stop="closed", theta_step=.1)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=312, r=150, d=75, theta_stop="closed", theta_step=.1)
+        assert shape.thetas[0] == 0
+        assert shape.thetas[-1] == pytest.approx(shape.period())
+        assert np.diff(shape.thetas).max() <= .1
+        assert shape.is_closed(tolerance=1e-6)
+
+    def test_create_range_theta_stop_closed(self) -> None:
+        """Test that a closed range closes every shape in the batch"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range(R=[300, 250], r=100, theta_stop="closed")
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range(R=[300, 250], r=100, d=50, theta_stop="closed")
+        assert shapes.thetas[-1] == pytest.approx(4*np.pi)
+        assert all(shape.is_closed(tolerance=1e-6) for shape in shapes)
+
+    def test_period_irrational_ratio_exception(self) -> None:
+        """Test that a shape that never closes raises a ValueError"""
+        with pytest.raises(ValueError):
+            if issubclass(self.class_name, _Cycloid):
+                self.class_name(R=100*np.pi, r=100, theta_stop="closed")
+            elif issubclass(self.class_name, _Trochoid):
+                self.class_name(R=100*np.pi, r=100, d=50, theta_stop="closed")
+
+    def test_theta_tolerance_bounds_chord_error(self) -> None:
+        """Test that adaptive sampling keeps every chord within the tolerance
+        using fewer points than a fine uniform grid"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=140, theta_stop="closed", theta_tolerance=.25)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=140, d=120, theta_stop="closed", theta_tolerance=.25)
+        mid_thetas = (shape.thetas[:-1] + shape.thetas[1:])/2
+        mid_x, mid_y = shape._calculate_xy(shape.R, shape.r, shape.d, mid_thetas)
+        chord_error = np.hypot(
+            mid_x - (shape.x[:-1] + shape.x[1:])/2,
+            mid_y - (shape.y[:-1] + shape.y[1:])/2
+        )
+        assert chord_error.max() <= .25
+        assert len(shape.thetas) < len(np.arange(0, shape.period(), .01))
+        assert shape.is_closed(tolerance=1e-6)
+
+    def test_theta_tolerance_with_thetas_exception(self, thetas) -> None:
+        """Test that adaptive sampling can't be combined with explicit thetas"""
+        with pytest.raises(ValueError):
+            if issubclass(self.class_name, _Cycloid):
+                self.class_name(R=300, r=140, thetas=thetas, theta_tolerance=.25)
+            elif issubclass(self.class_name, _Trochoid):
+                self.class_name(R=300, r=140, d=120, thetas=thetas, theta_tolerance=.25)
+
+    def test_theta_tolerance_with_noise_exception(self) -> None:
+        """Test that adaptive sampling can't be combined with explicit noise
+        since the number of thetas isn't known ahead of time"""
+        noise = [np.zeros(10), np.zeros(10)]
+        with pytest.raises(ValueError, match="noise"):
+            if issubclass(self.class_name, _Cycloid):
+                self.class_name(R=300, r=140, theta_stop="closed", noise=noise, theta_tolerance=.25)
+            elif issubclass(self.class_name, _Trochoid):
+                self.class_name(R=300, r=140, d=120, theta_stop="closed", noise=noise, theta_tolerance=.25)
+
+    @pytest.mark.parametrize("method, tolerance", [("rdp", .5), ("visvalingam", .5)])
+    def test_simplify_reduces_vertices(self, method, tolerance) -> None:
+        """Test that simplifying keeps a subset of vertices on the original path"""
+        thetas = np.arange(0, 4*np.pi, .001)
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=200, thetas=thetas, origin=(10, 5))
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=200, d=100, thetas=thetas, origin=(10, 5))
+        simplified_shape = shape.simplify(tolerance, method=method)
+        kept = np.isin(shape.thetas, simplified_shape.thetas)
+        assert simplified_shape.__class__ is shape.__class__
+        assert 0 < simplified_shape.reduction_ratio < 1
+        assert simplified_shape.reduction_ratio == 1 - kept.sum()/len(thetas)
+        assert simplified_shape.thetas[0] == shape.thetas[0]
+        assert simplified_shape.thetas[-1] == shape.thetas[-1]
+        assert np.allclose(simplified_shape.x, shape.x[kept])
+        assert np.allclose(simplified_shape.y, shape.y[kept])
+
+    def test_simplify_invalid_method_exception(self, instance) -> None:
+        with pytest.raises(ValueError):
+            instance.simplify(1, method="unknown")
+
+    def test_float32_dtype(self) -> None:
+        """Test that float32 shapes store float32 arrays within the documented
+        accuracy of the float64 path"""
+        thetas = np.arange(0, 20*np.pi, .01)
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=140, thetas=thetas, origin=(5, 5), dtype=np.float32)
+            reference = self.class_name(R=300, r=140, thetas=thetas, origin=(5, 5))
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=140, d=120, thetas=thetas, origin=(5, 5), dtype=np.float32)
+            reference = self.class_name(R=300, r=140, d=120, thetas=thetas, origin=(5, 5))
+        transformed_shape = shape.rotate(1).scale(2).add_noise(1, 1)
+        for float32_shape in [shape, transformed_shape]:
+            assert float32_shape.thetas.dtype == np.float32
+            assert float32_shape.x.dtype == np.float32
+            assert float32_shape.y.dtype == np.float32
+            assert float32_shape.noise[0].dtype == np.float32
+        tolerance = 1e-7*shape.R*thetas.max()*10
+        assert np.abs(shape.x - reference.x).max() < tolerance
+        assert np.abs(shape.y - reference.y).max() < tolerance
+
+    def test_create_range_float32_dtype(self, thetas) -> None:
+        """Test that float32 batches calculate in float32"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6], 3, thetas, dtype=np.float32)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6], 3, 2, thetas, dtype=np.float32)
+        assert shapes.x.dtype == np.float32
+        assert shapes[0].thetas.dtype == np.float32
+        assert shapes[0].noise[0].dtype == np.float32
+
+    def test_create_range_executor(self, thetas, monkeypatch) -> None:
+        """Test that sweeps spread over an executor match serial sweeps in
+        the same order"""
+        monkeypatch.setattr(spyrograph.core._batch, "_PARALLEL_MIN_POINTS", 0)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            if issubclass(self.class_name, _Cycloid):
+                parallel = self.class_name.create_range(range(5, 15), 3, thetas, executor=executor)
+                serial = self.class_name.create_range(range(5, 15), 3, thetas)
+            elif issubclass(self.class_name, _Trochoid):
+                parallel = self.class_name.create_range(range(5, 15), 3, 2, thetas, executor=executor)
+                serial = self.class_name.create_range(range(5, 15), 3, 2, thetas)
+        assert np.array_equal(parallel.x, serial.x)
+        assert np.array_equal(parallel.y, serial.y)
+
+    def test_create_grid_matches_individual_shapes(self, thetas) -> None:
+        """Test that every combination of the grid inputs matches a shape
+        instantiated on its own in nested loop order"""
+        origins = [(0, 0), (5, -5)]
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_grid([10, 11], [3, 4], thetas, origin=origins, orientation=[0, 1])
+            products = [(R, r, r, origin, orientation) for R in [10, 11] for r in [3, 4] for origin in origins for orientation in [0, 1]]
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_grid([10, 11], [3, 4], [2, 5], thetas, origin=origins, orientation=[0, 1])
+            products = [(R, r, d, origin, orientation) for R in [10, 11] for r in [3, 4] for d in [2, 5] for origin in origins for orientation in [0, 1]]
+        assert len(shapes) == len(products)
+        for shape, (R, r, d, origin, orientation) in zip(shapes, products):
+            assert (shape.R, shape.r, shape.d, shape.origin, shape.orientation) == (R, r, d, origin, orientation)
+            if issubclass(self.class_name, _Cycloid):
+                expected = self.class_name(R, r, thetas, origin=origin, orientation=orientation)
+            else:
+                expected = self.class_name(R, r, d, thetas, origin=origin, orientation=orientation)
+            assert np.allclose(shape.x, expected.x)
+            assert np.allclose(shape.y, expected.y)
+
+    def test_iter_grid_blocks(self, thetas) -> None:
+        """Test that streamed grid blocks are bounded and match the full grid"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_grid(range(10, 15), [3, 4], thetas)
+            blocks = list(self.class_name.iter_grid(range(10, 15), [3, 4], thetas, block_size=3))
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_grid(range(10, 15), [3, 4], 2, thetas)
+            blocks = list(self.class_name.iter_grid(range(10, 15), [3, 4], 2, thetas, block_size=3))
+        assert [len(block) for block in blocks] == [3, 3, 3, 1]
+        assert np.array_equal(np.concatenate([block.x for block in blocks]), shapes.x)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_save_png_headless(self, thetas, tmp_path, lazy) -> None:
+        """Test that headless PNGs are rasterized from the path without a
+        turtle screen"""
+        Image = pytest.importorskip("PIL.Image")
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=30, r=14, thetas=thetas, lazy=lazy)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=30, r=14, d=12, thetas=thetas, lazy=lazy)
+        fpath = tmp_path / "shape.png"
+        shape.save_png(fpath, color="red", screen_color="#000000", padding=20, headless=True, dpi=144)
+        min_x, max_x, min_y, max_y = shape.bounds()
+        image = np.asarray(Image.open(fpath))
+        assert image.shape[:2] == (
+            int(np.ceil(2*(max_y - min_y + 20))),
+            int(np.ceil(2*(max_x - min_x + 20)))
+        )
+        assert image[..., 0].max() == 255
+        assert image[..., 1:].max() == 0
+        assert (image[0] == 0).all()
+
+    @staticmethod
+    def _read_svg_paths(fpath) -> list:
+        """Return the absolute (n, 2) points of every path in an SVG file"""
+        root = xml.etree.ElementTree.parse(fpath).getroot()
+        group = root.find("{http://www.w3.org/2000/svg}g")
+        factor = float(group.get("transform")[len("scale("):-1].split()[0])
+        paths = []
+        for path in group.iter("{http://www.w3.org/2000/svg}path"):
+            move, _, lines = path.get("d")[1:].partition("l")
+            values = [float(value) for value in re.findall(r"-?\d+", move + " " + lines)]
+            points = np.cumsum(np.reshape(values, (-1, 2)), axis=0)*factor
+            paths.append(points)
+        return paths
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_save_svg(self, thetas, tmp_path, lazy) -> None:
+        """Test that SVG paths match the shape's path to the precision"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=140, thetas=thetas, origin=(3, 4), lazy=lazy)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=140, d=120, thetas=thetas, origin=(3, 4), lazy=lazy)
+        shape.save_svg(tmp_path / "shape.svg", precision=1)
+        points, = self._read_svg_paths(tmp_path / "shape.svg")
+        assert np.allclose(points[0], (shape.x[0], shape.y[0]), atol=.05)
+        assert np.allclose(points[-1], (shape.x[-1], shape.y[-1]), atol=.05)
+        assert len(points) == len(thetas)
+
+    def test_create_range_save_svg(self, thetas, tmp_path) -> None:
+        """Test that batches write one path per shape and simplify them"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([300, 400], 140, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([300, 400], 140, 120, thetas)
+        shapes.save_svg(tmp_path / "shapes.svg", precision=3)
+        shapes.save_svg(tmp_path / "simplified.svg", simplify=5)
+        paths = self._read_svg_paths(tmp_path / "shapes.svg")
+        simplified = self._read_svg_paths(tmp_path / "simplified.svg")
+        assert len(paths) == len(simplified) == 2
+        for shape, points, simplified_points in zip(shapes, paths, simplified):
+            assert np.allclose(points, np.column_stack((shape.x, shape.y)), atol=.0005)
+            assert len(simplified_points) < len(points)
+
+    def test_create_range_save_frames(self, thetas, tmp_path) -> None:
+        """Test that headless frames follow the reverse and boomerang order"""
+        Image = pytest.importorskip("PIL.Image")
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([30, 40], 14, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([30, 40], 14, 12, thetas)
+        forward = shapes.save_frames(tmp_path / "forward", padding=10)
+        boomerang = shapes.save_frames(tmp_path / "boomerang", padding=10, reverse=True, boomerang=True)
+        assert [fpath.name for fpath in forward] == ["frame0.png", "frame1.png"]
+        frames = [np.asarray(Image.open(fpath)) for fpath in forward]
+        boomerang_frames = [np.asarray(Image.open(fpath)) for fpath in boomerang]
+        assert not np.array_equal(frames[0], frames[1])
+        for frame, expected in zip(boomerang_frames, [1, 0, 0, 1]):
+            assert np.array_equal(frame, frames[expected])
+
+    def test_create_range_save_gif(self, thetas, tmp_path) -> None:
+        """Test that animated GIFs have a frame per shape and share a palette"""
+        Image = pytest.importorskip("PIL.Image")
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([30, 40, 50], 14, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([30, 40, 50], 14, 12, thetas)
+        shapes.save_gif(tmp_path / "shapes.gif", frame_pause=.05, repeat=True, padding=10)
+        frames = shapes.save_frames(tmp_path / "frames", padding=10)
+        gif = Image.open(tmp_path / "shapes.gif")
+        assert gif.n_frames == 3
+        assert gif.info["loop"] == 0
+        for index, fpath in enumerate(frames):
+            gif.seek(index)
+            assert np.array_equal(np.asarray(gif.convert("RGB")), np.asarray(Image.open(fpath)))
+
+    def test_rolling_circle_centers(self, thetas) -> None:
+        """Test that rolling circle centers follow the shape's transforms and
+        are d away from the untransformed trace point"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=140, thetas=thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=140, d=120, thetas=thetas)
+        center_x, center_y = shape._get_rolling_circle_centers(shape.thetas)
+        assert np.allclose(np.hypot(shape.x - center_x, shape.y - center_y), shape.d)
+        moved = shape.translate(x=5, y=-5).rotate(1)
+        moved_x, moved_y = moved._get_rolling_circle_centers(moved.thetas)
+        expected_x = np.cos(1)*np.asarray(center_x) - np.sin(1)*np.asarray(center_y) + 5
+        expected_y = np.sin(1)*np.asarray(center_x) + np.cos(1)*np.asarray(center_y) - 5
+        assert np.allclose(moved_x, expected_x)
+        assert np.allclose(moved_y, expected_y)
+
+    def test_create_range_plot_line_collection(self, thetas) -> None:
+        """Test that a batch is plotted as a single LineCollection and its
+        animation swaps one shape's path into the line per frame"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas)
+        fig, ax = shapes.plot(linewidths=.5)
+        assert len(ax.collections) == 1 and not ax.lines
+        segments = ax.collections[0].get_segments()
+        assert np.array_equal(segments[2], np.column_stack((shapes[2].x, shapes[2].y)))
+        listed_fig, listed_ax = spyrograph.plot_many(list(shapes))
+        assert np.array_equal(listed_ax.collections[0].get_segments()[1], segments[1])
+        animation = shapes.plot_animation()
+        line, = animation._func(1)
+        assert np.array_equal(line.get_xdata(), shapes[1].x)
+        for figure in (fig, listed_fig, animation._fig):
+            plt.close(figure)
+
+    def test_create_range_long_format_df(self, thetas) -> None:
+        """Test that a batch's long-format DataFrame matches its shapes'
+        DataFrames stacked with their parameters and is cached"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas)
+        df = shapes.df
+        assert df is shapes.df
+        assert list(df.columns) == ["shape_id", "R", "r", "d", "x", "y", "theta"]
+        assert isinstance(df["shape_id"].dtype, pd.CategoricalDtype)
+        assert len(df) == len(shapes)*len(thetas)
+        shape_df = df[df["shape_id"] == 1]
+        assert np.array_equal(shape_df[["x", "y", "theta"]].to_numpy(), shapes[1].df.to_numpy())
+        assert (shape_df["R"] == shapes[1].R).all() and (shape_df["d"] == shapes[1].d).all()
+        assert shapes[1:].df["R"].iloc[0] == shapes[1].R
+
+    def test_create_range_to_parquet(self, thetas, tmp_path) -> None:
+        """Test that the long-format table round trips through Parquet"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6], 3, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6], 3, 2, thetas)
+        shapes.to_parquet(tmp_path / "shapes.parquet")
+        table = pq.read_table(tmp_path / "shapes.parquet")
+        assert table.column_names == ["shape_id", "R", "r", "d", "x", "y", "theta"]
+        assert np.array_equal(table.column("x").to_numpy(), shapes.x.ravel())
+
+    def test_create_range_to_parquet_without_pyarrow(self, thetas, tmp_path, monkeypatch) -> None:
+        """Test that Arrow and Parquet exports raise an ImportError when
+        pyarrow isn't installed"""
+        monkeypatch.setattr(spyrograph.core._batch, "pa", None)
+        monkeypatch.setattr(spyrograph.core._batch, "pq", None)
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6], 3, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6], 3, 2, thetas)
+        with pytest.raises(ImportError):
+            shapes.to_arrow()
+        with pytest.raises(ImportError):
+            shapes.to_parquet(tmp_path / "shapes.parquet")
+
+    @pytest.mark.parametrize("compressed", [False, True])
+    def test_save_npz_load(self, instance, tmp_path, compressed) -> None:
+        """Test that a transformed shape loads from its archive with the same
+        path and transforms the same way afterwards"""
+        shape = instance.rotate(1).scale(2).add_noise(1, 1)
+        shape.save_npz(tmp_path / "shape.npz", compressed=compressed)
+        loaded_shape = spyrograph.load(tmp_path / "shape.npz")
+        assert type(loaded_shape) is self.class_name
+        assert "x" not in loaded_shape.__dict__
+        assert isinstance(loaded_shape.x, np.memmap) is not compressed
+        assert np.array_equal(loaded_shape.x, shape.x)
+        assert np.array_equal(loaded_shape.noise[1], shape.noise[1])
+        assert (loaded_shape.R, loaded_shape.r, loaded_shape.d) == (shape.R, shape.r, shape.d)
+        assert np.allclose(loaded_shape.translate(3, 4).y, shape.translate(3, 4).y)
+
+    def test_save_npz_load_coords_first(self, instance, tmp_path) -> None:
+        """Test that coords can be the first path attribute read from a
+        shape loaded with its saved path"""
+        instance.save_npz(tmp_path / "shape.npz")
+        loaded_shape = spyrograph.load(tmp_path / "shape.npz")
+        assert np.array_equal(loaded_shape.coords, instance.coords)
+
+    def test_save_npz_lazy_without_path(self, thetas, tmp_path) -> None:
+        """Test that a lazy shape's archive only stores its parameters and
+        the path is calculated after loading"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=200, thetas=thetas, lazy=True)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=200, d=100, thetas=thetas, lazy=True)
+        shape.save_npz(tmp_path / "shape.npz")
+        assert "x" not in np.load(tmp_path / "shape.npz").files
+        loaded_shape = spyrograph.load(tmp_path / "shape.npz")
+        assert loaded_shape.lazy and "x" not in loaded_shape.__dict__
+        assert np.array_equal(loaded_shape.x, shape.x)
+
+    @pytest.mark.parametrize("include_path", [False, True])
+    def test_create_range_save_npz_load(self, thetas, tmp_path, include_path) -> None:
+        """Test that a batch loads from its archive viewing memory-mapped
+        paths or calculating them again when they weren't saved"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas, origin=(1, 2))
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas, origin=(1, 2))
+        shapes.save_npz(tmp_path / "shapes.npz", include_path=include_path)
+        loaded_shapes = spyrograph.load(tmp_path / "shapes.npz")
+        assert isinstance(loaded_shapes, ShapeBatch)
+        assert loaded_shapes.shape_class is self.class_name
+        assert isinstance(loaded_shapes.x, np.memmap) is include_path
+        assert np.array_equal(loaded_shapes.y, shapes.y)
+        assert loaded_shapes[1:][1].R == shapes[2].R
+        assert np.array_equal(loaded_shapes[1].rotate(1).x, shapes[1].rotate(1).x)
+
+    def test_create_range_save_npz_defers_compressed_paths(self, thetas, tmp_path) -> None:
+        """Test that a batch loaded from a compressed archive only reads its
+        paths when they're first accessed"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas)
+        shapes.save_npz(tmp_path / "shapes.npz", compressed=True)
+        loaded_shapes = spyrograph.load(tmp_path / "shapes.npz")
+        assert "x" not in loaded_shapes.__dict__ and "y" not in loaded_shapes.__dict__
+        assert "x" not in loaded_shapes._archive._arrays
+        assert len(loaded_shapes) == len(shapes)
+        assert np.array_equal(loaded_shapes[2].x, shapes[2].x)
+        assert np.array_equal(loaded_shapes.y, shapes.y)
+
+    def test_load_rejects_other_archives(self, tmp_path) -> None:
+        """Test that archives not saved by save_npz raise a ValueError"""
+        np.savez(tmp_path / "other.npz", x=np.arange(3))
+        with pytest.raises(ValueError):
+            spyrograph.load(tmp_path / "other.npz")
+
+    def test_init_turtles_reuses_turtles(self, instance) -> None:
+        """Test that turtles passed back in are cleared and restyled instead
+        of being replaced"""
+        class FakeTurtle:
+            def __init__(self):
+                self.calls = []
+            def __getattr__(self, name):
+                return lambda *args: self.calls.append((name, *args))
+        turtles = instance._create_turtles_namedtuple(
+            FakeTurtle(), FakeTurtle(), FakeTurtle(), FakeTurtle()
+        )
+        reused = instance._init_turtles("red", "blue", "green", False, 3, turtles)
+        assert reused is turtles
+        assert turtles.shape_turtle.calls == [
+            ("clear",), ("up",), ("showturtle",), ("color", "red"), ("width", 3)
+        ]
+        assert ("color", "green") in turtles.pre_draw_turtle.calls
+        assert ("hideturtle",) in turtles.rolling_circle_turtle.calls
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_iter_chunks_matches_path(self, thetas, lazy) -> None:
+        """Test that streamed chunks match the full path without storing it
+        on lazy shapes"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=140, thetas=thetas, origin=(5, 5), lazy=lazy)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=140, d=120, thetas=thetas, origin=(5, 5), lazy=lazy)
+        shape = shape.rotate(1).add_noise(1, 1)
+        chunks = list(shape.iter_chunks(chunk_size=7))
+        assert all(len(chunk_x) == 7 for chunk_x, _, _ in chunks[:-1])
+        chunk_x = np.concatenate([x for x, _, _ in chunks])
+        chunk_y = np.concatenate([y for _, y, _ in chunks])
+        chunk_thetas = np.concatenate([theta for _, _, theta in chunks])
+        assert ("x" in vars(shape)) is not lazy
+        assert np.allclose(chunk_x, shape.x)
+        assert np.allclose(chunk_y, shape.y)
+        assert np.array_equal(chunk_thetas, shape.thetas)
+
+    def test_iter_points(self, instance) -> None:
+        """Test that streamed points match the path one point at a time"""
+        points = list(instance.iter_points(chunk_size=5))
+        assert len(points) == len(instance.thetas)
+        assert points[0] == (instance.x[0], instance.y[0], instance.thetas[0])
+        assert points[-1] == (instance.x[-1], instance.y[-1], instance.thetas[-1])
+
+    def test_lazy_dataframe_does_not_store_path(self, thetas) -> None:
+        """Test that the DataFrame of a lazy shape is built from the stream"""
+        if issubclass(self.class_name, _Cycloid):
+            lazy_shape = self.class_name(R=300, r=200, thetas=thetas, lazy=True)
+            eager_shape = self.class_name(R=300, r=200, thetas=thetas)
+        elif issubclass(self.class_name, _Trochoid):
+            lazy_shape = self.class_name(R=300, r=200, d=100, thetas=thetas, lazy=True)
+            eager_shape = self.class_name(R=300, r=200, d=100, thetas=thetas)
+        assert np.allclose(lazy_shape.df["x"], eager_shape.x)
+        assert "x" not in vars(lazy_shape)
+
+    def test_bounds(self, thetas) -> None:
+        """Test that sampled bounds are tight and full curve bounds contain the
+        closed curve"""
+        if issubclass(self.class_name, _Cycloid):
+            shape = self.class_name(R=300, r=140, theta_stop="closed", theta_step=.001, lazy=True)
+        elif issubclass(self.class_name, _Trochoid):
+            shape = self.class_name(R=300, r=140, d=120, theta_stop="closed", theta_step=.001, lazy=True)
+        shape = shape.rotate(1).translate(30, -40).scale(2)
+        min_x, max_x, min_y, max_y = shape.bounds()
+        assert "x" not in vars(shape)
+        full_min_x, full_max_x, full_min_y, full_max_y = shape.bounds(full_curve=True)
+        assert "x" not in vars(shape)
+        assert (min_x, max_x, min_y, max_y) == (shape.min_x, shape.max_x, shape.min_y, shape.max_y)
+        assert full_min_x <= min_x and max_x <= full_max_x
+        assert full_min_y <= min_y and max_y <= full_max_y
+        radius = np.hypot(shape.x - shape.origin[0], shape.y - shape.origin[1]).max()
+        assert radius == pytest.approx((full_max_x - full_min_x)/2, rel=1e-4)
+
+    def test_create_range_bounds(self, thetas) -> None:
+        """Test that batch bounds contain every shape in the batch"""
+        if issubclass(self.class_name, _Cycloid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, thetas, origin=(10, -20))
+        elif issubclass(self.class_name, _Trochoid):
+            shapes = self.class_name.create_range([5, 6, 7], 3, 2, thetas, origin=(10, -20))
+        min_x, max_x, min_y, max_y = shapes.bounds()
+        full_min_x, full_max_x, full_min_y, full_max_y = shapes.bounds(full_curve=True)
+        assert min_x == min(shape.min_x for shape in shapes)
+        assert max_y == max(shape.max_y for shape in shapes)
+        for shape in shapes:
+            shape_bounds = shape.bounds(full_curve=True)
+            assert full_min_x <= shape_bounds[0] and shape_bounds[1] <= full_max_x
+            assert full_min_y <= shape_bounds[2] and shape_bounds[3] <= full_max_y
+        assert max(shape.bounds(full_curve=True)[1] for shape in shapes) == full_max_x
+
+    def _create(self, r: float = 100, **kwargs) -> _Trochoid:
+        """Return a shape with R=300 and the given rolling radius over thetas
+        from 0 to 10, 100 points or 1600 bytes of path"""
+        kwargs = {"theta_start": 0, "theta_stop": 10, "theta_step": .1, **kwargs}
+        if issubclass(self.class_name, _Cycloid):
+            return self.class_name(R=300, r=r, **kwargs)
+        return self.class_name(R=300, r=r, d=50, **kwargs)
+
+    def _create_range(self, R=300, r=100, **kwargs) -> ShapeBatch:
+        """Return a batch with the given radii over thetas from 0 to 10"""
+        kwargs = {"theta_start": 0, "theta_stop": 10, "theta_step": .1, **kwargs}
+        if issubclass(self.class_name, _Cycloid):
+            return self.class_name.create_range(R=R, r=r, **kwargs)
+        return self.class_name.create_range(R=R, r=r, d=50, **kwargs)
+
+    @pytest.fixture()
+    def path_cache(self):
+        """Enable a path cache fitting four paths of _create"""
+        spyrograph.enable_path_cache(max_bytes=4*1600)
+        yield
+        spyrograph.disable_path_cache()
+
+    def test_path_cache_hits_and_misses(self, path_cache) -> None:
+        """Test that shapes with the same parameters and thetas share one
+        cached path"""
+        first = self._create()
+        second = self._create(origin=(10, 10))
+        self._create(theta_stop=11)
+        info = spyrograph.path_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+        assert first._base_path is second._base_path
+        assert np.allclose(second.x, first.x + 10)
+
+    def test_path_cache_is_read_only(self, path_cache) -> None:
+        """Test that cached paths can't be written to through a shape"""
+        shape = self._create()
+        with pytest.raises(ValueError):
+            shape._base_path[0][0] = 0
+        shape.x[0] = 0
+        assert self._create().x[0] != 0
+
+    def test_path_cache_evicts_least_recently_used(self, path_cache) -> None:
+        """Test that paths beyond max_bytes evict the least recently used"""
+        spyrograph.enable_path_cache(max_bytes=1600)
+        self._create()
+        self._create(r=150)
+        self._create()
+        info = spyrograph.path_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 3, 1)
+
+    def test_path_cache_bounded_by_bytes(self, path_cache) -> None:
+        """Test that the cache counts bytes and skips paths over max_bytes"""
+        self._create()
+        assert spyrograph.path_cache_info().nbytes == 1600
+        self._create(theta_stop=100)
+        info = spyrograph.path_cache_info()
+        assert (info.currsize, info.nbytes) == (1, 1600)
+
+    def test_path_cache_leaves_batch_writable(self, path_cache) -> None:
+        """Test that caching a batch's paths doesn't freeze its arrays"""
+        shapes = self._create_range(r=[100, 150])
+        shapes.x[0] = 0
+        shape = self._create()
+        assert spyrograph.path_cache_info().hits == 1
+        assert shape.x[1] != 0
+
+    def test_path_cache_shared_with_create_range(self, path_cache) -> None:
+        """Test that shapes reuse the paths cached by create_range"""
+        shapes = self._create_range(r=[100, 150])
+        shape = self._create(r=150)
+        assert spyrograph.path_cache_info().hits == 1
+        assert np.allclose(shape.x, shapes[1].x)
+
+    def test_path_cache_reused_by_repeated_create_range(self, path_cache) -> None:
+        """Test that repeated and overlapping sweeps only calculate the
+        paths that aren't cached and keep their own writable arrays"""
+        shapes = self._create_range(r=[100, 150])
+        repeated = self._create_range(r=[100, 150])
+        overlapping = self._create_range(r=[150, 200])
+        info = spyrograph.path_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (3, 3, 3)
+        assert np.array_equal(repeated.x, shapes.x)
+        assert np.array_equal(overlapping.y[0], shapes.y[1])
+        repeated.x[0] = 0
+        assert not np.array_equal(repeated.x, shapes.x)
+
+    def test_path_cache_clear_and_disable(self, path_cache) -> None:
+        """Test that clearing resets the statistics and disabling stops
+        caching"""
+        self._create()
+        spyrograph.clear_path_cache()
+        assert spyrograph.path_cache_info() == (0, 0, 4*1600, 0, 0)
+        spyrograph.disable_path_cache()
+        self._create()
+        assert spyrograph.path_cache_info().currsize == 0
+        with pytest.raises(ValueError):
+            spyrograph.enable_path_cache(max_bytes=0)
+
+    def test_create_range_workers(self, monkeypatch) -> None:
+        """Test that paths calculated in worker processes match the serial
+        paths"""
+        monkeypatch.setattr(spyrograph.core._batch, "_PARALLEL_MIN_POINTS", 0)
+        parallel = self._create_range(R=range(300, 310), workers=2)
+        serial = self._create_range(R=range(300, 310))
+        assert np.array_equal(parallel.x, serial.x)
+        assert np.array_equal(parallel.y, serial.y)
+
+    def test_create_range_executor(self, monkeypatch) -> None:
+        """Test that paths calculated in an existing executor match the
+        serial paths"""
+        monkeypatch.setattr(spyrograph.core._batch, "_PARALLEL_MIN_POINTS", 0)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = self._create_range(R=range(300, 310), executor=executor)
+        serial = self._create_range(R=range(300, 310))
+        assert np.array_equal(parallel.x, serial.x)
+        assert np.array_equal(parallel.y, serial.y)
+
+    @pytest.mark.parametrize("workers", [0, -2, 1.5, True])
+    def test_create_range_invalid_workers(self, workers) -> None:
+        """Test that workers other than None, -1 or a positive integer raise
+        a ValueError"""
+        with pytest.raises(ValueError):
+            self._create_range(R=range(300, 310), workers=workers)
+
+    @pytest.mark.parametrize("class_path", [
+        "os:system",
+        "spyrography:Hypotrochoid",
+        "spyrograph.core._archive:load",
+        "spyrograph.core._batch:np.ndarray"
+    ])
+    def test_load_rejects_classes_outside_spyrograph(self, tmp_path, class_path) -> None:
+        """Test that archives naming anything but a spyrograph shape or
+        ShapeBatch raise a ValueError"""
+        np.savez(tmp_path / "archive.npz", **{"class": np.array(class_path)})
+        with pytest.raises(ValueError):
+            spyrograph.load(tmp_path / "archive.npz")
+
+    def test_load_rejects_batch_of_non_shapes(self, tmp_path) -> None:
+        """Test that a batch archive whose shape class isn't a shape raises a
+        ValueError"""
+        self._create_range(R=range(300, 303)).save_npz(tmp_path / "shapes.npz")
+        members = dict(np.load(tmp_path / "shapes.npz"))
+        members["shape_class"] = np.array("spyrograph.core._batch:ShapeBatch")
+        np.savez(tmp_path / "shapes.npz", **members)
+        with pytest.raises(ValueError):
+            spyrograph.load(tmp_path / "shapes.npz")
+
+    def test_save_svg_invalid_precision(self, instance, tmp_path) -> None:
+        """Test that a negative precision raises a ValueError"""
+        with pytest.raises(ValueError):
+            instance.save_svg(tmp_path / "shape.svg", precision=-1)
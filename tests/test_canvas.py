@@ -0,0 +1,124 @@
+import types
+
+import pytest
+
+import numpy as np
+
+from spyrograph.core._misc import _draw_animation
+from spyrograph.core._canvas import (
+    _draw_lines, _RollingCircleOverlay, _get_points_per_frame, _get_frame_target
+)
+
+class _FakeCanvas:
+    def __init__(self):
+        self.lines = []
+
+    def create_line(self, *coords, **options):
+        self.lines.append((coords, options))
+        return len(self.lines)
+
+    def create_oval(self, *coords, **options):
+        return self.create_line(*coords, **options)
+
+    def coords(self, item, *coords):
+        if not coords:
+            return list(self.lines[item - 1][0])
+        self.lines[item - 1] = (coords, self.lines[item - 1][1])
+        return None
+
+    def type(self, item):
+        return "line"
+
+    def itemcget(self, item, option):
+        return self.lines[item - 1][1].get(option, "")
+
+class _FakePen:
+    def __init__(self):
+        self.screen = types.SimpleNamespace(cv=_FakeCanvas(), xscale=1., yscale=2.)
+        self.items = [0]
+        self._pencolor = "red"
+        self._pensize = 3
+        self.moves = []
+
+    def up(self):
+        self.moves.append("up")
+
+    def goto(self, x, y):
+        self.moves.append((x, y))
+
+    def clear(self):
+        self.items = []
+
+def test_draw_lines_bulk_canvas_items():
+    pen = _FakePen()
+    chunks = [(np.array([0., 1.]), np.array([0., 1.])), (np.array([2.]), np.array([-1.]))]
+    items = _draw_lines(pen, chunks)
+    assert items == [1, 2]
+    assert pen.items == [0, 1, 2]
+    (first, options), (second, _) = pen.screen.cv.lines
+    assert first == (0., -0., 1., -2.)
+    assert second == (1., -2., 2., 2.)
+    assert options["fill"] == "red" and options["width"] == 3
+    assert pen.moves == ["up", (2., -1.)]
+
+def test_rolling_circle_overlay_moves_persistent_items():
+    pen = _FakePen()
+    overlay = _RollingCircleOverlay(pen, radius=5)
+    assert pen.items == [0, 1, 2, 3, 4]
+    overlay.move(1, 2, 3, 4)
+    overlay.move(10, 20, 30, 40)
+    circle, arm, center_dot, trace_dot = (coords for coords, _ in pen.screen.cv.lines)
+    assert len(pen.screen.cv.lines) == 4
+    assert circle == (5., -50., 15., -30.)
+    assert arm == (10., -40., 30., -80.)
+    assert center_dot == (5., -45., 15., -35.)
+    assert trace_dot == (25., -85., 35., -75.)
+
+@pytest.mark.parametrize("n_points,fps,duration,expected", [
+    (1000, 60, None, 1),
+    (1000, 50, 2, 10),
+    (1001, 50, 2, 11),
+    (10, 60, 1, 1),
+    (10, 60, 0, 10)
+])
+def test_get_points_per_frame(n_points, fps, duration, expected):
+    assert _get_points_per_frame(n_points, fps, duration) == expected
+
+def test_get_points_per_frame_invalid():
+    with pytest.raises(ValueError):
+        _get_points_per_frame(100, 0)
+
+def test_get_frame_target_catches_up():
+    assert _get_frame_target(100, 10, frame=0, elapsed=0, fps=10) == 10
+    assert _get_frame_target(100, 10, frame=1, elapsed=.5, fps=10) == 50
+    assert _get_frame_target(100, 10, frame=3, elapsed=5, fps=10) == 100
+
+class _FakeTracedShape:
+    def __init__(self, value, turtles, traced):
+        self.value = value
+        self.turtles = turtles
+        self.traced = traced
+
+    def trace(self, screen=None, turtles=None, **kwargs):
+        self.traced.append(self.value)
+        if turtles is not None:
+            assert turtles is self.turtles
+            turtles.shape_turtle.clear()
+        pen = self.turtles.shape_turtle
+        pen.items.append(pen.screen.cv.create_line(
+            self.value, 0., self.value, 1., fill="black", width="1.0", capstyle="round"
+        ))
+        return pen.screen, self.turtles
+
+def test_draw_animation_replays_recorded_frames():
+    pen = _FakePen()
+    pen.items = []
+    pen.screen.update = lambda: None
+    turtles = types.SimpleNamespace(shape_turtle=pen)
+    traced = []
+    shapes = [_FakeTracedShape(value, turtles, traced) for value in (0., 1., 2.)]
+    _draw_animation(shapes, frame_pause=0, reverse=True, boomerang=True)
+    assert traced == [2., 1., 0.]
+    replayed = [coords[0] for coords, _ in pen.screen.cv.lines[3:]]
+    assert replayed == [0., 1., 2.]
+    assert pen.screen.cv.lines[-1][1] == {"fill": "black", "width": "1.0", "capstyle": "round"}
@@ -1,11 +1,21 @@
 import pytest
 
+import numpy as np
+
 from spyrograph.core._misc import (
     _set_int_to_list,
     _get_products_of_inputs,
     _validate_only_one_iterable,
-    _validate_theta
+    _validate_theta,
+    _get_period,
+    _get_adaptive_thetas,
+    _get_animate_screen_size
 )
+import spyrograph
+from spyrograph import Hypotrochoid
+from spyrograph.hypotrochoid.special.ellipse import Ellipse
+from spyrograph.hypotrochoid.special.deltoid import Deltoid
+from spyrograph.epitrochoid.special.cardioid import Cardioid
 
 def test_set_int_to_list():
     num_test = _set_int_to_list(1)
@@ -15,6 +25,18 @@ def test_set_int_to_list():
     assert num_test[0] == 1
     assert list_test[0] == 2
 
+def test_get_adaptive_thetas_tiny_tolerance():
+    calculate_xy = lambda thetas: (300*np.cos(thetas), 300*np.sin(thetas))
+    thetas, (x, y) = _get_adaptive_thetas(
+        np.linspace(0, 400, 4001), calculate_xy, 1e-13, max_points=50000
+    )
+    assert len(thetas) <= 50000
+    assert np.all(np.diff(thetas) > 0)
+    assert np.array_equal(x, 300*np.cos(thetas))
+    line = lambda thetas: (3*thetas + 1, 2*thetas - 5)
+    line_thetas, _ = _get_adaptive_thetas(np.linspace(0, 400, 4001), line, 1e-300)
+    assert len(line_thetas) == 4001
+
 def test_get_products_of_inputs():
     return_vals = _get_products_of_inputs(3, [1,2,3], 5)
     assert return_vals[0] == (3, 1, 5)
@@ -30,4 +52,42 @@ def test_validate_theta_multiple_thetas_exception_raise():
 
 def test_validate_theta_empty_list_exception_raise():
     with pytest.raises(ValueError, match="An empty list of thetas was passed in as argument."):
-        _validate_theta(thetas=[], theta_start = None, theta_stop = None, theta_step = None)
\ No newline at end of file
+        _validate_theta(thetas=[], theta_start = None, theta_stop = None, theta_step = None)
+
+def test_get_period_of_multiple_shapes():
+    assert _get_period(3, 2) == pytest.approx(4*np.pi)
+    assert _get_period([3, 5], [2, 3]) == pytest.approx(12*np.pi)
+
+def test_validate_theta_unrecognized_theta_stop_exception_raise():
+    with pytest.raises(ValueError, match="Unrecognized theta_stop"):
+        _validate_theta(thetas=None, theta_start=0, theta_stop="open", theta_step=.1, period=1)
+
+@pytest.mark.parametrize("shape_class, args", [(Ellipse, (10, 3)), (Deltoid, (9,)), (Cardioid, (4,))])
+def test_special_shapes_forward_keyword_arguments(shape_class, args):
+    shape = shape_class(
+        *args, theta_start=0, theta_stop="closed", theta_step=.1,
+        origin=(5, 5), lazy=True, dtype=np.float32
+    )
+    assert shape.lazy and "x" not in shape.__dict__
+    assert shape.x.dtype == np.float32
+    assert shape.origin == (5, 5)
+    adaptive_shape = shape_class(*args, theta_start=0, theta_stop=6, theta_step=1, theta_tolerance=.01)
+    assert len(adaptive_shape.thetas) > 6
+
+def test_ellipse_keeps_eccentricity_from_batch_and_archive(tmp_path):
+    ellipse = Ellipse(300, 50, theta_start=0, theta_stop="closed", theta_step=.1)
+    shapes = Ellipse.create_range(R=300, r=150, d=[50, 100], theta_start=0, theta_stop="closed", theta_step=.1)
+    assert shapes.shape_class is Ellipse
+    assert shapes[0].eccentricity == ellipse.eccentricity
+    ellipse.save_npz(tmp_path / "ellipse.npz")
+    loaded_ellipse = spyrograph.load(tmp_path / "ellipse.npz")
+    assert type(loaded_ellipse) is Ellipse
+    assert loaded_ellipse.eccentricity == ellipse.eccentricity
+    shapes.save_npz(tmp_path / "ellipses.npz")
+    loaded_shapes = spyrograph.load(tmp_path / "ellipses.npz")
+    assert loaded_shapes[1].eccentricity == shapes[1].eccentricity
+
+def test_get_animate_screen_size_fits_full_curves():
+    shapes = Hypotrochoid.create_range(R=[300, 400], r=100, d=50, thetas=[0, 1])
+    assert _get_animate_screen_size(shapes, padding=10) == (2*350 + 10, 2*350 + 10)
+    assert _get_animate_screen_size(list(shapes), padding=10) == (2*350 + 10, 2*350 + 10)
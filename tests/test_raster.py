@@ -0,0 +1,37 @@
+import pytest
+
+import numpy as np
+
+from spyrograph.core._raster import _get_rgb, _render, _write_png
+
+@pytest.mark.parametrize("color,rgb", [
+    ("black", (0, 0, 0)),
+    ("#ff8000", (255, 128, 0)),
+    ("#f80", (255, 136, 0)),
+    ((1., .5, 0.), (255, 128, 0)),
+    ((0, .5, 1), (0, 128, 255)),
+    (np.array([0., .5, 1.], dtype=np.float32), (0, 128, 255)),
+    ((0, 1, 1), (0, 1, 1)),
+    ((255, 128, 0), (255, 128, 0))
+])
+def test_get_rgb(color, rgb):
+    assert _get_rgb(color) == rgb
+
+def test_get_rgb_unrecognized():
+    with pytest.raises(ValueError):
+        _get_rgb("not a color")
+
+def test_write_png_roundtrip(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    image = np.random.default_rng(0).integers(0, 256, (7, 5, 3), dtype=np.uint8)
+    _write_png(tmp_path / "image.png", image, dpi=300)
+    loaded = Image.open(tmp_path / "image.png")
+    assert np.array_equal(np.asarray(loaded), image)
+    assert round(loaded.info["dpi"][0]) == 300
+
+def test_render_antialiased_line():
+    image = _render([[(np.array([-10., 10.]), np.array([0., 0.]))]], (30, 11), (0, 0), 1, "black", "white", 1)
+    assert image.shape == (11, 30, 3)
+    assert image[5, 10:20].max() < 128
+    assert image[0].min() == 255
+    assert len(np.unique(image)) > 2
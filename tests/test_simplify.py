@@ -0,0 +1,44 @@
+import pytest
+
+import numpy as np
+
+from spyrograph.core._simplify import _simplify_path
+
+@pytest.mark.parametrize("method", ["rdp", "visvalingam"])
+def test_simplify_path_collinear_points(method):
+    x = np.linspace(0, 10, 101)
+    y = 2*x
+    indices = _simplify_path(x, y, tolerance=1e-6, method=method)
+    assert list(indices) == [0, 100]
+
+def test_simplify_path_rdp_keeps_corner():
+    x = np.array([0, 1, 2, 3, 3, 3])
+    y = np.array([0, 0, 0, 0, 1, 2])
+    indices = _simplify_path(x, y, tolerance=.1, method="rdp")
+    assert list(indices) == [0, 3, 5]
+
+def _simplify_rdp_recursive(x, y, tolerance, start, stop, keep):
+    if stop - start < 2:
+        return
+    segment = np.array([x[stop] - x[start], y[stop] - y[start]])
+    points = np.column_stack((x[start+1:stop] - x[start], y[start+1:stop] - y[start]))
+    length_squared = segment @ segment
+    projection = np.zeros(len(points)) if length_squared == 0 else np.clip(points @ segment/length_squared, 0, 1)
+    distances = np.hypot(*(points - projection[:, np.newaxis]*segment).T)
+    furthest = np.argmax(distances)
+    if distances[furthest] > tolerance:
+        split = start + 1 + furthest
+        keep.append(split)
+        _simplify_rdp_recursive(x, y, tolerance, start, split, keep)
+        _simplify_rdp_recursive(x, y, tolerance, split, stop, keep)
+
+def test_simplify_path_rdp_matches_recursive_rdp():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=3000).cumsum()
+    y = rng.normal(size=3000).cumsum()
+    x[10:20], y[10:20] = x[10], y[10]
+    x[-5:], y[-5:] = x[0], y[0]
+    for tolerance in (0, .5, 5):
+        keep = [0, len(x) - 1]
+        _simplify_rdp_recursive(x, y, tolerance, 0, len(x) - 1, keep)
+        assert list(_simplify_path(x, y, tolerance, method="rdp")) == sorted(keep)
@@ -0,0 +1,7 @@
+import numpy as np
+
+from spyrograph.core._svg import _iter_path_data
+
+def test_iter_path_data_relative_and_streamed():
+    chunks = [(np.array([0., 1.004]), np.array([0., -2.])), (np.array([1.004, 3.]), np.array([-2., -2.]))]
+    assert "".join(_iter_path_data(chunks, precision=2)) == "M0 0l100-200 200 0"